@@ -10,18 +10,46 @@ Removed features:
 """
 
 import os
+import sys
 import json
+import asyncio
 import hashlib
 import re
 import time
-import requests
+import importlib
 from typing import Optional
+from collections import OrderedDict
 from datetime import datetime
-from fastapi import FastAPI, HTTPException, Request
+from html import escape
+from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
 from fastapi.responses import StreamingResponse, Response
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-import anthropic
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lib.prompt_assets import PromptTemplate
+
+
+# === LAZY IMPORTS ===
+# Cold start dominates serverless latency. Heavy client libraries load on
+# first use, so routes like /robots.txt, /api/health or /api/waitlist/count
+# never pay for anthropic (~1.8s) or requests (~0.15s).
+# Profile with: python scripts/bench_cold_start.py
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+requests = LazyModule("requests")
 
 # Load from environment variables
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
@@ -47,11 +75,20 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 # Article/Fact-check index for fast listing
 ARTICLE_INDEX_PATH = "articles/_index.json"
 
-# Configure Anthropic client
-claude_client = anthropic.Anthropic(
-    api_key=ANTHROPIC_API_KEY,
-    timeout=300.0
-) if ANTHROPIC_API_KEY else None
+# Anthropic client, built on first use (see LAZY IMPORTS)
+_claude_client = None
+
+
+def get_claude_client():
+    """Return the shared Anthropic client, or None if no API key is configured."""
+    global _claude_client
+    if _claude_client is None and ANTHROPIC_API_KEY:
+        import anthropic
+        _claude_client = anthropic.Anthropic(
+            api_key=ANTHROPIC_API_KEY,
+            timeout=300.0
+        )
+    return _claude_client
 
 
 # === TAVILY WEB SEARCH FOR REAL SOURCES ===
@@ -402,6 +439,232 @@ def blob_list(prefix: str = "articles/") -> list:
         return []
 
 
+# === DURABLE TTL CACHE ===
+# Three tiers: process memory -> /tmp (survives warm restarts) -> Vercel Blob
+# (survives cold starts). Entries carry their own timestamp so each caller
+# decides how stale is acceptable.
+
+TTL_CACHE_MEMORY_MAX = 2048
+_ttl_memory_cache: OrderedDict = OrderedDict()
+
+
+def _ttl_cache_paths(namespace: str, key: str) -> tuple:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    local_path = os.path.join(CACHE_DIR, namespace, f"{digest}.json")
+    blob_path = f"cache/{namespace}/{digest}.json"
+    return f"{namespace}:{digest}", local_path, blob_path
+
+
+def _ttl_memory_store(mem_key: str, entry: dict):
+    _ttl_memory_cache[mem_key] = entry
+    _ttl_memory_cache.move_to_end(mem_key)
+    while len(_ttl_memory_cache) > TTL_CACHE_MEMORY_MAX:
+        _ttl_memory_cache.popitem(last=False)
+
+
+def ttl_cache_get(namespace: str, key: str, ttl: float) -> Optional[dict]:
+    """Return a cached value younger than `ttl` seconds, or None."""
+    mem_key, local_path, blob_path = _ttl_cache_paths(namespace, key)
+    now = time.time()
+
+    entry = _ttl_memory_cache.get(mem_key)
+    if entry and now - entry["stored_at"] < ttl:
+        _ttl_memory_cache.move_to_end(mem_key)
+        return entry["value"]
+
+    if os.path.exists(local_path):
+        try:
+            with open(local_path, 'r') as f:
+                entry = json.load(f)
+            if now - entry.get("stored_at", 0) < ttl:
+                _ttl_memory_store(mem_key, entry)
+                return entry["value"]
+        except Exception as e:
+            print(f"TTL cache read error ({namespace}): {e}")
+
+    entry = blob_get(blob_path)
+    if entry and now - entry.get("stored_at", 0) < ttl:
+        _ttl_memory_store(mem_key, entry)
+        _ttl_cache_write_local(local_path, entry)
+        return entry["value"]
+
+    return None
+
+
+def _ttl_cache_write_local(local_path: str, entry: dict):
+    try:
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = f"{local_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, local_path)
+    except Exception as e:
+        print(f"TTL cache write error: {e}")
+
+
+def ttl_cache_put(namespace: str, key: str, value, durable: bool = True):
+    """Store a value in every cache tier (blob only when `durable`)."""
+    mem_key, local_path, blob_path = _ttl_cache_paths(namespace, key)
+    entry = {"stored_at": time.time(), "key": key, "value": value}
+
+    _ttl_memory_store(mem_key, entry)
+    _ttl_cache_write_local(local_path, entry)
+    if durable:
+        blob_put(blob_path, json.dumps(entry))
+
+
+# === APPEND-ONLY RECORD STORE ===
+# Small JSON records addressed by path. record_create only succeeds if the
+# path is free, which gives atomic uniqueness (and atomic slot claims)
+# without read-modify-write of a shared index. Falls back to a local
+# directory when no Blob token is configured (local dev and tests).
+
+LOCAL_STORE_DIR = os.getenv("GENUVERITY_LOCAL_STORE", "/tmp/genuverity_store")
+
+
+class RecordStoreError(Exception):
+    """The record store could not complete a write."""
+
+
+def _local_record_path(path: str) -> str:
+    return os.path.join(LOCAL_STORE_DIR, *path.split("/"))
+
+
+def _blob_write(path: str, content: str, allow_overwrite: bool):
+    headers = {
+        "Authorization": f"Bearer {BLOB_READ_WRITE_TOKEN}",
+        "Content-Type": "application/json",
+        "x-api-version": "7",
+        "x-add-random-suffix": "0",
+        "x-allow-overwrite": "1" if allow_overwrite else "0"
+    }
+    return requests.put(f"{BLOB_API_BASE}/{path}", headers=headers, data=content.encode('utf-8'), timeout=10)
+
+
+def record_create(path: str, record: dict) -> bool:
+    """Create a record only if `path` is unused. Returns False if it already exists."""
+    content = json.dumps(record)
+
+    if not BLOB_READ_WRITE_TOKEN:
+        local_path = _local_record_path(path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = f"{local_path}.{os.getpid()}.{time.time_ns()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        try:
+            os.link(tmp_path, local_path)  # Atomic, fails if the target exists
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            os.unlink(tmp_path)
+
+    try:
+        response = _blob_write(path, content, allow_overwrite=False)
+    except Exception as e:
+        raise RecordStoreError(f"Blob create error for {path}: {e}")
+
+    if response.status_code in (200, 201):
+        return True
+    if response.status_code in (400, 409) and "exist" in response.text.lower():
+        return False
+    raise RecordStoreError(f"Blob create failed for {path} ({response.status_code}): {response.text[:200]}")
+
+
+def record_put(path: str, record: dict) -> bool:
+    """Create or overwrite a record (for small derived documents like counters)."""
+    content = json.dumps(record)
+
+    if not BLOB_READ_WRITE_TOKEN:
+        local_path = _local_record_path(path)
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        tmp_path = f"{local_path}.{os.getpid()}.{time.time_ns()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, local_path)
+        return True
+
+    try:
+        response = _blob_write(path, content, allow_overwrite=True)
+        return response.status_code in (200, 201)
+    except Exception as e:
+        print(f"Blob put error for {path}: {e}")
+        return False
+
+
+def record_get(path: str) -> Optional[dict]:
+    """Read one record by exact path."""
+    if not BLOB_READ_WRITE_TOKEN:
+        try:
+            with open(_local_record_path(path), 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    return blob_get(path)
+
+
+def record_exists(path: str) -> bool:
+    """Check whether a record exists without downloading it."""
+    if not BLOB_READ_WRITE_TOKEN:
+        return os.path.exists(_local_record_path(path))
+
+    try:
+        resp = requests.get(
+            f"{BLOB_API_BASE}?prefix={path}&limit=1",
+            headers={"Authorization": f"Bearer {BLOB_READ_WRITE_TOKEN}"},
+            timeout=10
+        )
+        if resp.status_code != 200:
+            return False
+        return any(b.get("pathname") == path for b in resp.json().get("blobs", []))
+    except Exception as e:
+        print(f"Blob exists check error: {e}")
+        return False
+
+
+def record_delete(path: str):
+    """Delete a record if present."""
+    if not BLOB_READ_WRITE_TOKEN:
+        try:
+            os.unlink(_local_record_path(path))
+        except FileNotFoundError:
+            pass
+        return
+
+    blob_delete(path)
+
+
+def record_list(prefix: str) -> list:
+    """List record paths under a prefix, in path order."""
+    if not BLOB_READ_WRITE_TOKEN:
+        base = _local_record_path(prefix.rstrip("/"))
+        paths = []
+        for root, _, files in os.walk(base):
+            for name in files:
+                if name.endswith(".json"):
+                    rel = os.path.relpath(os.path.join(root, name), LOCAL_STORE_DIR)
+                    paths.append(rel.replace(os.sep, "/"))
+        return sorted(paths)
+
+    return sorted(b.get("pathname", "") for b in blob_list(prefix) if b.get("pathname"))
+
+
+def record_iter(prefix: str):
+    """Yield (path, record) pairs under a prefix in path order, one read at a time."""
+    if not BLOB_READ_WRITE_TOKEN:
+        for path in record_list(prefix):
+            record = record_get(path)
+            if record is not None:
+                yield path, record
+        return
+
+    for blob in sorted(blob_list(prefix), key=lambda b: b.get("pathname", "")):
+        record = blob_get_by_url(blob.get("url", "")) if blob.get("url") else None
+        if record is not None:
+            yield blob.get("pathname"), record
+
+
 # === REDDIT API INTEGRATION ===
 # Reddit's public JSON API (no auth required for read-only)
 # Rate limited: 100 requests per minute
@@ -553,66 +816,182 @@ def get_reddit_post_timeline(query: str, subreddit: str = None, limit: int = 50)
 
 # === ARCHIVE.ORG WAYBACK MACHINE INTEGRATION ===
 
-def search_wayback_machine(query: str, limit: int = 10) -> list:
+# Fact-check and news sites searched for historical snapshots of a claim
+WAYBACK_SEARCH_DOMAINS = [
+    "snopes.com", "politifact.com", "factcheck.org", "reuters.com/fact-check",
+    "apnews.com", "bbc.com", "twitter.com", "facebook.com"
+]
+
+WAYBACK_CDX_URL = "https://web.archive.org/cdx/search/cdx"
+WAYBACK_HOST_CONCURRENCY = 4      # Max in-flight CDX requests per upstream host
+WAYBACK_QUERY_TIMEOUT = 10        # Seconds per CDX request
+WAYBACK_BACKOFF_BASE = 0.5        # First delay after a 429
+WAYBACK_BACKOFF_MAX = 8.0         # Ceiling for the adaptive delay
+WAYBACK_MAX_RETRIES = 3
+# Whole-search deadline: one query's timeout. A fan-out never waits longer than
+# its slowest allowed single request; queries still queued or backing off on a
+# 429 at that point are cancelled and the search returns what has arrived.
+WAYBACK_SEARCH_DEADLINE = WAYBACK_QUERY_TIMEOUT
+
+
+class HostThrottle:
+    """Per-host concurrency cap with adaptive backoff on HTTP 429.
+
+    Every request to the host goes through the same semaphore. A 429 doubles
+    the shared delay (or honours Retry-After); each success halves it again,
+    so the throttle only slows down while archive.org is pushing back.
+    """
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.delay = 0.0
+
+    def record_throttled(self, retry_after: Optional[str] = None):
+        try:
+            hinted = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            hinted = 0.0
+        self.delay = min(max(self.delay * 2, WAYBACK_BACKOFF_BASE, hinted), WAYBACK_BACKOFF_MAX)
+
+    def record_success(self):
+        self.delay = self.delay / 2 if self.delay > 0.05 else 0.0
+
+
+_host_throttles: dict = {}
+
+
+def get_host_throttle(host: str) -> HostThrottle:
+    """Get (or create) the shared throttle for an upstream host."""
+    throttle = _host_throttles.get(host)
+    if throttle is None:
+        throttle = HostThrottle(WAYBACK_HOST_CONCURRENCY)
+        _host_throttles[host] = throttle
+    return throttle
+
+
+def parse_cdx_rows(data: list, domain: str) -> list:
+    """Convert CDX JSON rows (first row is headers) into snapshot dicts."""
+    snapshots = []
+    for row in data[1:]:
+        if len(row) >= 4 and row[3] == "200":  # Only successful responses
+            timestamp = row[0]
+            original_url = row[1]
+            snapshots.append({
+                "timestamp": timestamp,
+                "date": f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]}",
+                "original_url": original_url,
+                "archive_url": f"https://web.archive.org/web/{timestamp}/{original_url}",
+                "domain": domain
+            })
+    return snapshots
+
+
+async def fetch_cdx_snapshots(session, domain: str, search_term: str, limit: int, get_cutoff=None) -> list:
+    """Query the CDX API for one domain, respecting the host throttle.
+
+    `get_cutoff` returns the newest timestamp that can still make the final
+    result. It is read once the request clears the throttle and passed as
+    `to=`, so queued queries skip snapshots that would be discarded anyway.
+    """
+    import aiohttp
+
+    params = {
+        "url": f"{domain}/*{search_term}*",
+        "output": "json",
+        "limit": str(limit),
+        "fl": "timestamp,original,mimetype,statuscode"
+    }
+    throttle = get_host_throttle("web.archive.org")
+
+    for attempt in range(WAYBACK_MAX_RETRIES + 1):
+        async with throttle.semaphore:
+            if throttle.delay:
+                await asyncio.sleep(throttle.delay)
+            cutoff = get_cutoff() if get_cutoff else None
+            if cutoff:
+                params["to"] = cutoff
+            async with session.get(
+                WAYBACK_CDX_URL,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=WAYBACK_QUERY_TIMEOUT)
+            ) as response:
+                if response.status == 429:
+                    throttle.record_throttled(response.headers.get("Retry-After"))
+                    continue
+                throttle.record_success()
+                if response.status != 200:
+                    print(f"Wayback CDX returned {response.status} for {domain}")
+                    return []
+                data = await response.json(content_type=None)
+                return parse_cdx_rows(data or [], domain)
+
+    print(f"Wayback CDX still rate limited for {domain} after {WAYBACK_MAX_RETRIES} retries")
+    return []
+
+
+async def search_wayback_machine(query: str, limit: int = 10, domains: Optional[list] = None) -> list:
     """Search Archive.org Wayback Machine for historical snapshots of pages mentioning a claim.
 
-    Uses the CDX API to find historical snapshots.
+    Uses the CDX API to find historical snapshots. All domains are queried
+    concurrently (bounded by the per-host throttle) and merged as each one
+    answers, keeping only the `limit` oldest snapshots. CDX orders rows by
+    URL rather than by time, so the result is final once every query has
+    returned. Total latency is capped at WAYBACK_SEARCH_DEADLINE (the
+    per-query timeout); anything still pending then is cancelled and the
+    snapshots gathered so far are returned.
     """
-    results = []
+    import heapq
+    import itertools
+    import aiohttp
 
-    # Search for snapshots of pages that might contain the claim
-    # We search common fact-check and news sites
-    search_domains = [
-        "snopes.com", "politifact.com", "factcheck.org", "reuters.com/fact-check",
-        "apnews.com", "bbc.com", "twitter.com", "facebook.com"
-    ]
+    search_domains = domains or WAYBACK_SEARCH_DOMAINS
 
-    try:
-        # Use the Wayback CDX API to search for snapshots
-        # This searches for URL patterns - we'll look for general news about the topic
-        keywords = query.lower().split()[:5]  # Take first 5 keywords
-        search_term = "+".join(keywords)
-
-        # Try searching the full-text search API (limited availability)
-        # Fall back to CDX API for specific domains
-        for domain in search_domains[:3]:  # Limit to avoid rate limits
-            try:
-                cdx_url = f"https://web.archive.org/cdx/search/cdx?url={domain}/*{search_term}*&output=json&limit={limit}&fl=timestamp,original,mimetype,statuscode"
+    # Use the CDX API to search for URL patterns - we look for general news about the topic
+    keywords = query.lower().split()[:5]  # Take first 5 keywords
+    search_term = "+".join(keywords)
 
-                response = requests.get(cdx_url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if len(data) > 1:  # First row is headers
-                        for row in data[1:]:
-                            if len(row) >= 4 and row[3] == "200":  # Only successful responses
-                                timestamp = row[0]
-                                original_url = row[1]
-
-                                # Convert timestamp to date
-                                try:
-                                    date_str = f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]}"
-                                except:
-                                    date_str = timestamp
-
-                                results.append({
-                                    "timestamp": timestamp,
-                                    "date": date_str,
-                                    "original_url": original_url,
-                                    "archive_url": f"https://web.archive.org/web/{timestamp}/{original_url}",
-                                    "domain": domain
-                                })
-            except Exception as e:
-                print(f"Wayback search error for {domain}: {e}")
-                continue
+    # Max-heap (by negated timestamp) holding the `limit` oldest snapshots seen so far
+    oldest: list = []
+    seen_urls = set()
+    tiebreak = itertools.count()
+
+    def current_cutoff() -> Optional[str]:
+        if len(oldest) < limit:
+            return None
+        return oldest[0][2]["timestamp"]
+
+    async def run_query(session, domain):
+        try:
+            return await fetch_cdx_snapshots(session, domain, search_term, limit, get_cutoff=current_cutoff)
+        except Exception as e:
+            print(f"Wayback search error for {domain}: {e}")
+            return []
 
-            # Small delay between requests to avoid rate limiting
-            time.sleep(0.5)
+    try:
+        async with aiohttp.ClientSession() as session:
+            tasks = [asyncio.ensure_future(run_query(session, d)) for d in search_domains]
+            try:
+                for finished in asyncio.as_completed(tasks, timeout=WAYBACK_SEARCH_DEADLINE):
+                    for snap in await finished:
+                        if snap["archive_url"] in seen_urls:
+                            continue
+                        seen_urls.add(snap["archive_url"])
+                        entry = (-int(snap["timestamp"]), next(tiebreak), snap)
+                        if len(oldest) < limit:
+                            heapq.heappush(oldest, entry)
+                        elif snap["timestamp"] < oldest[0][2]["timestamp"]:
+                            heapq.heapreplace(oldest, entry)
+            except asyncio.TimeoutError:
+                print("Wayback search deadline reached, returning partial results")
+            finally:
+                for task in tasks:
+                    task.cancel()
 
         # Sort by timestamp (oldest first) to find origin
-        results.sort(key=lambda x: x.get("timestamp", ""))
+        results = sorted((snap for _, _, snap in oldest), key=lambda x: x.get("timestamp", ""))
 
         print(f"Wayback found {len(results)} historical snapshots for query: {query[:50]}...")
-        return results[:limit]
+        return results
 
     except Exception as e:
         print(f"Wayback Machine search error: {e}")
@@ -620,46 +999,58 @@ def search_wayback_machine(query: str, limit: int = 10) -> list:
 
 
 def get_earliest_wayback_snapshot(url: str) -> Optional[dict]:
-    """Get the earliest snapshot of a specific URL from Wayback Machine."""
+    """Get the earliest snapshot of a specific URL from Wayback Machine.
+
+    Returns None only when the CDX API answered and the URL has never been
+    archived; a non-200 response or a request failure returns {"error": ...}.
+    """
     try:
         cdx_url = f"https://web.archive.org/cdx/search/cdx?url={url}&output=json&limit=1&fl=timestamp,original,statuscode"
 
         response = requests.get(cdx_url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            if len(data) > 1:
-                row = data[1]
-                timestamp = row[0]
-                return {
-                    "timestamp": timestamp,
-                    "date": f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]}",
-                    "original_url": row[1],
-                    "archive_url": f"https://web.archive.org/web/{timestamp}/{row[1]}"
-                }
+        if response.status_code != 200:
+            return {"error": f"HTTP {response.status_code}"}
+        data = response.json()
+        if data and len(data) > 1:
+            row = data[1]
+            timestamp = row[0]
+            return {
+                "timestamp": timestamp,
+                "date": f"{timestamp[:4]}-{timestamp[4:6]}-{timestamp[6:8]}",
+                "original_url": row[1],
+                "archive_url": f"https://web.archive.org/web/{timestamp}/{row[1]}"
+            }
         return None
     except Exception as e:
         print(f"Wayback earliest snapshot error: {e}")
-        return None
+        return {"error": str(e)}
 
 
 def wayback_availability(url: str) -> Optional[dict]:
-    """Check if a URL is archived in Wayback Machine and get first/last snapshots."""
+    """Check if a URL is archived in Wayback Machine and get first/last snapshots.
+
+    {"available": False} without an "error" key means archive.org answered
+    that the URL isn't archived; any failure (including a non-200 such as a
+    429) sets "error".
+    """
     try:
         api_url = f"https://archive.org/wayback/available?url={url}"
         response = requests.get(api_url, timeout=10)
 
-        if response.status_code == 200:
-            data = response.json()
-            snapshots = data.get("archived_snapshots", {})
-            closest = snapshots.get("closest", {})
-
-            if closest.get("available"):
-                return {
-                    "available": True,
-                    "url": closest.get("url"),
-                    "timestamp": closest.get("timestamp"),
-                    "status": closest.get("status")
-                }
+        if response.status_code != 200:
+            return {"available": False, "error": f"HTTP {response.status_code}"}
+
+        data = response.json()
+        snapshots = data.get("archived_snapshots", {})
+        closest = snapshots.get("closest", {})
+
+        if closest.get("available"):
+            return {
+                "available": True,
+                "url": closest.get("url"),
+                "timestamp": closest.get("timestamp"),
+                "status": closest.get("status")
+            }
 
         return {"available": False}
 
@@ -668,6 +1059,86 @@ def wayback_availability(url: str) -> Optional[dict]:
         return {"available": False, "error": str(e)}
 
 
+# Archive data for a URL almost never changes, so both lookups are cached together.
+# "Not archived" can change any time the URL gets crawled, so it expires sooner.
+ARCHIVE_METADATA_TTL = 30 * 24 * 3600  # 30 days
+ARCHIVE_NEGATIVE_TTL = 6 * 3600        # 6 hours
+ARCHIVE_BATCH_CONCURRENCY = 8
+ARCHIVE_BATCH_MAX_URLS = 100
+
+
+def _archive_entry_fresh(metadata: dict) -> bool:
+    """Whether a cached entry is still within the TTL for its kind of result."""
+    if (metadata.get("availability") or {}).get("available") or metadata.get("earliest_snapshot"):
+        return True
+    try:
+        checked = datetime.fromisoformat(metadata["checked_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return (datetime.utcnow() - checked).total_seconds() < ARCHIVE_NEGATIVE_TTL
+
+
+async def get_archive_metadata(url: str) -> dict:
+    """Availability + earliest snapshot for a URL, cached with a long TTL.
+
+    On a miss both Wayback lookups run concurrently instead of back to back.
+    Only definitive answers are cached: a URL with snapshots for
+    ARCHIVE_METADATA_TTL, a URL archive.org says was never archived for
+    ARCHIVE_NEGATIVE_TTL. Results where either lookup failed (timeouts,
+    429/5xx) are returned with an "error" but not cached.
+    """
+    cached = await asyncio.to_thread(ttl_cache_get, "archive", url, ARCHIVE_METADATA_TTL)
+    if cached and _archive_entry_fresh(cached):
+        return {**cached, "cached": True}
+
+    availability, earliest = await asyncio.gather(
+        asyncio.to_thread(wayback_availability, url),
+        asyncio.to_thread(get_earliest_wayback_snapshot, url)
+    )
+    errors = [result["error"] for result in (availability, earliest) if result and result.get("error")]
+
+    metadata = {
+        "url": url,
+        "availability": availability,
+        "earliest_snapshot": None if earliest and earliest.get("error") else earliest,
+        "checked_at": datetime.utcnow().isoformat()
+    }
+
+    if errors:
+        metadata["error"] = "; ".join(errors)
+    else:
+        await asyncio.to_thread(ttl_cache_put, "archive", url, metadata)
+
+    return {**metadata, "cached": False}
+
+
+async def get_archive_metadata_batch(urls: list, max_concurrency: int = ARCHIVE_BATCH_CONCURRENCY) -> list:
+    """Check many URLs at once, at most `max_concurrency` in flight."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def check(url):
+        async with semaphore:
+            try:
+                return await get_archive_metadata(url)
+            except Exception as e:
+                print(f"Archive metadata error for {url[:60]}: {e}")
+                return {"url": url, "availability": {"available": False, "error": str(e)}, "earliest_snapshot": None, "cached": False}
+
+    return await asyncio.gather(*[check(url) for url in urls])
+
+
+def get_article_source_urls(article: dict) -> list:
+    """Collect the source URLs cited by a cached fact-check."""
+    urls = []
+    for entry in (article.get("citationDatabase") or {}).values():
+        if isinstance(entry, dict) and entry.get("url"):
+            urls.append(entry["url"])
+    for source in article.get("sources") or []:
+        if isinstance(source, dict) and source.get("url"):
+            urls.append(source["url"])
+    return urls
+
+
 # === CLAIM DATABASE WITH SEMANTIC FINGERPRINTS ===
 
 CLAIMS_INDEX_PATH = "claims/_index.json"
@@ -928,7 +1399,7 @@ def cache_article(topic: str, article_data: dict):
         "cached_at": article_data["_cached_at"]
     }
 
-    update_article_index(topic_key, metadata, blob_url=blob_url)
+    index_entry = update_article_index(topic_key, metadata, blob_url=blob_url)
 
     local_path = os.path.join(CACHE_DIR, f"{topic_key}.json")
     try:
@@ -937,6 +1408,11 @@ def cache_article(topic: str, article_data: dict):
     except Exception as e:
         print(f"Local cache write error: {e}")
 
+    try:
+        index_cached_article(topic_key, article_data, index_entry)
+    except Exception as e:
+        print(f"Search index error for {topic_key}: {e}")
+
 
 def get_article_index() -> dict:
     """Get the article index from blob storage."""
@@ -960,6 +1436,7 @@ def update_article_index(article_key: str, metadata: dict, blob_url: str = ""):
     }
 
     blob_put(ARTICLE_INDEX_PATH, json.dumps(index))
+    return index[article_key]
 
 
 def get_all_cached_articles() -> list:
@@ -983,8 +1460,30 @@ def get_all_cached_articles() -> list:
 
 
 def find_similar_articles(query: str, limit: int = 5) -> list:
-    """Find similar articles using simple keyword matching."""
+    """Find similar fact-checks: full-text search (title, verdict summary and body) if indexed,
+    else keyword overlap with titles and keys."""
     index = get_article_index()
+
+    try:
+        start_search_sync()
+        found = get_search_index().search(query, limit=limit, kind="factcheck", all_terms=False)["results"]
+    except Exception as e:
+        print(f"Search index error: {e}")
+        found = []
+    if found:
+        similar = []
+        for result in found:
+            key = result["doc_id"].split(":", 1)[1]
+            similar.append({
+                "key": key,
+                "title": result["title"],
+                "article_type": index.get(key, {}).get("article_type"),
+                "verdict": result["verdict"],
+                "snippet": result["snippet"],
+                "score": result["score"]
+            })
+        return similar
+
     query_tokens = set(query.lower().split())
 
     scored = []
@@ -1280,6 +1779,8 @@ HTML structure for content field:
 Return ONLY JSON. No markdown, no code fences.
 """
 
+FACT_CHECK_PROMPT = PromptTemplate(FACT_CHECK_TEMPLATE)
+
 
 # === FASTAPI APP ===
 
@@ -1305,8 +1806,9 @@ class CacheCheckRequest(BaseModel):
 @app.post("/api/fact-check")
 async def generate_fact_check(request: FactCheckRequest, req: Request):
     """Fact-check a claim with verdict-focused output."""
-    if not ANTHROPIC_API_KEY or not claude_client:
+    if not ANTHROPIC_API_KEY:
         raise HTTPException(status_code=500, detail="Server missing ANTHROPIC_API_KEY")
+    claude_client = await asyncio.to_thread(get_claude_client)
 
     print(f"Fact-checking claim: {request.claim}")
 
@@ -1354,7 +1856,7 @@ async def generate_fact_check(request: FactCheckRequest, req: Request):
 
             full_context = sources_section + prior_checks_context
 
-            prompt = FACT_CHECK_TEMPLATE.format(
+            prompt = FACT_CHECK_PROMPT.format(
                 topic=request.claim,
                 context_section=full_context,
                 topic_slug=topic_slug
@@ -1722,7 +2224,7 @@ class WaybackSearchRequest(BaseModel):
 @app.post("/api/archive/search")
 async def api_wayback_search(request: WaybackSearchRequest):
     """Search Archive.org Wayback Machine for historical snapshots related to a claim."""
-    results = search_wayback_machine(request.query, limit=request.limit)
+    results = await search_wayback_machine(request.query, limit=request.limit)
     return {
         "query": request.query,
         "snapshots": results,
@@ -1734,12 +2236,41 @@ async def api_wayback_search(request: WaybackSearchRequest):
 @app.get("/api/archive/check")
 async def api_wayback_check(url: str):
     """Check if a URL is archived in Wayback Machine."""
-    availability = wayback_availability(url)
-    earliest = get_earliest_wayback_snapshot(url)
+    return await get_archive_metadata(url)
+
+
+class ArchiveBatchRequest(BaseModel):
+    urls: list[str] = []
+    slug: Optional[str] = None  # Check every source cited by this fact-check
+    max_concurrency: int = ARCHIVE_BATCH_CONCURRENCY
+
+
+@app.post("/api/archive/check-batch")
+async def api_wayback_check_batch(request: ArchiveBatchRequest):
+    """Check archive status for many URLs, e.g. a report's full source list."""
+    urls = list(request.urls)
+
+    if request.slug:
+        article = await asyncio.to_thread(get_cached_article, request.slug)
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        urls.extend(get_article_source_urls(article))
+
+    # Preserve order, drop duplicates
+    urls = list(dict.fromkeys(u.strip() for u in urls if u and u.strip()))
+    if not urls:
+        raise HTTPException(status_code=400, detail="No URLs to check")
+    if len(urls) > ARCHIVE_BATCH_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"Too many URLs (max {ARCHIVE_BATCH_MAX_URLS})")
+
+    concurrency = min(max(request.max_concurrency, 1), ARCHIVE_BATCH_CONCURRENCY)
+    results = await get_archive_metadata_batch(urls, max_concurrency=concurrency)
+
     return {
-        "url": url,
-        "availability": availability,
-        "earliest_snapshot": earliest
+        "results": results,
+        "count": len(results),
+        "archived": sum(1 for r in results if (r.get("availability") or {}).get("available")),
+        "cached": sum(1 for r in results if r.get("cached"))
     }
 
 
@@ -2203,59 +2734,355 @@ async def get_reddit_trending():
         return {"error": str(e), "posts": []}
 
 
-# === SEO ENDPOINTS ===
+# === RENDERED REPORTS ===
+# Reports published as ReportData JSON at reports/{slug}.json are rendered
+# on request. Pages are cached by (slug, content hash, renderer version) in
+# memory and /tmp, so a published report goes live without a static rebuild
+# and a warm instance serves it without re-rendering. The stylesheet and
+# script are the shared hashed assets in css/ and js/.
 
-@app.get("/sitemap.xml")
-async def sitemap():
-    """Generate dynamic XML sitemap."""
-    base_url = "https://genuverity7.vercel.app"
-    today = datetime.now().strftime("%Y-%m-%d")
+REPORTS_PREFIX = "reports/"
+REPORT_SLUG_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]{0,150}$")
+REPORT_SOURCE_TTL = 60            # Seconds before re-reading a report's JSON from storage
+RENDERED_REPORTS_MEMORY_MAX = 128
+RENDERED_REPORTS_DIR = os.path.join(CACHE_DIR, "rendered_reports")
+REPORT_PAGE_CACHE_CONTROL = "public, max-age=0, must-revalidate, s-maxage=60, stale-while-revalidate=86400"
 
-    xml_parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
+_report_sources: dict = {}        # slug -> (fetched_at, source, content_hash)
+_rendered_reports: OrderedDict = OrderedDict()
 
-    xml_parts.append(f'''  <url>
-    <loc>{base_url}/</loc>
-    <lastmod>{today}</lastmod>
-    <changefreq>daily</changefreq>
-    <priority>1.0</priority>
-  </url>''')
 
-    try:
-        index = get_article_index()
+def get_report_source(slug: str) -> Optional[tuple]:
+    """(ReportData JSON, content hash) for a published report, re-read at most every REPORT_SOURCE_TTL."""
+    cached = _report_sources.get(slug)
+    if cached and time.time() - cached[0] < REPORT_SOURCE_TTL:
+        return cached[1], cached[2]
 
-        for key, article in index.items():
-            if key.startswith("_"):
-                continue
+    source = record_get(f"{REPORTS_PREFIX}{slug}.json")
+    if source is None:
+        _report_sources.pop(slug, None)
+        return None
 
-            cached_at = article.get("cached_at", "")
-            lastmod = cached_at.split("T")[0] if cached_at else today
+    content_hash = hashlib.sha256(json.dumps(source, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    _report_sources[slug] = (time.time(), source, content_hash)
+    return source, content_hash
 
-            xml_parts.append(f'''  <url>
-    <loc>{base_url}/#article/{key}</loc>
-    <lastmod>{lastmod}</lastmod>
-    <changefreq>weekly</changefreq>
-    <priority>0.9</priority>
-  </url>''')
 
+def render_report_page(slug: str, source: dict, content_hash: str, renderer_version: str) -> dict:
+    """One report version as {content encoding: body}, from memory, /tmp, or a fresh render.
+
+    Compressed variants (lib/precompress.py) are made once per render, so
+    serving a page never compresses on the request path.
+    """
+    from lib.precompress import ENCODINGS, compress
+
+    key = (slug, content_hash, renderer_version)
+    variants = _rendered_reports.get(key)
+    if variants is not None:
+        _rendered_reports.move_to_end(key)
+        return variants
+
+    local_path = os.path.join(RENDERED_REPORTS_DIR, f"{slug}.{content_hash[:16]}.{renderer_version}.html")
+    try:
+        variants = {}
+        for encoding, suffix in [("identity", ""), *ENCODINGS]:
+            with open(local_path + suffix, 'rb') as f:
+                variants[encoding] = f.read()
+    except OSError:
+        from lib.report_renderer import render_report
+        from lib.report_schema import ReportData
+
+        html = render_report(ReportData.model_validate(source), css_mode="external", js_mode="external").encode()
+        variants = {"identity": html, **{encoding: compress(html, encoding) for encoding, _ in ENCODINGS}}
+        try:
+            os.makedirs(RENDERED_REPORTS_DIR, exist_ok=True)
+            # The uncompressed page goes last: if it exists, so do its siblings
+            for encoding, suffix in [*ENCODINGS, ("identity", "")]:
+                tmp_path = f"{local_path}{suffix}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(variants[encoding])
+                os.replace(tmp_path, local_path + suffix)
+        except OSError as e:
+            print(f"Rendered report cache write error: {e}")
+
+    try:
+        index_published_report(slug, variants["identity"].decode(), content_hash)
     except Exception as e:
-        print(f"Sitemap error: {e}")
+        print(f"Search index error for {slug}: {e}")
 
-    xml_parts.append('</urlset>')
+    _rendered_reports[key] = variants
+    while len(_rendered_reports) > RENDERED_REPORTS_MEMORY_MAX:
+        _rendered_reports.popitem(last=False)
+    return variants
 
-    return Response(
-        content='\n'.join(xml_parts),
-        media_type="application/xml"
-    )
 
+@app.get("/reports/{slug}")
+async def get_rendered_report(slug: str, request: Request):
+    """Serve a published ReportData report as HTML (ETag / 304 and Accept-Encoding aware)."""
+    if not REPORT_SLUG_PATTERN.match(slug):
+        raise HTTPException(status_code=404, detail="Report not found")
 
-@app.get("/robots.txt")
-async def robots():
-    """Serve robots.txt."""
-    return Response(
-        content="""# GenuVerity Robots.txt
+    found = await asyncio.to_thread(get_report_source, slug)
+    if not found:
+        raise HTTPException(status_code=404, detail="Report not found")
+    source, content_hash = found
+
+    from lib.precompress import accepted_encodings
+    from lib.report_renderer import RENDERER_VERSION
+
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    encoding = accepted[0][0] if accepted else "identity"
+
+    # Each encoding is a separate representation, so it gets its own ETag
+    etag = f'"{content_hash[:16]}-{RENDERER_VERSION}{"" if encoding == "identity" else "-" + encoding}"'
+    headers = {"ETag": etag, "Cache-Control": REPORT_PAGE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag in [tag.strip() for tag in request.headers.get("If-None-Match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        variants = await asyncio.to_thread(render_report_page, slug, source, content_hash, RENDERER_VERSION)
+    except ValueError as e:  # pydantic ValidationError
+        print(f"Invalid report data for {slug}: {str(e).splitlines()[0]}")
+        raise HTTPException(status_code=500, detail="Report data is invalid")
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=variants[encoding], media_type="text/html; charset=utf-8", headers=headers)
+
+
+# === FULL-TEXT SEARCH ===
+# One SQLite FTS5 database (lib/fulltext.py) over the static reports in
+# localreports/, published reports rendered from ReportData, and cached
+# fact-checks. The report pages are indexed at deploy time into
+# data/search.db (scripts/build_search_db.py, run by `npm run build`), which
+# a cold start copies to /tmp instead of parsing every page; the pages
+# themselves aren't bundled with the function. From there it is kept current
+# incrementally: cache_article() and render_report_page() index what they
+# write, and a throttled background sync diffs the article index (and, in
+# local dev without a built database, re-hashes localreports/), so only new
+# or changed documents are parsed or fetched.
+
+SEARCH_DB_PATH = os.getenv("GENUVERITY_SEARCH_DB", "/tmp/genuverity_search.db")
+SEARCH_SEED_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "search.db")
+SEARCH_REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "localreports")
+SEARCH_SYNC_INTERVAL = 300        # Seconds between syncs against localreports/ and the article index
+SEARCH_SYNC_MAX_FETCHES = 50      # Fact-checks fetched per sync; a backlog carries over to the next request
+SEARCH_MAX_PER_PAGE = 50
+SEARCH_MAX_QUERY_LENGTH = 200
+SEARCH_KINDS = {"report", "published", "factcheck"}
+
+_search_index = None
+_search_seeded = False            # Reports came from the bundled database; they can't change until the next deploy
+_search_synced_at = 0.0
+_search_sync_lock = None
+_search_sync_thread = None
+
+
+def get_search_index():
+    """Open the index, first copying the bundled database to SEARCH_DB_PATH if there is none yet."""
+    global _search_index, _search_seeded
+    if _search_index is None:
+        import shutil
+        from lib.fulltext import FullTextIndex
+
+        if not os.path.exists(SEARCH_DB_PATH) and os.path.exists(SEARCH_SEED_PATH):
+            os.makedirs(os.path.dirname(os.path.abspath(SEARCH_DB_PATH)), exist_ok=True)
+            tmp_path = f"{SEARCH_DB_PATH}.{os.getpid()}.tmp"
+            shutil.copyfile(SEARCH_SEED_PATH, tmp_path)
+            os.replace(tmp_path, SEARCH_DB_PATH)
+            _search_seeded = True
+        _search_index = FullTextIndex(SEARCH_DB_PATH)
+    return _search_index
+
+
+def index_cached_article(key: str, article: dict, index_entry: dict):
+    """Index a cached fact-check. The digest is its article-index entry, so sync can skip it unfetched."""
+    from lib.fulltext import article_document, content_hash
+
+    get_search_index().upsert(
+        f"factcheck:{key}", "factcheck", article_document(article),
+        url=f"/api/article/{key}", verdict=article.get("verdict"), digest=content_hash(index_entry))
+
+
+def index_published_report(slug: str, html: str, content_hash: str):
+    from lib.fulltext import page_document
+
+    get_search_index().upsert(f"published:{slug}", "published", page_document(html),
+                              url=f"/reports/{slug}", digest=content_hash)
+
+
+def _load_cached_article(key: str, meta: dict) -> Optional[dict]:
+    local_path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(local_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    if meta.get("blob_url"):
+        article = blob_get_by_url(meta["blob_url"])
+        if article:
+            return article
+    return blob_get(meta.get("blob_path", f"articles/{key}.json"))
+
+
+def sync_search_index(force: bool = False) -> dict:
+    """Bring the index up to date with the article index (at most every SEARCH_SYNC_INTERVAL).
+
+    localreports/ is re-hashed too unless the index was seeded from the
+    bundled database, which was built from the same pages.
+    """
+    global _search_synced_at, _search_sync_lock
+    import threading
+    from lib.fulltext import content_hash
+
+    if not force and time.time() - _search_synced_at < SEARCH_SYNC_INTERVAL:
+        return {}
+    if _search_sync_lock is None:
+        _search_sync_lock = threading.Lock()
+
+    with _search_sync_lock:
+        if not force and time.time() - _search_synced_at < SEARCH_SYNC_INTERVAL:
+            return {}
+        index = get_search_index()
+
+        counts = {"reports": {}}
+        if not _search_seeded and os.path.isdir(SEARCH_REPORTS_DIR):
+            try:
+                from lib.catalog import load_catalog, report_key
+                catalog = {report_key(r["slug"]): r for r in load_catalog() if r.get("slug")}
+            except (OSError, ValueError):
+                catalog = {}
+            counts["reports"] = index.sync_report_files(SEARCH_REPORTS_DIR, catalog)
+
+        indexed = index.hashes("factcheck")
+        articles = {f"factcheck:{key}": (key, meta) for key, meta in get_article_index().items()
+                    if not key.startswith("_") and isinstance(meta, dict)}
+        stale = [(key, meta) for doc_id, (key, meta) in articles.items() if indexed.get(doc_id) != content_hash(meta)]
+        for key, meta in stale[:SEARCH_SYNC_MAX_FETCHES]:
+            article = _load_cached_article(key, meta)
+            if article:
+                index_cached_article(key, article, meta)
+        for doc_id in set(indexed) - set(articles):
+            index.remove(doc_id)
+        counts["factchecks"] = {"stale": len(stale), "total": len(articles)}
+
+        if len(stale) <= SEARCH_SYNC_MAX_FETCHES:
+            _search_synced_at = time.time()
+        return counts
+
+
+def _run_search_sync():
+    try:
+        sync_search_index()
+    except Exception as e:
+        # A failed sync still leaves the last good index searchable
+        print(f"Search index sync error: {type(e).__name__}: {e}")
+
+
+def start_search_sync():
+    """Start a due sync in a background thread, so requests never wait on Blob fetches."""
+    global _search_sync_thread
+    import threading
+
+    if time.time() - _search_synced_at < SEARCH_SYNC_INTERVAL:
+        return
+    if _search_sync_thread and _search_sync_thread.is_alive():
+        return
+    _search_sync_thread = threading.Thread(target=_run_search_sync, name="search-sync", daemon=True)
+    _search_sync_thread.start()
+
+
+@app.get("/api/search")
+async def api_search(q: str, page: int = 1, per_page: int = 10, kind: Optional[str] = None):
+    """
+    Full-text search over reports and cached fact-checks.
+
+    Example: /api/search?q=vaccine+autism&page=2&per_page=10&kind=report
+    Results are ranked by BM25; `snippet` is HTML-escaped with matches in <mark>.
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="Missing query")
+    if len(q) > SEARCH_MAX_QUERY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Query too long (max {SEARCH_MAX_QUERY_LENGTH} characters)")
+    if page < 1 or not 1 <= per_page <= SEARCH_MAX_PER_PAGE:
+        raise HTTPException(status_code=400, detail=f"page must be >= 1 and per_page between 1 and {SEARCH_MAX_PER_PAGE}")
+    if kind and kind not in SEARCH_KINDS:
+        raise HTTPException(status_code=400, detail=f"kind must be one of: {', '.join(sorted(SEARCH_KINDS))}")
+
+    # Only an empty index (no bundled database, first use) waits for the sync
+    index = await asyncio.to_thread(get_search_index)
+    if await asyncio.to_thread(index.count):
+        start_search_sync()
+    else:
+        await asyncio.to_thread(_run_search_sync)
+
+    started = time.perf_counter()
+    found = await asyncio.to_thread(index.search, q, per_page, (page - 1) * per_page, kind)
+    return {
+        "query": q,
+        "page": page,
+        "per_page": per_page,
+        "total": found["total"],
+        "pages": -(-found["total"] // per_page),
+        "results": found["results"],
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+# === SEO ENDPOINTS ===
+
+@app.get("/sitemap.xml")
+async def sitemap():
+    """Generate dynamic XML sitemap."""
+    base_url = "https://genuverity7.vercel.app"
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    xml_parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+    ]
+
+    xml_parts.append(f'''  <url>
+    <loc>{base_url}/</loc>
+    <lastmod>{today}</lastmod>
+    <changefreq>daily</changefreq>
+    <priority>1.0</priority>
+  </url>''')
+
+    try:
+        index = get_article_index()
+
+        for key, article in index.items():
+            if key.startswith("_"):
+                continue
+
+            cached_at = article.get("cached_at", "")
+            lastmod = cached_at.split("T")[0] if cached_at else today
+
+            xml_parts.append(f'''  <url>
+    <loc>{base_url}/#article/{key}</loc>
+    <lastmod>{lastmod}</lastmod>
+    <changefreq>weekly</changefreq>
+    <priority>0.9</priority>
+  </url>''')
+
+    except Exception as e:
+        print(f"Sitemap error: {e}")
+
+    xml_parts.append('</urlset>')
+
+    return Response(
+        content='\n'.join(xml_parts),
+        media_type="application/xml"
+    )
+
+
+@app.get("/robots.txt")
+async def robots():
+    """Serve robots.txt."""
+    return Response(
+        content="""# GenuVerity Robots.txt
 User-agent: *
 Allow: /
 Sitemap: https://genuverity7.vercel.app/sitemap.xml
@@ -2272,10 +3099,72 @@ class WaitlistSignup(BaseModel):
     usecase: Optional[str] = None
     source: Optional[str] = None
 
+# Legacy single-array store, read only by the migration endpoint
 WAITLIST_INDEX_PATH = "waitlist/_index.json"
 
-def get_waitlist() -> list:
-    """Get all waitlist signups from Vercel Blob."""
+# Append-only layout: one record per signup in numbered slots, plus a
+# hashed-email uniqueness index and a count hint
+WAITLIST_SIGNUPS_PREFIX = "waitlist/signups/"
+WAITLIST_EMAILS_PREFIX = "waitlist/emails/"
+WAITLIST_COUNT_PATH = "waitlist/_count.json"
+
+_waitlist_count_hint = 0
+
+
+def waitlist_email_hash(email: str) -> str:
+    """Stable key for the uniqueness index (the address itself is not in the path)."""
+    return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+
+
+def waitlist_slot_path(position: int) -> str:
+    return f"{WAITLIST_SIGNUPS_PREFIX}{position:08d}.json"
+
+
+def get_waitlist_count() -> int:
+    """Number of signups: start from the count hint, then probe past it.
+
+    The hint can lag behind concurrent signups but never runs ahead, so a
+    few existence checks for the next slots make it exact.
+    """
+    global _waitlist_count_hint
+
+    if not _waitlist_count_hint:
+        hint = record_get(WAITLIST_COUNT_PATH) or {}
+        _waitlist_count_hint = hint.get("count", 0)
+
+    count = _waitlist_count_hint
+    while record_exists(waitlist_slot_path(count + 1)):
+        count += 1
+
+    _waitlist_count_hint = max(_waitlist_count_hint, count)
+    return count
+
+
+def add_waitlist_signup(signup: dict) -> Optional[int]:
+    """Append a signup. Returns its position, or None if the email is already on the list."""
+    global _waitlist_count_hint
+
+    email_path = f"{WAITLIST_EMAILS_PREFIX}{waitlist_email_hash(signup['email'])}.json"
+    if not record_create(email_path, {"timestamp": signup["timestamp"]}):
+        return None
+
+    # Claim the next free slot; a concurrent signup that got there first just pushes us along.
+    # If the store fails first, release the email so a retry isn't told it's already listed.
+    try:
+        position = get_waitlist_count() + 1
+        while not record_create(waitlist_slot_path(position), {**signup, "position": position}):
+            position += 1
+    except Exception:
+        record_delete(email_path)
+        raise
+
+    _waitlist_count_hint = max(_waitlist_count_hint, position)
+    record_put(WAITLIST_COUNT_PATH, {"count": _waitlist_count_hint, "updated_at": datetime.utcnow().isoformat()})
+    return position
+
+
+def get_legacy_waitlist() -> list:
+    """Get the pre-migration waitlist array from Vercel Blob."""
     if not BLOB_READ_WRITE_TOKEN:
         return []
 
@@ -2292,60 +3181,503 @@ def get_waitlist() -> list:
 
     return []
 
-def save_waitlist(waitlist: list):
-    """Save waitlist to Vercel Blob."""
-    if not BLOB_READ_WRITE_TOKEN:
-        return False
 
-    try:
-        response = requests.put(
-            f"{BLOB_API_BASE}/{WAITLIST_INDEX_PATH}",
-            headers={
-                "Authorization": f"Bearer {BLOB_READ_WRITE_TOKEN}",
-                "x-api-version": "7",
-                "Content-Type": "application/json"
-            },
-            json=waitlist,
-            timeout=10
-        )
-        return response.status_code in [200, 201]
-    except Exception as e:
-        print(f"Error saving waitlist: {e}")
-        return False
+# === EMAIL TEMPLATES ===
+# Templates are parsed once at import into literal chunks and field slots;
+# rendering only joins values. {{ field }} is HTML-escaped, {{ field|raw }}
+# inserts pre-rendered markup (e.g. a list rendered from another template).
+
+EMAIL_FIELD_PATTERN = re.compile(r"\{\{\s*(\w+)(\|raw)?\s*\}\}")
+
+EMAIL_DOCUMENT = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+[[styles]]
+    </style>
+</head>
+<body>
+[[body]]
+</body>
+</html>
+"""
+
+
+class EmailTemplate:
+    """A compiled email template: alternating literals and (field, raw) slots."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.literals = []
+        self.slots = []
+        pos = 0
+        for match in EMAIL_FIELD_PATTERN.finditer(source):
+            self.literals.append(source[pos:match.start()])
+            self.slots.append((match.group(1), bool(match.group(2))))
+            pos = match.end()
+        self.literals.append(source[pos:])
+        self.fields = {name for name, _ in self.slots}
+
+    def render(self, **values) -> str:
+        missing = self.fields - values.keys()
+        if missing:
+            raise KeyError(f"Missing template fields: {', '.join(sorted(missing))}")
+
+        out = [self.literals[0]]
+        for (name, raw), literal in zip(self.slots, self.literals[1:]):
+            value = values[name]
+            value = "" if value is None else str(value)
+            out.append(value if raw else escape(value))
+            out.append(literal)
+        return "".join(out)
+
+
+_email_templates: dict = {}
+
+
+def register_email_template(name: str, body: str, styles: Optional[str] = None) -> EmailTemplate:
+    """Compile and register a template. With `styles`, the body is wrapped in EMAIL_DOCUMENT."""
+    source = body
+    if styles is not None:
+        source = EMAIL_DOCUMENT.replace("[[styles]]", styles).replace("[[body]]", body)
+    template = EmailTemplate(source)
+    _email_templates[name] = template
+    return template
+
+
+def render_email(template_name: str, **values) -> str:
+    """Render a registered email template."""
+    return _email_templates[template_name].render(**values)
+
+
+def render_email_items(template_name: str, items: list, field: str = "text") -> str:
+    """Render a registered fragment once per item and concatenate (for |raw slots)."""
+    template = _email_templates[template_name]
+    return "".join(template.render(**{field: item}) for item in items)
+
+
+# Shared dark-theme styles for user-facing emails
+EMAIL_BRAND_STYLES = """
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px 20px; }
+        .container { max-width: 600px; margin: 0 auto; background: #16161e; border-radius: 16px; padding: 40px; border: 1px solid #2a2a3a; }
+        .logo { font-size: 28px; font-weight: 700; margin-bottom: 24px; }
+        .logo-genu { color: #ffffff; }
+        p { color: #a0a0b0; line-height: 1.7; margin-bottom: 16px; }
+        .highlight { color: #06b6d4; }
+        .footer { margin-top: 32px; padding-top: 24px; border-top: 1px solid #2a2a3a; color: #6b7280; font-size: 14px; }
+"""
+
+register_email_template("waitlist_welcome", styles=EMAIL_BRAND_STYLES + """
+        .logo-verity { color: #06b6d4; }
+        h1 { font-size: 24px; margin-bottom: 16px; }
+        .discount { background: rgba(16, 185, 129, 0.15); color: #10b981; padding: 12px 20px; border-radius: 8px; margin: 24px 0; }
+""", body="""
+    <div class="container">
+        <div class="logo"><span class="logo-genu">Genu</span><span class="logo-verity">Verity</span></div>
+        <h1>You're on the list!</h1>
+        <p>Thanks for joining the GenuVerity early access waitlist. We're building something special: <span class="highlight">fact-checking powered by Constitutional AI</span> - transparent, accountable, and deeply sourced.</p>
+        <div class="discount">
+            <strong>Early Access Perk:</strong> As a waitlist member, you'll receive a steep discount when we launch.
+        </div>
+        <p>We'll reach out soon with updates on our progress and your exclusive early access invitation.</p>
+        <p>In the meantime, if you have questions or ideas, just reply to this email.</p>
+        <div class="footer">
+            <p>&copy; 2025 GenuVerity LLC. Building transparent fact-checking for a better-informed world.</p>
+        </div>
+    </div>
+""")
+
+register_email_template("waitlist_admin", styles="""
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px; }
+        .field { margin-bottom: 16px; }
+        .label { font-weight: 600; color: #666; }
+        .value { font-size: 16px; margin-top: 4px; }
+""", body="""
+    <h2>New GenuVerity Waitlist Signup</h2>
+    <div class="field">
+        <div class="label">Email</div>
+        <div class="value">{{ email }}</div>
+    </div>
+    <div class="field">
+        <div class="label">How they plan to use GenuVerity</div>
+        <div class="value">{{ usecase }}</div>
+    </div>
+    <div class="field">
+        <div class="label">How they heard about us</div>
+        <div class="value">{{ source }}</div>
+    </div>
+    <div class="field">
+        <div class="label">Timestamp</div>
+        <div class="value">{{ timestamp }}</div>
+    </div>
+    <div class="field">
+        <div class="label">Total Waitlist Count</div>
+        <div class="value">{{ position }}</div>
+    </div>
+""")
+
+register_email_template("report_request_description", '<div class="description">{{ description }}</div>')
+
+register_email_template("report_request_requester", styles=EMAIL_BRAND_STYLES + """
+        .logo-verity { color: #3b82f6; }
+        h1 { font-size: 24px; margin-bottom: 16px; color: #ffffff; }
+        .topic-box { background: rgba(59, 130, 246, 0.1); border: 1px solid rgba(59, 130, 246, 0.3); padding: 16px; border-radius: 8px; margin: 24px 0; }
+        .topic-label { font-size: 12px; color: #6b7280; text-transform: uppercase; margin-bottom: 8px; }
+        .topic-text { font-size: 18px; font-weight: 600; color: #ffffff; }
+        .description { color: #a0a0b0; margin-top: 12px; font-size: 14px; }
+        .status { background: rgba(245, 158, 11, 0.15); color: #f59e0b; padding: 8px 16px; border-radius: 6px; display: inline-block; font-weight: 600; margin: 16px 0; }
+""", body="""
+    <div class="container">
+        <div class="logo"><span class="logo-genu">Genu</span><span class="logo-verity">Verity</span></div>
+        <h1>Report Request Received!</h1>
+        <p>Thank you for submitting your investigation topic. Our team will review your request and begin research.</p>
+
+        <div class="topic-box">
+            <div class="topic-label">Your Requested Topic</div>
+            <div class="topic-text">{{ topic }}</div>
+            {{ description_html|raw }}
+        </div>
+
+        <div class="status">Status: Queued for Investigation</div>
+
+        <p>We'll notify you at <span class="highlight">{{ email }}</span> when your report is ready. Most reports are completed within 48-72 hours.</p>
+
+        <p>Request ID: <code style="background: #2a2a3a; padding: 2px 8px; border-radius: 4px;">{{ request_id }}</code></p>
+
+        <div class="footer">
+            <p>&copy; 2025 GenuVerity LLC. AI-powered fact verification with human oversight.</p>
+        </div>
+    </div>
+""")
+
+register_email_template("report_request_admin", styles="""
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px; background: #f5f5f5; }
+        .container { max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 32px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }
+        h1 { color: #1a1a1a; font-size: 22px; margin-bottom: 24px; }
+        .field { margin-bottom: 20px; }
+        .label { font-weight: 600; color: #666; font-size: 12px; text-transform: uppercase; margin-bottom: 6px; }
+        .value { font-size: 16px; color: #1a1a1a; padding: 12px; background: #f8f9fa; border-radius: 6px; }
+        .description { white-space: pre-wrap; }
+        .meta { color: #888; font-size: 14px; margin-top: 24px; padding-top: 16px; border-top: 1px solid #eee; }
+""", body="""
+    <div class="container">
+        <h1>New Report Request</h1>
+
+        <div class="field">
+            <div class="label">Topic</div>
+            <div class="value"><strong>{{ topic }}</strong></div>
+        </div>
+
+        <div class="field">
+            <div class="label">Description</div>
+            <div class="value description">{{ description }}</div>
+        </div>
+
+        <div class="field">
+            <div class="label">Requester Email</div>
+            <div class="value">{{ email }}</div>
+        </div>
+
+        <div class="meta">
+            <p><strong>Request ID:</strong> {{ request_id }}</p>
+            <p><strong>Submitted:</strong> {{ submitted_at }}</p>
+        </div>
+    </div>
+""")
+
+register_email_template("feedback_admin", """
+<!DOCTYPE html>
+<html>
+<body style="font-family: -apple-system, sans-serif; padding: 20px;">
+    <h2>Report Feedback Received</h2>
+    <p><strong>Report:</strong> {{ slug }}</p>
+    <p><strong>Rating:</strong> {{ stars }} ({{ rating }}/5)</p>
+    <p><strong>Comment:</strong> {{ comment }}</p>
+    <p><strong>Email:</strong> {{ email }}</p>
+    <p style="color: #888; font-size: 12px;">Submitted: {{ submitted_at }}</p>
+</body>
+</html>
+""")
+
+register_email_template("tagline_item", '<div class="tagline">{{ text }}</div>')
+register_email_template("tagline_pick", '<div class="tagline-item">{{ text }}</div>')
+
+register_email_template("tagline_admin", styles="""
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px; }
+        .container { max-width: 600px; margin: 0 auto; background: #111827; border-radius: 16px; padding: 32px; border: 1px solid rgba(59, 130, 246, 0.2); }
+        h1 { color: #06b6d4; font-size: 1.5rem; margin-bottom: 24px; }
+        .respondent { color: #3b82f6; font-weight: 600; font-size: 1.1rem; margin-bottom: 20px; }
+        .count { color: #a0aec0; margin-bottom: 24px; }
+        .tagline { background: rgba(59, 130, 246, 0.1); border: 1px solid rgba(59, 130, 246, 0.2); border-radius: 8px; padding: 12px 16px; margin-bottom: 8px; color: #ffffff; }
+        .footer { margin-top: 32px; padding-top: 20px; border-top: 1px solid rgba(59, 130, 246, 0.2); color: #64748b; font-size: 0.85rem; }
+""", body="""
+    <div class="container">
+        <h1>Tagline Survey Response</h1>
+        <div class="respondent">From: {{ email }}</div>
+        <div class="count">Selected {{ count }} tagline(s):</div>
+        {{ taglines_html|raw }}
+        <div class="footer">
+            Submitted via GenuVerity Tagline Survey
+        </div>
+    </div>
+""")
+
+register_email_template("tagline_thanks", styles="""
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px; margin: 0; }
+        .container { max-width: 600px; margin: 0 auto; background: #111827; border-radius: 16px; padding: 40px; border: 1px solid rgba(59, 130, 246, 0.2); }
+        .logo { font-size: 1.75rem; font-weight: 700; margin-bottom: 32px; }
+        .logo-genu { color: #ffffff; }
+        .logo-verity { color: #3b82f6; }
+        h1 { color: #ffffff; font-size: 1.5rem; margin-bottom: 20px; }
+        p { color: #a0aec0; font-size: 1rem; line-height: 1.7; margin-bottom: 16px; }
+        .highlight { color: #06b6d4; font-weight: 600; }
+        .taglines-box { background: rgba(6, 182, 212, 0.1); border: 1px solid rgba(6, 182, 212, 0.2); border-radius: 12px; padding: 20px; margin: 24px 0; }
+        .taglines-title { color: #06b6d4; font-size: 0.85rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 12px; }
+        .tagline-item { color: #ffffff; padding: 8px 0; border-bottom: 1px solid rgba(255,255,255,0.1); }
+        .tagline-item:last-child { border-bottom: none; }
+        .cta { display: inline-block; margin-top: 24px; padding: 14px 28px; background: linear-gradient(135deg, #3b82f6, #06b6d4); border-radius: 10px; color: white; text-decoration: none; font-weight: 600; }
+        .footer { margin-top: 40px; padding-top: 24px; border-top: 1px solid rgba(59, 130, 246, 0.2); color: #64748b; font-size: 0.85rem; }
+""", body="""
+    <div class="container">
+        <div class="logo">
+            <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
+        </div>
+        <h1>Thanks for your feedback!</h1>
+        <p>Your input is incredibly valuable as we finalize the GenuVerity brand. We're building something we think will genuinely help people cut through the noise and find the truth faster.</p>
+
+        <div class="taglines-box">
+            <div class="taglines-title">Your picks ({{ count }} selected)</div>
+            {{ taglines_html|raw }}
+        </div>
+
+        <p>We'll be launching soon with <span class="highlight">real-time fact-checking</span> that tracks viral claims as they spread and delivers source-heavy investigative reports back to where the conversation is happening.</p>
+
+        <p>Want to be first to know when we go live?</p>
+
+        <a href="https://genuverity7.vercel.app/" class="cta">Sign Up for Early Access</a>
+
+        <div class="footer">
+            <p>Thanks again for helping shape GenuVerity.</p>
+            <p style="margin-top: 8px;">— Chris</p>
+        </div>
+    </div>
+""")
+
+register_email_template("contact_admin", """
+<h3>New Inquiry Received</h3>
+<p><strong>Name:</strong> {{ name }}</p>
+<p><strong>Email:</strong> {{ email }}</p>
+<p><strong>Type:</strong> {{ inquiry_type }}</p>
+<hr>
+<p><strong>Message:</strong></p>
+<p style="white-space: pre-wrap;">{{ message }}</p>
+""")
+
+register_email_template("contact_reply", """
+<p>Hi {{ name }},</p>
+<p>Thanks for reaching out to GenuVerity. We've received your inquiry regarding <strong>{{ inquiry_type }}</strong>.</p>
+<p>A member of our team will review your message and get back to you shortly.</p>
+<br>
+<p>Best regards,</p>
+<p><strong>Chris &amp; The GenuVerity Team</strong></p>
+""")
+
+# === OUTBOUND EMAIL QUEUE ===
+# Endpoints enqueue and return; a background worker delivers via Resend,
+# batching what is ready and retrying 429/5xx with exponential backoff.
+# Set MAIL_SINK_DIR to write messages to disk instead (local dev and tests).
+
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+RESEND_BATCH_MAX = 100
+DEFAULT_FROM_EMAIL = "GenuVerity <hello@genuverity.com>"
+EMAIL_MAX_ATTEMPTS = 5
+EMAIL_BACKOFF_BASE = 1.0   # Seconds; doubles per attempt
+EMAIL_RECENT_KEYS_MAX = 5000
+MAIL_SINK_DIR = os.getenv("MAIL_SINK_DIR")
+
+
+class EmailQueue:
+    """In-process outbound email queue with a lazily started worker thread."""
+
+    def __init__(self):
+        import queue
+        import threading
+
+        self._queue = queue.Queue()
+        self._retry: list = []              # heap of (due_at, seq, batch)
+        self._seq = 0
+        self._recent_keys: OrderedDict = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._worker = None
+
+    def enqueue(self, to: str, subject: str, html: str, from_email: str = DEFAULT_FROM_EMAIL,
+                idempotency_key: Optional[str] = None) -> str:
+        """Queue a message. Messages whose idempotency key was seen recently are dropped."""
+        import threading
+
+        key = idempotency_key or hashlib.sha256(f"{from_email}|{to}|{subject}|{html}".encode()).hexdigest()[:32]
+
+        with self._lock:
+            if key in self._recent_keys:
+                return key
+            self._recent_keys[key] = True
+            while len(self._recent_keys) > EMAIL_RECENT_KEYS_MAX:
+                self._recent_keys.popitem(last=False)
+            self._pending += 1
+
+            if not self._worker or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="email-queue", daemon=True)
+                self._worker.start()
+
+        self._queue.put({
+            "key": key,
+            "attempts": 0,
+            "payload": {"from": from_email, "to": [to], "subject": subject, "html": html}
+        })
+        return key
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Block until everything queued so far is delivered or given up on."""
+        deadline = time.time() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def _done(self, count: int):
+        with self._idle:
+            self._pending -= count
+            if self._pending <= 0:
+                self._pending = 0
+                self._idle.notify_all()
+
+    def _next_batch(self) -> Optional[dict]:
+        """A due retry as it was first sent, else up to RESEND_BATCH_MAX new messages under a fresh batch key."""
+        import heapq
+        import queue
+
+        now = time.time()
+        if self._retry and self._retry[0][0] <= now:
+            return heapq.heappop(self._retry)[2]
+        wait = self._retry[0][0] - now if self._retry else None
+
+        try:
+            messages = [self._queue.get(timeout=wait)]
+        except queue.Empty:
+            return None
+        while len(messages) < RESEND_BATCH_MAX:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return {"key": os.urandom(16).hex(), "messages": messages}
+
+    def _schedule_retry(self, batch: dict):
+        import heapq
+
+        self._seq += 1
+        attempts = batch["messages"][0]["attempts"]
+        due = time.time() + EMAIL_BACKOFF_BASE * (2 ** (attempts - 1))
+        heapq.heappush(self._retry, (due, self._seq, batch))
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                continue
+
+            try:
+                failed = deliver_emails(batch)
+            except Exception as e:
+                print(f"Email delivery error: {e}")
+                failed = [batch]
+
+            # Failed batches are retried exactly as sent, so Resend sees the same idempotency key
+            delivered = len(batch["messages"]) - sum(len(b["messages"]) for b in failed)
+            for retry in failed:
+                for message in retry["messages"]:
+                    message["attempts"] += 1
+                if retry["messages"][0]["attempts"] >= EMAIL_MAX_ATTEMPTS:
+                    for message in retry["messages"]:
+                        print(f"Giving up on email to {message['payload']['to'][0]} after {message['attempts']} attempts")
+                    delivered += len(retry["messages"])
+                    continue
+                self._schedule_retry(retry)
+
+            if delivered:
+                self._done(delivered)
+
+
+def deliver_emails(batch: dict) -> list:
+    """Send a batch through Resend (or the mail sink). Returns the batches worth retrying.
+
+    A single message is sent under its own idempotency key, several under the
+    batch key, which EmailQueue keeps for as long as it retries that batch.
+    """
+    messages = batch["messages"]
+    if MAIL_SINK_DIR:
+        os.makedirs(MAIL_SINK_DIR, exist_ok=True)
+        for message in messages:
+            with open(os.path.join(MAIL_SINK_DIR, f"{message['key']}.json"), 'w') as f:
+                json.dump({**message["payload"], "idempotency_key": message["key"]}, f)
+        return []
 
-def send_resend_email(to: str, subject: str, html: str, from_email: str = "GenuVerity <hello@genuverity.com>"):
-    """Send email via Resend API."""
     if not RESEND_API_KEY:
         print("RESEND_API_KEY not configured")
-        return False
+        return []
+
+    headers = {
+        "Authorization": f"Bearer {RESEND_API_KEY}",
+        "Content-Type": "application/json"
+    }
+
+    if len(messages) == 1:
+        url, body = RESEND_EMAILS_URL, messages[0]["payload"]
+        headers["Idempotency-Key"] = messages[0]["key"]
+    else:
+        url, body = RESEND_BATCH_URL, [m["payload"] for m in messages]
+        headers["Idempotency-Key"] = batch["key"]
 
     try:
-        response = requests.post(
-            "https://api.resend.com/emails",
-            headers={
-                "Authorization": f"Bearer {RESEND_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "from": from_email,
-                "to": [to],
-                "subject": subject,
-                "html": html
-            },
-            timeout=10
-        )
-        if response.status_code == 200:
-            print(f"Email sent to {to}")
-            return True
-        else:
-            print(f"Resend error: {response.status_code} - {response.text}")
-            return False
+        response = requests.post(url, headers=headers, json=body, timeout=10)
     except Exception as e:
         print(f"Error sending email: {e}")
-        return False
+        return [batch]
+
+    if response.status_code in (200, 201):
+        print(f"Email sent to {', '.join(m['payload']['to'][0] for m in messages)}")
+        return []
+
+    print(f"Resend error: {response.status_code} - {response.text[:200]}")
+    if response.status_code == 429 or response.status_code >= 500:
+        return [batch]
+    if len(messages) > 1:
+        # A batch is rejected as a whole; resend individually so one bad message doesn't sink the rest
+        retry = []
+        for message in messages:
+            retry.extend(deliver_emails({"key": message["key"], "messages": [message]}))
+        return retry
+    return []
+
+
+email_queue = EmailQueue()
+
+
+@app.on_event("shutdown")
+def flush_email_queue():
+    """Give queued emails a chance to go out before the process exits."""
+    email_queue.flush(timeout=10)
+
 
 @app.post("/api/waitlist")
-async def join_waitlist(signup: WaitlistSignup):
+async def join_waitlist(signup: WaitlistSignup, background_tasks: BackgroundTasks):
     """Add email to waitlist, send confirmation and notification emails."""
     email = signup.email.strip().lower()
     usecase = signup.usecase.strip() if signup.usecase else ""
@@ -2355,15 +3687,6 @@ async def join_waitlist(signup: WaitlistSignup):
     if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
         raise HTTPException(status_code=400, detail="Invalid email format")
 
-    # Load current waitlist
-    waitlist = get_waitlist()
-
-    # Check for duplicate
-    existing_emails = [w.get("email", "").lower() for w in waitlist]
-    if email in existing_emails:
-        return {"success": True, "message": "You're already on the waitlist!", "duplicate": True}
-
-    # Add new signup
     new_signup = {
         "email": email,
         "usecase": usecase,
@@ -2371,107 +3694,80 @@ async def join_waitlist(signup: WaitlistSignup):
         "timestamp": datetime.utcnow().isoformat(),
         "ip": None  # Could add IP tracking if needed
     }
-    waitlist.append(new_signup)
 
-    # Save to blob
-    save_waitlist(waitlist)
+    try:
+        position = await asyncio.to_thread(add_waitlist_signup, new_signup)
+    except RecordStoreError as e:
+        print(f"Error saving waitlist signup: {e}")
+        raise HTTPException(status_code=503, detail="Could not save signup, please try again")
+
+    if position is None:
+        return {"success": True, "message": "You're already on the waitlist!", "duplicate": True}
 
     # Send welcome email to user
-    welcome_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px 20px; }}
-            .container {{ max-width: 600px; margin: 0 auto; background: #16161e; border-radius: 16px; padding: 40px; border: 1px solid #2a2a3a; }}
-            .logo {{ font-size: 28px; font-weight: 700; margin-bottom: 24px; }}
-            .logo-genu {{ color: #ffffff; }}
-            .logo-verity {{ color: #06b6d4; }}
-            h1 {{ font-size: 24px; margin-bottom: 16px; }}
-            p {{ color: #a0a0b0; line-height: 1.7; margin-bottom: 16px; }}
-            .highlight {{ color: #06b6d4; }}
-            .discount {{ background: rgba(16, 185, 129, 0.15); color: #10b981; padding: 12px 20px; border-radius: 8px; margin: 24px 0; }}
-            .footer {{ margin-top: 32px; padding-top: 24px; border-top: 1px solid #2a2a3a; color: #6b7280; font-size: 14px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="logo"><span class="logo-genu">Genu</span><span class="logo-verity">Verity</span></div>
-            <h1>You're on the list!</h1>
-            <p>Thanks for joining the GenuVerity early access waitlist. We're building something special: <span class="highlight">fact-checking powered by Constitutional AI</span> - transparent, accountable, and deeply sourced.</p>
-            <div class="discount">
-                <strong>Early Access Perk:</strong> As a waitlist member, you'll receive a steep discount when we launch.
-            </div>
-            <p>We'll reach out soon with updates on our progress and your exclusive early access invitation.</p>
-            <p>In the meantime, if you have questions or ideas, just reply to this email.</p>
-            <div class="footer">
-                <p>&copy; 2025 GenuVerity LLC. Building transparent fact-checking for a better-informed world.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    send_resend_email(email, "You're on the GenuVerity waitlist!", welcome_html)
+    welcome_html = render_email("waitlist_welcome")
+    email_key = waitlist_email_hash(email)
+    email_queue.enqueue(email, "You're on the GenuVerity waitlist!", welcome_html,
+                        idempotency_key=f"waitlist-welcome-{email_key}")
 
     # Send notification to admin
-    admin_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px; }}
-            .field {{ margin-bottom: 16px; }}
-            .label {{ font-weight: 600; color: #666; }}
-            .value {{ font-size: 16px; margin-top: 4px; }}
-        </style>
-    </head>
-    <body>
-        <h2>New GenuVerity Waitlist Signup</h2>
-        <div class="field">
-            <div class="label">Email</div>
-            <div class="value">{email}</div>
-        </div>
-        <div class="field">
-            <div class="label">How they plan to use GenuVerity</div>
-            <div class="value">{usecase if usecase else '(not provided)'}</div>
-        </div>
-        <div class="field">
-            <div class="label">How they heard about us</div>
-            <div class="value">{source if source else '(not provided)'}</div>
-        </div>
-        <div class="field">
-            <div class="label">Timestamp</div>
-            <div class="value">{new_signup['timestamp']}</div>
-        </div>
-        <div class="field">
-            <div class="label">Total Waitlist Count</div>
-            <div class="value">{len(waitlist)}</div>
-        </div>
-    </body>
-    </html>
-    """
-    send_resend_email(ADMIN_EMAIL, f"New waitlist signup: {email}", admin_html)
+    admin_html = render_email(
+        "waitlist_admin",
+        email=email,
+        usecase=usecase or "(not provided)",
+        source=source or "(not provided)",
+        timestamp=new_signup['timestamp'],
+        position=position
+    )
+    email_queue.enqueue(ADMIN_EMAIL, f"New waitlist signup: {email}", admin_html,
+                        idempotency_key=f"waitlist-admin-{email_key}")
+    background_tasks.add_task(email_queue.flush)
 
     return {
         "success": True,
         "message": "Welcome to the waitlist! Check your email for confirmation.",
-        "position": len(waitlist)
+        "position": position
     }
 
 @app.get("/api/waitlist/count")
 async def waitlist_count():
     """Get waitlist count (public)."""
-    waitlist = get_waitlist()
-    return {"count": len(waitlist)}
+    return {"count": await asyncio.to_thread(get_waitlist_count)}
 
 @app.get("/api/waitlist/export")
 async def export_waitlist(secret: str = ""):
-    """Export full waitlist (admin only)."""
-    if secret != ADMIN_SECRET:
+    """Export full waitlist (admin only), streamed one signup at a time."""
+    if not ADMIN_SECRET or secret != ADMIN_SECRET:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    waitlist = get_waitlist()
-    return {"waitlist": waitlist, "count": len(waitlist)}
+    def stream_waitlist():
+        count = 0
+        yield '{"waitlist": ['
+        for _, record in record_iter(WAITLIST_SIGNUPS_PREFIX):
+            yield ("," if count else "") + json.dumps(record)
+            count += 1
+        yield f'], "count": {count}}}'
+
+    return StreamingResponse(stream_waitlist(), media_type="application/json")
+
+
+@app.post("/api/admin/migrate-waitlist")
+async def migrate_waitlist(request: Request):
+    """Copy the legacy waitlist/_index.json array into the append-only store (idempotent)."""
+    auth = request.headers.get("Authorization", "")
+    if not ADMIN_SECRET or auth != f"Bearer {ADMIN_SECRET}":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    def migrate():
+        legacy = get_legacy_waitlist()
+        added = 0
+        for entry in sorted(legacy, key=lambda w: w.get("timestamp", "")):
+            if entry.get("email") and add_waitlist_signup({**entry, "email": entry["email"].strip().lower()}):
+                added += 1
+        return len(legacy), added
+
+    total, added = await asyncio.to_thread(migrate)
+    return {"success": True, "legacy_count": total, "migrated": added, "skipped_duplicates": total - added}
 
 
 # === REPORT REQUEST SUBMISSIONS ===
@@ -2482,10 +3778,50 @@ class ReportRequest(BaseModel):
     description: str  # Max 300 chars
     email: str
 
+# Legacy single-array store, read only by the migration endpoint
 REPORT_REQUESTS_PATH = "report_requests/_index.json"
 
-def get_report_requests() -> list:
-    """Get all report requests from Vercel Blob."""
+# Job queue layout:
+#   report_requests/{status}/{id}.json            one record per request, by status
+#   report_requests/fingerprints/{fp}.json        topic fingerprint -> request id (dedup)
+#   report_requests/leases/{id}/{gen}.json        numbered worker leases
+#   report_requests/subscribers/{id}/{hash}.json  extra requesters of a deduplicated topic
+REPORT_REQUESTS_PREFIX = "report_requests/"
+REPORT_REQUEST_STATUSES = ("queued", "claimed", "done", "failed")
+REPORT_REQUEST_LEASE_SECONDS = 15 * 60
+REPORT_REQUEST_CLAIM_MAX = 10
+
+
+class ReportRequestClaim(BaseModel):
+    """Worker asking for queued report requests."""
+    worker: str
+    limit: int = 1
+    lease_seconds: int = REPORT_REQUEST_LEASE_SECONDS
+
+
+class ReportRequestCompletion(BaseModel):
+    """Worker reporting the outcome of a claimed request."""
+    worker: str
+    lease: int
+    status: str = "done"  # done | failed
+    report_slug: Optional[str] = None
+    note: Optional[str] = None
+
+
+def report_request_path(status: str, request_id: str) -> str:
+    return f"{REPORT_REQUESTS_PREFIX}{status}/{request_id}.json"
+
+
+def report_request_fingerprint(topic: str) -> str:
+    """Order-insensitive key for near-identical topics (same key terms, any wording/punctuation)."""
+    words = generate_claim_fingerprint(topic)["original_normalized"].split()
+    tokens = sorted({w for w in words if w not in STOP_WORDS and (len(w) > 2 or w.isdigit())})
+    basis = " ".join(tokens) if tokens else topic.lower().strip()
+    return hashlib.sha256(basis.encode()).hexdigest()[:16]
+
+
+def get_report_requests_legacy() -> list:
+    """Get the pre-migration report request array from Vercel Blob."""
     if not BLOB_READ_WRITE_TOKEN:
         return []
     try:
@@ -2505,27 +3841,133 @@ def get_report_requests() -> list:
         print(f"Error getting report requests: {e}")
         return []
 
-def save_report_requests(requests_list: list) -> bool:
-    """Save report requests to Vercel Blob."""
-    try:
-        blob_delete(REPORT_REQUESTS_PATH)
-        response = requests.put(
-            f"{BLOB_API_BASE}/{REPORT_REQUESTS_PATH}",
-            headers={
-                "Authorization": f"Bearer {BLOB_READ_WRITE_TOKEN}",
-                "Content-Type": "application/json",
-                "x-api-version": "7"
-            },
-            data=json.dumps(requests_list),
-            timeout=10
-        )
-        return response.status_code in [200, 201]
-    except Exception as e:
-        print(f"Error saving report requests: {e}")
-        return False
+
+def enqueue_report_request(record: dict) -> tuple:
+    """Queue a request unless a near-identical topic is already queued or in progress.
+
+    Returns (request_id, duplicate). A duplicate's requester is recorded as a
+    subscriber of the existing request. Costs a constant number of writes.
+    """
+    fingerprint = report_request_fingerprint(record["topic"])
+    fingerprint_path = f"{REPORT_REQUESTS_PREFIX}fingerprints/{fingerprint}.json"
+
+    if not record_create(fingerprint_path, {"request_id": record["id"], "topic": record["topic"]}):
+        existing = record_get(fingerprint_path) or {}
+        existing_id = existing.get("request_id")
+        if existing_id == record["id"]:
+            return existing_id, False
+        if existing_id:
+            email_key = waitlist_email_hash(record["email"])
+            record_create(f"{REPORT_REQUESTS_PREFIX}subscribers/{existing_id}/{email_key}.json",
+                          {"email": record["email"], "submitted_at": record["submitted_at"]})
+            return existing_id, True
+
+    if not record_put(report_request_path("queued", record["id"]), {**record, "fingerprint": fingerprint}):
+        # Don't leave the topic pointing at a request that was never queued
+        record_delete(fingerprint_path)
+        raise RecordStoreError(f"Could not queue report request {record['id']}")
+    return record["id"], False
+
+
+def list_report_requests(status: str, limit: int = 100) -> list:
+    """Records with the given status, oldest first. Only that status partition is read."""
+    records = [record for _, record in record_iter(f"{REPORT_REQUESTS_PREFIX}{status}/")]
+    records.sort(key=lambda r: r.get("submitted_at", ""))
+    return records[:limit]
+
+
+def get_report_request_lease(request_id: str) -> Optional[dict]:
+    """The newest lease taken on a request, if any."""
+    paths = record_list(f"{REPORT_REQUESTS_PREFIX}leases/{request_id}/")
+    return record_get(paths[-1]) if paths else None
+
+
+def take_report_request_lease(request_id: str, worker: str, lease_seconds: int) -> Optional[dict]:
+    """Atomically lease a request. Fails while another worker's lease is live.
+
+    Leases are numbered; taking one means creating the next number, so two
+    workers racing for the same request can't both succeed.
+    """
+    current = get_report_request_lease(request_id)
+    now = time.time()
+    if current and current.get("expires_at", 0) > now:
+        return None
+
+    lease = {
+        "request_id": request_id,
+        "worker": worker,
+        "gen": (current or {}).get("gen", 0) + 1,
+        "claimed_at": datetime.utcnow().isoformat(),
+        "expires_at": now + lease_seconds
+    }
+    if not record_create(f"{REPORT_REQUESTS_PREFIX}leases/{request_id}/{lease['gen']:06d}.json", lease):
+        return None
+    return lease
+
+
+def claim_report_requests(worker: str, limit: int, lease_seconds: int) -> list:
+    """Lease up to `limit` requests: queued ones first, then claimed ones whose lease expired."""
+    claimed = []
+    now = time.time()
+
+    candidates = [("queued", r) for r in list_report_requests("queued", limit=REPORT_REQUEST_CLAIM_MAX * 5)]
+    candidates += [
+        ("claimed", r) for r in list_report_requests("claimed", limit=REPORT_REQUEST_CLAIM_MAX * 5)
+        if r.get("lease", {}).get("expires_at", 0) <= now
+    ]
+
+    for status, record in candidates:
+        if len(claimed) >= limit:
+            break
+        lease = take_report_request_lease(record["id"], worker, lease_seconds)
+        if not lease:
+            continue
+
+        record = {**record, "status": "claimed", "lease": lease}
+        if not record_put(report_request_path("claimed", record["id"]), record):
+            # The queued record stays put; the lease just expires and the job is handed out again
+            raise RecordStoreError(f"Could not record claim on report request {record['id']}")
+        if status == "queued":
+            record_delete(report_request_path("queued", record["id"]))
+        claimed.append(record)
+
+    return claimed
+
+
+def complete_report_request(request_id: str, completion: ReportRequestCompletion) -> Optional[dict]:
+    """Move a claimed request to done/failed. Only the current lease holder may complete it."""
+    lease = get_report_request_lease(request_id)
+    if not lease or lease.get("gen") != completion.lease or lease.get("worker") != completion.worker:
+        return None
+
+    record = record_get(report_request_path("claimed", request_id))
+    if not record:
+        return None
+
+    record = {
+        **record,
+        "status": completion.status,
+        "completed_at": datetime.utcnow().isoformat(),
+        "report_slug": completion.report_slug,
+        "note": completion.note
+    }
+    if not record_put(report_request_path(completion.status, request_id), record):
+        raise RecordStoreError(f"Could not record {completion.status} for report request {request_id}")
+    record_delete(report_request_path("claimed", request_id))
+
+    # Release the topic before reading subscribers: nobody can subscribe to a
+    # finished request (and never hear back), and the topic may be requested again
+    if record.get("fingerprint"):
+        record_delete(f"{REPORT_REQUESTS_PREFIX}fingerprints/{record['fingerprint']}.json")
+
+    record["subscribers"] = [
+        sub.get("email") for _, sub in record_iter(f"{REPORT_REQUESTS_PREFIX}subscribers/{request_id}/")
+    ]
+    return record
+
 
 @app.post("/api/report-request")
-async def submit_report_request(request: ReportRequest):
+async def submit_report_request(request: ReportRequest, background_tasks: BackgroundTasks):
     """Submit a request for a custom investigation report."""
     # Validate and sanitize inputs
     topic = request.topic.strip()[:100]
@@ -2549,113 +3991,118 @@ async def submit_report_request(request: ReportRequest):
         "submitted_at": datetime.utcnow().isoformat()
     }
 
-    # Save to blob storage
-    requests_list = get_report_requests()
-    requests_list.append(request_record)
-    save_report_requests(requests_list)
+    try:
+        request_id, duplicate = await asyncio.to_thread(enqueue_report_request, request_record)
+    except RecordStoreError as e:
+        print(f"Error saving report request: {e}")
+        raise HTTPException(status_code=503, detail="Could not save request, please try again")
 
     # Send confirmation email to requester
-    requester_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px 20px; }}
-            .container {{ max-width: 600px; margin: 0 auto; background: #16161e; border-radius: 16px; padding: 40px; border: 1px solid #2a2a3a; }}
-            .logo {{ font-size: 28px; font-weight: 700; margin-bottom: 24px; }}
-            .logo-genu {{ color: #ffffff; }}
-            .logo-verity {{ color: #3b82f6; }}
-            h1 {{ font-size: 24px; margin-bottom: 16px; color: #ffffff; }}
-            p {{ color: #a0a0b0; line-height: 1.7; margin-bottom: 16px; }}
-            .highlight {{ color: #06b6d4; }}
-            .topic-box {{ background: rgba(59, 130, 246, 0.1); border: 1px solid rgba(59, 130, 246, 0.3); padding: 16px; border-radius: 8px; margin: 24px 0; }}
-            .topic-label {{ font-size: 12px; color: #6b7280; text-transform: uppercase; margin-bottom: 8px; }}
-            .topic-text {{ font-size: 18px; font-weight: 600; color: #ffffff; }}
-            .description {{ color: #a0a0b0; margin-top: 12px; font-size: 14px; }}
-            .status {{ background: rgba(245, 158, 11, 0.15); color: #f59e0b; padding: 8px 16px; border-radius: 6px; display: inline-block; font-weight: 600; margin: 16px 0; }}
-            .footer {{ margin-top: 32px; padding-top: 24px; border-top: 1px solid #2a2a3a; color: #6b7280; font-size: 14px; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="logo"><span class="logo-genu">Genu</span><span class="logo-verity">Verity</span></div>
-            <h1>Report Request Received!</h1>
-            <p>Thank you for submitting your investigation topic. Our team will review your request and begin research.</p>
-
-            <div class="topic-box">
-                <div class="topic-label">Your Requested Topic</div>
-                <div class="topic-text">{topic}</div>
-                {f'<div class="description">{description}</div>' if description else ''}
-            </div>
-
-            <div class="status">Status: Queued for Investigation</div>
-
-            <p>We'll notify you at <span class="highlight">{email}</span> when your report is ready. Most reports are completed within 48-72 hours.</p>
-
-            <p>Request ID: <code style="background: #2a2a3a; padding: 2px 8px; border-radius: 4px;">{request_record['id']}</code></p>
-
-            <div class="footer">
-                <p>&copy; 2025 GenuVerity LLC. AI-powered fact verification with human oversight.</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    send_resend_email(email, f"Report Request Received: {topic[:50]}...", requester_html)
-
-    # Send notification to admin (chris@genuverity.com)
-    admin_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 20px; background: #f5f5f5; }}
-            .container {{ max-width: 600px; margin: 0 auto; background: white; border-radius: 12px; padding: 32px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); }}
-            h1 {{ color: #1a1a1a; font-size: 22px; margin-bottom: 24px; }}
-            .field {{ margin-bottom: 20px; }}
-            .label {{ font-weight: 600; color: #666; font-size: 12px; text-transform: uppercase; margin-bottom: 6px; }}
-            .value {{ font-size: 16px; color: #1a1a1a; padding: 12px; background: #f8f9fa; border-radius: 6px; }}
-            .description {{ white-space: pre-wrap; }}
-            .meta {{ color: #888; font-size: 14px; margin-top: 24px; padding-top: 16px; border-top: 1px solid #eee; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>New Report Request</h1>
-
-            <div class="field">
-                <div class="label">Topic</div>
-                <div class="value"><strong>{topic}</strong></div>
-            </div>
-
-            <div class="field">
-                <div class="label">Description</div>
-                <div class="value description">{description if description else '(No description provided)'}</div>
-            </div>
-
-            <div class="field">
-                <div class="label">Requester Email</div>
-                <div class="value">{email}</div>
-            </div>
-
-            <div class="meta">
-                <p><strong>Request ID:</strong> {request_record['id']}</p>
-                <p><strong>Submitted:</strong> {request_record['submitted_at']}</p>
-                <p><strong>Total Requests:</strong> {len(requests_list)}</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    send_resend_email("chris@genuverity.com", f"[NEW REQUEST] {topic[:60]}", admin_html)
+    requester_html = render_email(
+        "report_request_requester",
+        topic=topic,
+        description_html=render_email("report_request_description", description=description) if description else "",
+        email=email,
+        request_id=request_id
+    )
+    email_queue.enqueue(email, f"Report Request Received: {topic[:50]}...", requester_html,
+                        idempotency_key=f"report-request-{request_id}-{waitlist_email_hash(email)}")
+
+    # Send notification to admin (chris@genuverity.com) for new topics only
+    if not duplicate:
+        admin_html = render_email(
+            "report_request_admin",
+            topic=topic,
+            description=description or "(No description provided)",
+            email=email,
+            request_id=request_id,
+            submitted_at=request_record['submitted_at']
+        )
+        email_queue.enqueue("chris@genuverity.com", f"[NEW REQUEST] {topic[:60]}", admin_html,
+                            idempotency_key=f"report-request-{request_id}-admin")
+    background_tasks.add_task(email_queue.flush)
 
     return {
         "success": True,
         "message": "Your report request has been submitted! Check your email for confirmation.",
-        "request_id": request_record['id']
+        "request_id": request_id,
+        "duplicate": duplicate
     }
 
 
+def require_admin(request: Request):
+    auth = request.headers.get("Authorization", "")
+    if not ADMIN_SECRET or auth != f"Bearer {ADMIN_SECRET}":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+
+@app.get("/api/admin/report-requests")
+async def admin_list_report_requests(request: Request, status: str = "queued", limit: int = 100):
+    """List report requests in one status partition (default: the work queue)."""
+    require_admin(request)
+    if status not in REPORT_REQUEST_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of {', '.join(REPORT_REQUEST_STATUSES)}")
+
+    records = await asyncio.to_thread(list_report_requests, status, max(1, min(limit, 500)))
+    return {"status": status, "count": len(records), "requests": records}
+
+
+@app.post("/api/admin/report-requests/claim")
+async def admin_claim_report_requests(request: Request, claim: ReportRequestClaim):
+    """Lease queued requests to a worker. Unfinished leases expire and are handed out again."""
+    require_admin(request)
+    limit = max(1, min(claim.limit, REPORT_REQUEST_CLAIM_MAX))
+    lease_seconds = max(60, min(claim.lease_seconds, 24 * 3600))
+
+    try:
+        claimed = await asyncio.to_thread(claim_report_requests, claim.worker, limit, lease_seconds)
+    except RecordStoreError as e:
+        print(f"Error claiming report requests: {e}")
+        raise HTTPException(status_code=503, detail="Could not claim requests, please try again")
+    return {"worker": claim.worker, "claimed": claimed}
+
+
+@app.post("/api/admin/report-requests/{request_id}/complete")
+async def admin_complete_report_request(request_id: str, request: Request, completion: ReportRequestCompletion):
+    """Mark a claimed request done or failed (lease holder only)."""
+    require_admin(request)
+    if completion.status not in ("done", "failed"):
+        raise HTTPException(status_code=400, detail="status must be done or failed")
+    if not re.match(r'^[a-f0-9]{12}$', request_id):
+        raise HTTPException(status_code=400, detail="Invalid request id")
+
+    try:
+        record = await asyncio.to_thread(complete_report_request, request_id, completion)
+    except RecordStoreError as e:
+        print(f"Error completing report request: {e}")
+        raise HTTPException(status_code=503, detail="Could not save the outcome, please try again")
+    if not record:
+        raise HTTPException(status_code=409, detail="Request is not leased to this worker")
+    return {"success": True, "request": record}
+
+
+@app.post("/api/admin/migrate-report-requests")
+async def migrate_report_requests(request: Request):
+    """Copy the legacy report_requests/_index.json array into the queue (idempotent)."""
+    require_admin(request)
+
+    def migrate():
+        legacy = get_report_requests_legacy()
+        added = 0
+        for entry in sorted(legacy, key=lambda r: r.get("submitted_at", "")):
+            if not entry.get("id") or not entry.get("topic"):
+                continue
+            if record_exists(report_request_path("queued", entry["id"])):
+                continue
+            _, duplicate = enqueue_report_request({**entry, "email": (entry.get("email") or "").strip().lower()})
+            if not duplicate:
+                added += 1
+        return len(legacy), added
+
+    total, added = await asyncio.to_thread(migrate)
+    return {"success": True, "legacy_count": total, "migrated": added, "skipped": total - added}
+
+
 # === REPORT FEEDBACK ===
 
 class ReportFeedback(BaseModel):
@@ -2665,10 +4112,53 @@ class ReportFeedback(BaseModel):
     comment: Optional[str] = None
     email: Optional[str] = None
 
+# Legacy single-array store, read only by the migration endpoint
 FEEDBACK_PATH = "feedback/_index.json"
 
-def get_feedback() -> list:
-    """Get all feedback from Vercel Blob."""
+# Append-log layout, partitioned by report:
+#   feedback/{slug}/log/{seq}.json   one record per submission, numbered slots
+#   feedback/{slug}/ids/{id}.json    uniqueness marker (makes re-submits idempotent)
+#   feedback/{slug}/_summary.json    count / mean / histogram up to `seq`
+FEEDBACK_PREFIX = "feedback/"
+FEEDBACK_SLUG_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]{0,150}$")
+
+_feedback_summary_locks: dict = {}
+
+
+def feedback_log_path(slug: str, seq: int) -> str:
+    return f"{FEEDBACK_PREFIX}{slug}/log/{seq:08d}.json"
+
+
+def feedback_summary_path(slug: str) -> str:
+    return f"{FEEDBACK_PREFIX}{slug}/_summary.json"
+
+
+def empty_feedback_summary(slug: str) -> dict:
+    return {
+        "slug": slug,
+        "count": 0,
+        "rating_total": 0,
+        "mean_rating": None,
+        "histogram": {str(r): 0 for r in range(1, 6)},
+        "seq": 0,
+        "updated_at": None
+    }
+
+
+def apply_feedback(summary: dict, record: dict, seq: int) -> dict:
+    """Fold one log record into a summary."""
+    rating = record.get("rating")
+    if isinstance(rating, int) and 1 <= rating <= 5:
+        summary["count"] += 1
+        summary["rating_total"] += rating
+        summary["histogram"][str(rating)] += 1
+        summary["mean_rating"] = round(summary["rating_total"] / summary["count"], 3)
+    summary["seq"] = max(summary["seq"], seq)
+    return summary
+
+
+def get_feedback_legacy() -> list:
+    """Get the pre-migration feedback array from Vercel Blob."""
     if not BLOB_READ_WRITE_TOKEN:
         return []
     try:
@@ -2688,32 +4178,89 @@ def get_feedback() -> list:
         print(f"Error getting feedback: {e}")
         return []
 
-def save_feedback(feedback_list: list) -> bool:
-    """Save feedback to Vercel Blob."""
+
+def rebuild_feedback_summary(slug: str) -> dict:
+    """Recompute a report's summary from its full log (used when the summary is missing)."""
+    summary = empty_feedback_summary(slug)
+    for path, record in record_iter(f"{FEEDBACK_PREFIX}{slug}/log/"):
+        seq = int(path.rsplit("/", 1)[-1].split(".")[0])
+        apply_feedback(summary, record, seq)
+    summary["updated_at"] = datetime.utcnow().isoformat()
+    return summary
+
+
+def update_feedback_summary(slug: str) -> dict:
+    """Bring the stored summary up to date with the log and persist it.
+
+    Starts from the stored summary and folds in only the log slots after its
+    `seq`, so each update costs one small read plus the new records. Another
+    instance can briefly overwrite it with an older `seq`; the next update
+    folds the missing slots back in.
+    """
+    import threading
+
+    lock = _feedback_summary_locks.setdefault(slug, threading.Lock())
+    with lock:
+        summary = record_get(feedback_summary_path(slug))
+        if not summary:
+            summary = rebuild_feedback_summary(slug)
+        else:
+            while True:
+                record = record_get(feedback_log_path(slug, summary["seq"] + 1))
+                if record is None:
+                    break
+                apply_feedback(summary, record, summary["seq"] + 1)
+            summary["updated_at"] = datetime.utcnow().isoformat()
+
+        record_put(feedback_summary_path(slug), summary)
+        return summary
+
+
+def get_feedback_summary(slug: str) -> dict:
+    """Read a report's summary document, rebuilding it from the log if missing."""
+    summary = record_get(feedback_summary_path(slug))
+    if summary:
+        return summary
+
+    # Only persist a rebuilt summary for reports that actually have feedback
+    summary = rebuild_feedback_summary(slug)
+    if summary["seq"]:
+        record_put(feedback_summary_path(slug), summary)
+    return summary
+
+
+def add_feedback(record: dict) -> Optional[int]:
+    """Append a feedback record to its report's log. Returns the log slot, or None for a duplicate id."""
+    slug = record["report_slug"]
+    id_path = f"{FEEDBACK_PREFIX}{slug}/ids/{record['id']}.json"
+    if not record_create(id_path, {"submitted_at": record["submitted_at"]}):
+        return None
+
+    # Same as waitlist signups: if the slot can't be claimed, release the id so a retry isn't dropped
     try:
-        blob_delete(FEEDBACK_PATH)
-        response = requests.put(
-            f"{BLOB_API_BASE}/{FEEDBACK_PATH}",
-            headers={
-                "Authorization": f"Bearer {BLOB_READ_WRITE_TOKEN}",
-                "Content-Type": "application/json",
-                "x-api-version": "7"
-            },
-            data=json.dumps(feedback_list),
-            timeout=10
-        )
-        return response.status_code in [200, 201]
-    except Exception as e:
-        print(f"Error saving feedback: {e}")
-        return False
+        summary = record_get(feedback_summary_path(slug)) or {}
+        seq = summary.get("seq", 0) + 1
+        while not record_create(feedback_log_path(slug, seq), {**record, "seq": seq}):
+            seq += 1
+    except Exception:
+        record_delete(id_path)
+        raise
+
+    update_feedback_summary(slug)
+    return seq
+
 
 @app.post("/api/feedback")
-async def submit_feedback(feedback: ReportFeedback):
+async def submit_feedback(feedback: ReportFeedback, background_tasks: BackgroundTasks):
     """Submit feedback for a report."""
     # Validate rating
     if feedback.rating < 1 or feedback.rating > 5:
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 5")
 
+    slug = feedback.report_slug.strip().lower()
+    if not FEEDBACK_SLUG_PATTERN.match(slug):
+        raise HTTPException(status_code=400, detail="Invalid report slug")
+
     # Sanitize comment
     comment = feedback.comment.strip()[:500] if feedback.comment else None
     email = feedback.email.strip().lower() if feedback.email else None
@@ -2724,36 +4271,35 @@ async def submit_feedback(feedback: ReportFeedback):
 
     # Create feedback record
     feedback_record = {
-        "id": hashlib.sha256(f"{feedback.report_slug}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:12],
-        "report_slug": feedback.report_slug,
+        "id": hashlib.sha256(f"{slug}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:12],
+        "report_slug": slug,
         "rating": feedback.rating,
         "comment": comment,
         "email": email,
         "submitted_at": datetime.utcnow().isoformat()
     }
 
-    # Save to blob storage
-    feedback_list = get_feedback()
-    feedback_list.append(feedback_record)
-    save_feedback(feedback_list)
+    try:
+        await asyncio.to_thread(add_feedback, feedback_record)
+    except RecordStoreError as e:
+        print(f"Error saving feedback: {e}")
+        raise HTTPException(status_code=503, detail="Could not save feedback, please try again")
 
     # Notify admin if rating is low (1-2) or has a comment
     if feedback.rating <= 2 or comment:
         stars = "" * feedback.rating + "" * (5 - feedback.rating)
-        admin_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <body style="font-family: -apple-system, sans-serif; padding: 20px;">
-            <h2>Report Feedback Received</h2>
-            <p><strong>Report:</strong> {feedback.report_slug}</p>
-            <p><strong>Rating:</strong> {stars} ({feedback.rating}/5)</p>
-            <p><strong>Comment:</strong> {comment if comment else '(none)'}</p>
-            <p><strong>Email:</strong> {email if email else '(anonymous)'}</p>
-            <p style="color: #888; font-size: 12px;">Submitted: {feedback_record['submitted_at']}</p>
-        </body>
-        </html>
-        """
-        send_resend_email("chris@genuverity.com", f"[FEEDBACK] {feedback.report_slug} - {feedback.rating}/5 stars", admin_html)
+        admin_html = render_email(
+            "feedback_admin",
+            slug=slug,
+            stars=stars,
+            rating=feedback.rating,
+            comment=comment or "(none)",
+            email=email or "(anonymous)",
+            submitted_at=feedback_record['submitted_at']
+        )
+        email_queue.enqueue("chris@genuverity.com", f"[FEEDBACK] {slug} - {feedback.rating}/5 stars", admin_html,
+                            idempotency_key=f"feedback-{feedback_record['id']}")
+        background_tasks.add_task(email_queue.flush)
 
     return {
         "success": True,
@@ -2761,6 +4307,39 @@ async def submit_feedback(feedback: ReportFeedback):
     }
 
 
+@app.get("/api/feedback/{slug}/summary")
+async def feedback_summary(slug: str):
+    """Rating count, mean and histogram for one report (public)."""
+    slug = slug.strip().lower()
+    if not FEEDBACK_SLUG_PATTERN.match(slug):
+        raise HTTPException(status_code=400, detail="Invalid report slug")
+
+    summary = await asyncio.to_thread(get_feedback_summary, slug)
+    return {k: v for k, v in summary.items() if k != "rating_total"}
+
+
+@app.post("/api/admin/migrate-feedback")
+async def migrate_feedback(request: Request):
+    """Copy the legacy feedback/_index.json array into the per-report logs (idempotent)."""
+    auth = request.headers.get("Authorization", "")
+    if not ADMIN_SECRET or auth != f"Bearer {ADMIN_SECRET}":
+        raise HTTPException(status_code=401, detail="Unauthorized")
+
+    def migrate():
+        legacy = get_feedback_legacy()
+        added = 0
+        for entry in sorted(legacy, key=lambda f: f.get("submitted_at", "")):
+            slug = (entry.get("report_slug") or "").strip().lower()
+            if not entry.get("id") or not FEEDBACK_SLUG_PATTERN.match(slug):
+                continue
+            if add_feedback({**entry, "report_slug": slug}):
+                added += 1
+        return len(legacy), added
+
+    total, added = await asyncio.to_thread(migrate)
+    return {"success": True, "legacy_count": total, "migrated": added, "skipped": total - added}
+
+
 # === TAGLINE SURVEY ===
 
 class TaglineSurvey(BaseModel):
@@ -2768,7 +4347,7 @@ class TaglineSurvey(BaseModel):
     taglines: list[str]
 
 @app.post("/api/tagline-survey")
-async def submit_tagline_survey(survey: TaglineSurvey):
+async def submit_tagline_survey(survey: TaglineSurvey, background_tasks: BackgroundTasks):
     """Submit tagline survey responses."""
     if not survey.taglines:
         raise HTTPException(status_code=400, detail="No taglines selected")
@@ -2777,96 +4356,37 @@ async def submit_tagline_survey(survey: TaglineSurvey):
         raise HTTPException(status_code=400, detail="Email required")
 
     # Build admin notification email
-    admin_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px; }}
-            .container {{ max-width: 600px; margin: 0 auto; background: #111827; border-radius: 16px; padding: 32px; border: 1px solid rgba(59, 130, 246, 0.2); }}
-            h1 {{ color: #06b6d4; font-size: 1.5rem; margin-bottom: 24px; }}
-            .respondent {{ color: #3b82f6; font-weight: 600; font-size: 1.1rem; margin-bottom: 20px; }}
-            .count {{ color: #a0aec0; margin-bottom: 24px; }}
-            .tagline {{ background: rgba(59, 130, 246, 0.1); border: 1px solid rgba(59, 130, 246, 0.2); border-radius: 8px; padding: 12px 16px; margin-bottom: 8px; color: #ffffff; }}
-            .footer {{ margin-top: 32px; padding-top: 20px; border-top: 1px solid rgba(59, 130, 246, 0.2); color: #64748b; font-size: 0.85rem; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Tagline Survey Response</h1>
-            <div class="respondent">From: {survey.email}</div>
-            <div class="count">Selected {len(survey.taglines)} tagline(s):</div>
-            {"".join([f'<div class="tagline">{t}</div>' for t in survey.taglines])}
-            <div class="footer">
-                Submitted via GenuVerity Tagline Survey
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    admin_html = render_email(
+        "tagline_admin",
+        email=survey.email,
+        count=len(survey.taglines),
+        taglines_html=render_email_items("tagline_item", survey.taglines)
+    )
+
+    survey_key = hashlib.sha256(f"{survey.email}|{'|'.join(survey.taglines)}".encode()).hexdigest()[:16]
 
     # Send to admin
-    send_resend_email(
+    email_queue.enqueue(
         "chris@genuverity.com",
         f"[TAGLINE SURVEY] {survey.email} selected {len(survey.taglines)} taglines",
-        admin_html
+        admin_html,
+        idempotency_key=f"tagline-{survey_key}-admin"
     )
 
     # Send thank you to respondent
-    thank_you_html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0a0a12; color: #ffffff; padding: 40px; margin: 0; }}
-            .container {{ max-width: 600px; margin: 0 auto; background: #111827; border-radius: 16px; padding: 40px; border: 1px solid rgba(59, 130, 246, 0.2); }}
-            .logo {{ font-size: 1.75rem; font-weight: 700; margin-bottom: 32px; }}
-            .logo-genu {{ color: #ffffff; }}
-            .logo-verity {{ color: #3b82f6; }}
-            h1 {{ color: #ffffff; font-size: 1.5rem; margin-bottom: 20px; }}
-            p {{ color: #a0aec0; font-size: 1rem; line-height: 1.7; margin-bottom: 16px; }}
-            .highlight {{ color: #06b6d4; font-weight: 600; }}
-            .taglines-box {{ background: rgba(6, 182, 212, 0.1); border: 1px solid rgba(6, 182, 212, 0.2); border-radius: 12px; padding: 20px; margin: 24px 0; }}
-            .taglines-title {{ color: #06b6d4; font-size: 0.85rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.05em; margin-bottom: 12px; }}
-            .tagline-item {{ color: #ffffff; padding: 8px 0; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-            .tagline-item:last-child {{ border-bottom: none; }}
-            .cta {{ display: inline-block; margin-top: 24px; padding: 14px 28px; background: linear-gradient(135deg, #3b82f6, #06b6d4); border-radius: 10px; color: white; text-decoration: none; font-weight: 600; }}
-            .footer {{ margin-top: 40px; padding-top: 24px; border-top: 1px solid rgba(59, 130, 246, 0.2); color: #64748b; font-size: 0.85rem; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="logo">
-                <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
-            </div>
-            <h1>Thanks for your feedback!</h1>
-            <p>Your input is incredibly valuable as we finalize the GenuVerity brand. We're building something we think will genuinely help people cut through the noise and find the truth faster.</p>
-
-            <div class="taglines-box">
-                <div class="taglines-title">Your picks ({len(survey.taglines)} selected)</div>
-                {"".join([f'<div class="tagline-item">{t}</div>' for t in survey.taglines])}
-            </div>
-
-            <p>We'll be launching soon with <span class="highlight">real-time fact-checking</span> that tracks viral claims as they spread and delivers source-heavy investigative reports back to where the conversation is happening.</p>
-
-            <p>Want to be first to know when we go live?</p>
-
-            <a href="https://genuverity7.vercel.app/" class="cta">Sign Up for Early Access</a>
-
-            <div class="footer">
-                <p>Thanks again for helping shape GenuVerity.</p>
-                <p style="margin-top: 8px;">— Chris</p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
+    thank_you_html = render_email(
+        "tagline_thanks",
+        count=len(survey.taglines),
+        taglines_html=render_email_items("tagline_pick", survey.taglines)
+    )
 
-    send_resend_email(
+    email_queue.enqueue(
         survey.email,
         "Thanks for your tagline feedback!",
-        thank_you_html
+        thank_you_html,
+        idempotency_key=f"tagline-{survey_key}-thanks"
     )
+    background_tasks.add_task(email_queue.flush)
 
     return {
         "success": True,
@@ -2876,11 +4396,240 @@ async def submit_tagline_survey(survey: TaglineSurvey):
 
 # === FRED API PROXY (Protects API Key) ===
 
+FRED_API_URL = "https://api.stlouisfed.org/fred/series/observations"
+
+# Whitelist of allowed series to prevent abuse
+FRED_ALLOWED_SERIES = {
+    "WALCL", "M2SL", "CPIAUCSL", "UNRATE", "GDP",
+    "FEDFUNDS", "DFF", "T10Y2Y", "MORTGAGE30US",
+    "DEXUSEU", "DTWEXBGS", "VIXCLS", "SP500",
+    "CURRCIR"  # Currency in Circulation - for debunking "cash ban" claims
+}
+
+FRED_HISTORY_START = "2000-01-01"     # First fetch of a series pulls everything since this date
+FRED_REFRESH_INTERVAL = 6 * 3600      # Weekly/monthly series rarely change faster than this
+FRED_MAX_LIMIT = 5000                 # Largest window served from the cache
+
+
+def normalize_fred_key(raw_key: Optional[str]) -> Optional[str]:
+    """Strip whitespace/quotes that might have been added accidentally; FRED keys are 32 chars."""
+    key = (raw_key or "").strip().strip('"').strip("'")
+    return key if len(key) == 32 else None
+
+
+# Validated once at import instead of on every request
+FRED_KEY = normalize_fred_key(FRED_API_KEY)
+if FRED_API_KEY and not FRED_KEY:
+    print("FRED_API_KEY is set but is not a valid 32-character key")
+
+# Local time-series store: series_id -> {observations (oldest first), last_date, fetched_at, refreshed_at}
+_fred_series_cache: dict = {}
+_fred_series_locks: dict = {}
+
+
+class FredUpstreamError(Exception):
+    """FRED returned a non-200 response."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"FRED API returned {status_code}")
+        self.status_code = status_code
+
+
+def fetch_fred_observations(series_id: str, observation_start: str) -> list:
+    """Fetch observations from `observation_start` onward, oldest first."""
+    response = requests.get(
+        FRED_API_URL,
+        params={
+            "series_id": series_id,
+            "api_key": FRED_KEY,
+            "file_type": "json",
+            "observation_start": observation_start,
+            "sort_order": "asc"
+        },
+        timeout=10
+    )
+
+    if response.status_code != 200:
+        print(f"FRED API returned {response.status_code} for {series_id}: {response.text[:500]}")
+        raise FredUpstreamError(response.status_code)
+
+    return response.json().get("observations", [])
+
+
+def get_fred_series(series_id: str) -> dict:
+    """Return the cached series, refreshing it incrementally when stale.
+
+    A refresh only asks FRED for observations on or after the last cached
+    date (re-fetching that date picks up revisions). If FRED is unreachable
+    a stale copy is served rather than failing the chart.
+    """
+    import threading
+
+    entry = _fred_series_cache.get(series_id)
+    if entry is None:
+        entry = ttl_cache_get("fred", series_id, float("inf"))
+        if entry:
+            _fred_series_cache[series_id] = entry
+
+    if entry and time.time() - entry["refreshed_at"] < FRED_REFRESH_INTERVAL:
+        return entry
+
+    lock = _fred_series_locks.setdefault(series_id, threading.Lock())
+    with lock:
+        # Another request may have refreshed while we waited
+        entry = _fred_series_cache.get(series_id, entry)
+        if entry and time.time() - entry["refreshed_at"] < FRED_REFRESH_INTERVAL:
+            return entry
+
+        start = entry["last_date"] if entry else FRED_HISTORY_START
+        try:
+            new_observations = fetch_fred_observations(series_id, start)
+        except Exception as e:
+            if entry:
+                print(f"FRED refresh failed for {series_id}, serving cached copy: {e}")
+                return entry
+            raise
+
+        by_date = {o["date"]: o for o in (entry["observations"] if entry else [])}
+        for obs in new_observations:
+            by_date[obs["date"]] = obs
+        observations = [by_date[d] for d in sorted(by_date)]
+
+        entry = {
+            "series_id": series_id,
+            "observations": observations,
+            "last_date": observations[-1]["date"] if observations else start,
+            "fetched_at": datetime.utcnow().isoformat(),
+            "refreshed_at": time.time()
+        }
+        _fred_series_cache[series_id] = entry
+        ttl_cache_put("fred", series_id, entry)
+
+        print(f"FRED {series_id}: +{len(new_observations)} observations since {start} ({len(observations)} cached)")
+        return entry
+
+
+def validate_fred_series_id(series_id: str) -> str:
+    """Upper-case a series ID and reject anything outside the whitelist."""
+    if not FRED_API_KEY:
+        raise HTTPException(status_code=503, detail="FRED API not configured")
+    if not FRED_KEY:
+        raise HTTPException(status_code=503, detail="FRED API key invalid or missing")
+
+    series_id = series_id.upper()
+    if series_id not in FRED_ALLOWED_SERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Series not allowed. Supported: {', '.join(sorted(FRED_ALLOWED_SERIES))}"
+        )
+    return series_id
+
+
+FRED_BATCH_MAX_SERIES = 8
+FRED_FREQUENCIES = {"w", "m", "q", "a"}
+
+
+def fred_period_start(date_str: str, frequency: str) -> str:
+    """Map an observation date to the first day of its week/month/quarter/year."""
+    from datetime import date, timedelta
+
+    d = date.fromisoformat(date_str)
+    if frequency == "w":
+        d = d - timedelta(days=d.weekday())
+    elif frequency == "m":
+        d = d.replace(day=1)
+    elif frequency == "q":
+        d = d.replace(month=(d.month - 1) // 3 * 3 + 1, day=1)
+    elif frequency == "a":
+        d = d.replace(month=1, day=1)
+    return d.isoformat()
+
+
+def align_fred_series(entries: dict, frequency: Optional[str] = None, limit: int = 52, start: Optional[str] = None) -> dict:
+    """Align several cached series on one shared date axis (columnar).
+
+    With a frequency, each series is downsampled to the last observation in
+    each period. Dates where a series has no value are null in its column.
+    """
+    columns = {}
+    for series_id, entry in entries.items():
+        points = {}
+        for obs in entry["observations"]:  # Oldest first, so later obs win their period
+            try:
+                value = float(obs["value"])
+            except (TypeError, ValueError):
+                value = None  # FRED uses "." for missing values
+            key = fred_period_start(obs["date"], frequency) if frequency else obs["date"]
+            if value is not None or key not in points:
+                points[key] = value
+        columns[series_id] = points
+
+    all_dates = set()
+    for points in columns.values():
+        all_dates.update(points)
+    dates = sorted(d for d in all_dates if not start or d >= start)
+    dates = dates[-max(1, min(limit, FRED_MAX_LIMIT)):]
+
+    return {
+        "dates": dates,
+        "values": {series_id: [points.get(d) for d in dates] for series_id, points in columns.items()}
+    }
+
+
+@app.get("/api/fred/batch")
+async def get_fred_batch(series: str, limit: int = 52, frequency: Optional[str] = None, start: Optional[str] = None):
+    """
+    Several FRED series in one round trip, aligned on a shared date axis.
+
+    Example: /api/fred/batch?series=M2SL,CPIAUCSL,FEDFUNDS&frequency=m&limit=120
+    Missing series are fetched concurrently; cached ones cost no upstream call.
+    """
+    series_ids = list(dict.fromkeys(s.strip().upper() for s in series.split(",") if s.strip()))
+    if not series_ids:
+        raise HTTPException(status_code=400, detail="No series requested")
+    if len(series_ids) > FRED_BATCH_MAX_SERIES:
+        raise HTTPException(status_code=400, detail=f"Too many series (max {FRED_BATCH_MAX_SERIES})")
+    if frequency and frequency.lower() not in FRED_FREQUENCIES:
+        raise HTTPException(status_code=400, detail=f"Frequency must be one of: {', '.join(sorted(FRED_FREQUENCIES))}")
+
+    series_ids = [validate_fred_series_id(s) for s in series_ids]
+
+    results = await asyncio.gather(
+        *[asyncio.to_thread(get_fred_series, s) for s in series_ids],
+        return_exceptions=True
+    )
+
+    entries = {}
+    errors = {}
+    for series_id, result in zip(series_ids, results):
+        if isinstance(result, Exception):
+            print(f"FRED batch error for {series_id}: {type(result).__name__}: {result}")
+            errors[series_id] = "FRED API timeout" if isinstance(result, requests.Timeout) else str(result)
+        else:
+            entries[series_id] = result
+
+    aligned = align_fred_series(entries, frequency.lower() if frequency else None, limit, start)
+
+    response = {
+        "series": list(entries),
+        "frequency": frequency.lower() if frequency else None,
+        **aligned,
+        "fetched_at": {series_id: entry["fetched_at"] for series_id, entry in entries.items()},
+        "source": "Federal Reserve Economic Data (FRED)",
+        "source_urls": {series_id: f"https://fred.stlouisfed.org/series/{series_id}" for series_id in series_ids}
+    }
+    if errors:
+        response["errors"] = errors
+    return response
+
+
 @app.get("/api/fred/{series_id}")
 async def get_fred_data(series_id: str, limit: int = 52):
     """
     Proxy endpoint for FRED API data.
     Protects the API key while allowing frontend to fetch live economic data.
+    Observations are served from a local per-series cache; FRED is only
+    contacted for new observations once the cache is stale.
 
     Supported series:
     - WALCL: Fed Total Assets (weekly)
@@ -2889,69 +4638,19 @@ async def get_fred_data(series_id: str, limit: int = 52):
     - UNRATE: Unemployment Rate (monthly)
     - GDP: Gross Domestic Product (quarterly)
     """
-    if not FRED_API_KEY:
-        print(f"FRED_API_KEY not found in environment")
-        raise HTTPException(status_code=503, detail="FRED API not configured")
-
-    # Get API key fresh from environment (in case module-level load failed)
-    # Strip any whitespace/quotes that might have been added accidentally
-    raw_key = os.getenv("FRED_API_KEY") or FRED_API_KEY or ""
-    fred_key = raw_key.strip().strip('"').strip("'")
-    print(f"FRED request for series: {series_id}, key length: {len(fred_key)}, first/last char: '{fred_key[:1]}...{fred_key[-1:]}'")
-
-    if not fred_key or len(fred_key) != 32:
-        print(f"Invalid FRED key: raw length={len(raw_key)}, stripped length={len(fred_key)}")
-        raise HTTPException(status_code=503, detail="FRED API key invalid or missing")
-
-    # Whitelist of allowed series to prevent abuse
-    allowed_series = {
-        "WALCL", "M2SL", "CPIAUCSL", "UNRATE", "GDP",
-        "FEDFUNDS", "DFF", "T10Y2Y", "MORTGAGE30US",
-        "DEXUSEU", "DTWEXBGS", "VIXCLS", "SP500",
-        "CURRCIR"  # Currency in Circulation - for debunking "cash ban" claims
-    }
-
-    if series_id.upper() not in allowed_series:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Series not allowed. Supported: {', '.join(sorted(allowed_series))}"
-        )
+    series_id = validate_fred_series_id(series_id)
 
     try:
-        response = requests.get(
-            "https://api.stlouisfed.org/fred/series/observations",
-            params={
-                "series_id": series_id.upper(),
-                "api_key": fred_key,
-                "file_type": "json",
-                "limit": min(limit, 100),  # Cap at 100 observations
-                "sort_order": "desc"
-            },
-            timeout=10
-        )
-
-        if response.status_code != 200:
-            print(f"FRED API returned {response.status_code}: {response.text[:500]}")
-            return {
-                "series_id": series_id.upper(),
-                "observations": [],
-                "error": f"FRED API returned {response.status_code}",
-                "fetched_at": datetime.utcnow().isoformat(),
-                "source": "Federal Reserve Economic Data (FRED)",
-                "source_url": f"https://fred.stlouisfed.org/series/{series_id.upper()}"
-            }
-
-        data = response.json()
-
-        # Return observations with series metadata
+        entry = await asyncio.to_thread(get_fred_series, series_id)
+    except FredUpstreamError as e:
         return {
-            "series_id": series_id.upper(),
-            "observations": data.get("observations", []),
+            "series_id": series_id,
+            "observations": [],
+            "error": str(e),
             "fetched_at": datetime.utcnow().isoformat(),
             "source": "Federal Reserve Economic Data (FRED)",
-            "source_url": f"https://fred.stlouisfed.org/series/{series_id.upper()}"
+            "source_url": f"https://fred.stlouisfed.org/series/{series_id}"
         }
-
     except requests.Timeout:
         raise HTTPException(status_code=504, detail="FRED API timeout")
     except Exception as e:
@@ -2961,6 +4660,18 @@ async def get_fred_data(series_id: str, limit: int = 52):
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Failed to fetch FRED data: {error_detail}")
 
+    # Newest first, matching FRED's sort_order=desc
+    window = max(1, min(limit, FRED_MAX_LIMIT))
+    observations = entry["observations"][-window:][::-1]
+
+    return {
+        "series_id": series_id,
+        "observations": observations,
+        "fetched_at": entry["fetched_at"],
+        "source": "Federal Reserve Economic Data (FRED)",
+        "source_url": f"https://fred.stlouisfed.org/series/{series_id}"
+    }
+
 # === CONTACT & EMAIL INTEGRATION ===
 
 class ContactRequest(BaseModel):
@@ -2971,65 +4682,43 @@ class ContactRequest(BaseModel):
 
 
 @app.post("/api/contact")
-async def handle_contact(request: ContactRequest):
-    """Handle contact form submissions by sending email via Resend."""
+async def handle_contact(request: ContactRequest, background_tasks: BackgroundTasks):
+    """Handle contact form submissions by queueing emails via Resend."""
     
     # 1. Validate Configuration
-    if not RESEND_API_KEY:
+    if not RESEND_API_KEY and not MAIL_SINK_DIR:
         print("WARNING: RESEND_API_KEY not set. Email will not be sent.")
         # We return success to the frontend even if backend email fails to avoid UX friction,
         # but we log the error. In production, this should alert.
         return {"status": "success", "message": "Message received (simulated - config missing)"}
 
-    headers = {
-        "Authorization": f"Bearer {RESEND_API_KEY}",
-        "Content-Type": "application/json"
-    }
+    contact_key = hashlib.sha256(
+        f"{request.email}|{request.inquiry_type}|{request.message}".encode()
+    ).hexdigest()[:16]
 
     # 2. Send Notification to Admin
-    admin_payload = {
-        "from": "GenuVerity Contact <system@genuverity.com>",
-        "to": [ADMIN_EMAIL],
-        "subject": f"[{request.inquiry_type.upper()}] New Contact from {request.name}",
-        "html": f"""
-        <h3>New Inquiry Received</h3>
-        <p><strong>Name:</strong> {request.name}</p>
-        <p><strong>Email:</strong> {request.email}</p>
-        <p><strong>Type:</strong> {request.inquiry_type}</p>
-        <hr>
-        <p><strong>Message:</strong></p>
-        <p style="white-space: pre-wrap;">{request.message}</p>
-        """
-    }
+    email_queue.enqueue(
+        ADMIN_EMAIL,
+        f"[{request.inquiry_type.upper()}] New Contact from {request.name}",
+        render_email(
+            "contact_admin",
+            name=request.name,
+            email=request.email,
+            inquiry_type=request.inquiry_type,
+            message=request.message
+        ),
+        from_email="GenuVerity Contact <system@genuverity.com>",
+        idempotency_key=f"contact-{contact_key}-admin"
+    )
 
     # 3. Send Auto-Reply to User
-    user_payload = {
-        "from": "Chris at GenuVerity <chris@genuverity.com>",
-        "to": [request.email],
-        "subject": "We received your message",
-        "html": f"""
-        <p>Hi {request.name},</p>
-        <p>Thanks for reaching out to GenuVerity. We've received your inquiry regarding <strong>{request.inquiry_type}</strong>.</p>
-        <p>A member of our team will review your message and get back to you shortly.</p>
-        <br>
-        <p>Best regards,</p>
-        <p><strong>Chris & The GenuVerity Team</strong></p>
-        """
-    }
-
-    try:
-        # Send Admin Email
-        r1 = requests.post("https://api.resend.com/emails", headers=headers, json=admin_payload, timeout=10)
-        if r1.status_code not in range(200, 300):
-            print(f"Resend Admin Error: {r1.text}")
-        
-        # Send User Auto-Reply
-        r2 = requests.post("https://api.resend.com/emails", headers=headers, json=user_payload, timeout=10)
-        if r2.status_code not in range(200, 300):
-            print(f"Resend User Error: {r2.text}")
-
-        return {"status": "success", "message": "Transmission complete"}
+    email_queue.enqueue(
+        request.email,
+        "We received your message",
+        render_email("contact_reply", name=request.name, inquiry_type=request.inquiry_type),
+        from_email="Chris at GenuVerity <chris@genuverity.com>",
+        idempotency_key=f"contact-{contact_key}-reply"
+    )
+    background_tasks.add_task(email_queue.flush)
 
-    except Exception as e:
-        print(f"Email Dispatch Error: {e}")
-        raise HTTPException(status_code=500, detail="Failed to dispatch email")
+    return {"status": "success", "message": "Transmission complete"}
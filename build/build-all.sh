@@ -1,11 +1,38 @@
 #!/bin/bash
 # Build all reports in /localreports/src/ to /localreports/dist/
+#
+# Only stale reports are rebuilt. localreports/dist/.build-manifest records,
+# per report, the hash of its source and of build-report.js it was built with.
+#
+#   ./build/build-all.sh            # build stale reports
+#   ./build/build-all.sh --explain  # also say why each report is rebuilt
+#   ./build/build-all.sh --force    # rebuild everything
 
 set -e
 
+EXPLAIN=0
+FORCE=0
+for arg in "$@"; do
+    case "$arg" in
+        --explain) EXPLAIN=1 ;;
+        --force) FORCE=1 ;;
+    esac
+done
+
+MANIFEST="localreports/dist/.build-manifest"
+
+hash_file() {
+    shasum -a 256 "$1" | cut -d ' ' -f 1
+}
+
 echo "🔨 Building all reports..."
 echo ""
 
+# Full-text search database for /api/search (shipped via vercel.json includeFiles);
+# indexes localreports/*.html, so it doesn't depend on the src/ build below
+python3 scripts/build_search_db.py
+echo ""
+
 # Check if src directory exists
 if [ ! -d "localreports/src" ]; then
     echo "❌ Error: localreports/src/ directory not found"
@@ -20,19 +47,51 @@ if [ "$REPORT_COUNT" -eq 0 ]; then
     exit 0
 fi
 
-echo "Found $REPORT_COUNT report(s) to build"
+echo "Found $REPORT_COUNT report(s)"
 echo ""
 
-# Build each report
+mkdir -p localreports/dist
+touch "$MANIFEST"
+BUILDER_HASH=$(hash_file build/build-report.js)
+NEXT_MANIFEST="$MANIFEST.tmp"
+: > "$NEXT_MANIFEST"
+BUILT=0
+
+# Build each stale report
 for src in localreports/src/*.html; do
     if [ -f "$src" ]; then
         filename=$(basename "$src")
         dest="localreports/dist/$filename"
-        
-        echo "Building: $filename"
-        node build/build-report.js "$src" "$dest" --validate
-        echo ""
+        src_hash=$(hash_file "$src")
+        previous=$(awk -v f="$filename" '$1 == f' "$MANIFEST")
+
+        reason=""
+        if [ "$FORCE" -eq 1 ]; then
+            reason="forced"
+        elif [ -z "$previous" ]; then
+            reason="not built yet"
+        elif [ ! -f "$dest" ]; then
+            reason="output missing"
+        elif [ "$(echo "$previous" | cut -d ' ' -f 2)" != "$src_hash" ]; then
+            reason="source changed"
+        elif [ "$(echo "$previous" | cut -d ' ' -f 3)" != "$BUILDER_HASH" ]; then
+            reason="build-report.js changed"
+        fi
+
+        if [ -n "$reason" ]; then
+            echo "Building: $filename"
+            [ "$EXPLAIN" -eq 1 ] && echo "  reason: $reason"
+            node build/build-report.js "$src" "$dest" --validate
+            BUILT=$((BUILT + 1))
+            echo ""
+        fi
+        echo "$filename $src_hash $BUILDER_HASH" >> "$NEXT_MANIFEST"
     fi
 done
 
-echo "✅ All reports built successfully"
+mv "$NEXT_MANIFEST" "$MANIFEST"
+
+# Write .gz/.br siblings for changed outputs (unchanged files are skipped)
+python3 scripts/precompress.py localreports/dist
+
+echo "✅ Built $BUILT report(s), $((REPORT_COUNT - BUILT)) up to date"
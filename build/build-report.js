@@ -18,7 +18,7 @@ const STANDARD_HEAD = `
     <script src="https://cdnjs.cloudflare.com/ajax/libs/html2canvas/1.4.1/html2canvas.min.js"></script>
 
     <!-- Search & UI Dependencies -->
-    <script src="../js/reports-data.js" defer></script>
+    <script src="../js/catalog.js" defer></script>
     <script src="../js/unified-search.js" defer></script>
     <script src="../js/copyable-sections.js" defer></script>
     <script src="../js/shared-components.js" defer></script>
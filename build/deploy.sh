@@ -0,0 +1,12 @@
+#!/bin/bash
+# Deploy-time build, run by `npm run build` (Vercel's build step).
+#
+# Generates the gitignored artifacts the deployment needs:
+#   data/search.db    full-text search index over localreports/*.html, shipped
+#                     to the API function via vercel.json includeFiles
+#   *.gz / *.br       precompressed siblings of localreports/, js/ and css/
+
+set -e
+
+python3 scripts/build_search_db.py
+python3 scripts/precompress.py
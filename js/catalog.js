@@ -0,0 +1,223 @@
+/**
+ * GVCatalog - on-demand access to the report catalog
+ *
+ * Generated by scripts/catalog.py into /js/catalog/:
+ *   manifest.json            counts, shard names, slug -> [page, verdict]
+ *   page-NNN.<hash>.json     reports in catalog order, pageSize per shard
+ *   category-<name>.<hash>.json
+ *   search.<hash>.bin        full-text index (format: lib/search_index.py)
+ *
+ * Shards are content-hashed (cached immutably), so a report page fetches the
+ * small manifest and only the shard it needs instead of all of reports-data.js.
+ * Pages that already loaded REPORTS_DATA are served from it without fetching.
+ */
+const GVCatalog = (() => {
+    const BASE = '/js/catalog/';
+    const cache = {};
+
+    function fetchJSON(file) {
+        if (!cache[file]) {
+            cache[file] = fetch(BASE + file).then(res => {
+                if (!res.ok) throw new Error(`[GV Catalog] ${file}: HTTP ${res.status}`);
+                return res.json();
+            });
+            cache[file].catch(() => delete cache[file]);
+        }
+        return cache[file];
+    }
+
+    // "localreports/x.html", "/x" and "x" all name the same report
+    function key(slug) {
+        return (slug || '').split('/').pop().replace(/\.html$/, '');
+    }
+
+    function fullData() {
+        return typeof REPORTS_DATA !== 'undefined' ? REPORTS_DATA.filter(r => r.slug && r.title) : null;
+    }
+
+    function manifest() {
+        return fetchJSON('manifest.json');
+    }
+
+    async function page(number) {
+        const m = await manifest();
+        return m.pages[number] ? fetchJSON(m.pages[number]) : [];
+    }
+
+    async function all() {
+        const data = fullData();
+        if (data) return data;
+        const m = await manifest();
+        return (await Promise.all(m.pages.map(fetchJSON))).flat();
+    }
+
+    async function category(name) {
+        const data = fullData();
+        if (data) return data.filter(r => r.category === name);
+        const m = await manifest();
+        return m.categories[name] ? fetchJSON(m.categories[name].file) : [];
+    }
+
+    async function entry(slug) {
+        const data = fullData();
+        if (data) return data.find(r => key(r.slug) === key(slug)) || null;
+        const m = await manifest();
+        const hit = m.reports[key(slug)];
+        if (!hit) return null;
+        return (await page(hit[0])).find(r => key(r.slug) === key(slug)) || null;
+    }
+
+    // Verdict straight from the manifest - no shard fetch
+    async function verdict(slug) {
+        const data = fullData();
+        if (data) {
+            const report = data.find(r => key(r.slug) === key(slug));
+            return report ? report.verdict || null : null;
+        }
+        const hit = (await manifest()).reports[key(slug)];
+        return hit ? hit[1] : null;
+    }
+
+    // === SEARCH ===
+    // Must match lib/search_index.py (tokenize, MIN_PREFIX, PREFIX_FACTOR)
+    const MIN_PREFIX = 3;
+    const PREFIX_FACTOR = 0.5;
+    let indexLoading = null;
+
+    function decodeIndex(buffer) {
+        const bytes = new Uint8Array(buffer);
+        const text = new TextDecoder();
+        let pos = 0;
+        const varint = () => {
+            let value = 0, shift = 0, byte;
+            do {
+                byte = bytes[pos++];
+                value += (byte & 0x7f) * 2 ** shift;
+                shift += 7;
+            } while (byte >= 0x80);
+            return value;
+        };
+        const string = () => {
+            const length = varint();
+            pos += length;
+            return text.decode(bytes.subarray(pos - length, pos));
+        };
+        const list = () => Array.from({ length: varint() }, string);
+
+        if (text.decode(bytes.subarray(0, 4)) !== 'GVSI') throw new Error('[GV Catalog] Not a search index');
+        pos = 4;
+        if (varint() !== 1) throw new Error('[GV Catalog] Unsupported search index version');
+        const scale = varint();
+        const stop = new Set(list());
+        const docs = list();
+
+        const terms = new Array(varint());
+        let previous = '';
+        for (let i = 0; i < terms.length; i++) {
+            const shared = varint();
+            previous = previous.slice(0, shared) + string();
+            terms[i] = previous;
+        }
+
+        // Postings stay encoded; remember where each term's list starts
+        const offsets = new Uint32Array(terms.length);
+        for (let i = 0; i < terms.length; i++) {
+            offsets[i] = pos;
+            const count = varint();
+            for (let j = 0; j < count; j++) {
+                varint();
+                pos++;
+            }
+        }
+
+        function postings(termId, visit) {
+            pos = offsets[termId];
+            const count = varint();
+            let doc = 0;
+            for (let j = 0; j < count; j++) {
+                doc += varint();
+                visit(doc, bytes[pos++]);
+            }
+        }
+        return { scale, stop, docs, terms, postings };
+    }
+
+    function searchIndex() {
+        if (!indexLoading) {
+            indexLoading = manifest()
+                .then(m => fetch(BASE + m.search))
+                .then(res => {
+                    if (!res.ok) throw new Error(`[GV Catalog] search index: HTTP ${res.status}`);
+                    return res.arrayBuffer();
+                })
+                .then(decodeIndex);
+            indexLoading.catch(() => { indexLoading = null; });
+        }
+        return indexLoading;
+    }
+
+    function tokenize(text, stop) {
+        const folded = (text || '').normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase();
+        return (folded.match(/[a-z0-9]+/g) || []).filter(t => !stop.has(t));
+    }
+
+    function lowerBound(terms, token) {
+        let low = 0, high = terms.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (terms[mid] < token) low = mid + 1; else high = mid;
+        }
+        return low;
+    }
+
+    // Ranked [{slug, score}] (slug = lookup key); every query token must match,
+    // the last one also as a prefix so results update while typing
+    function query(index, text, limit = 20) {
+        const tokens = tokenize(text, index.stop);
+        const { terms } = index;
+        let scores = null;
+
+        for (let t = 0; t < tokens.length; t++) {
+            const token = tokens[t];
+            const low = lowerBound(terms, token);
+            let high;
+            if (t === tokens.length - 1 && token.length >= MIN_PREFIX) {
+                high = lowerBound(terms, token + '\uffff');
+            } else {
+                high = terms[low] === token ? low + 1 : low;
+            }
+
+            const matched = new Map();
+            for (let id = low; id < high; id++) {
+                const factor = terms[id] === token ? 1 : PREFIX_FACTOR;
+                index.postings(id, (doc, weight) => {
+                    matched.set(doc, Math.max(matched.get(doc) || 0, weight * factor));
+                });
+            }
+            if (scores === null) {
+                scores = matched;
+            } else {
+                for (const [doc, score] of scores) {
+                    if (matched.has(doc)) scores.set(doc, score + matched.get(doc));
+                    else scores.delete(doc);
+                }
+            }
+            if (scores.size === 0) return [];
+        }
+
+        return [...(scores || [])]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([doc, score]) => ({ slug: index.docs[doc], score: score * index.scale / 25500 }));
+    }
+
+    async function search(text, limit = 20) {
+        return query(await searchIndex(), text, limit);
+    }
+
+    return { manifest, page, all, category, entry, verdict, key, search, searchIndex, query, decodeIndex };
+})();
+
+if (typeof window !== 'undefined') {
+    window.GVCatalog = GVCatalog;
+}
@@ -0,0 +1,323 @@
+// Initialize Lucide icons and copy/share functionality
+document.addEventListener('DOMContentLoaded', () => {
+    lucide.createIcons();
+    initCharts();
+    initCopyShare();
+});
+
+// Chart.js GenuVerity watermark plugin
+const watermarkPlugin = {
+    id: 'genuverityWatermark',
+    afterDraw: (chart) => {
+        const ctx = chart.ctx;
+        ctx.save();
+        ctx.font = '12px Inter';
+        ctx.textAlign = 'right';
+        ctx.textBaseline = 'bottom';
+        const x = chart.width - 10;
+        const y = chart.height - 10;
+        ctx.fillStyle = '#ffffff';
+        ctx.fillText('Genu', x - 35, y);
+        ctx.fillStyle = '#3b82f6';
+        ctx.fillText('Verity', x, y);
+        ctx.restore();
+    }
+};
+
+Chart.register(watermarkPlugin);
+
+function initCharts() {
+    Chart.defaults.color = '#a0aec0';
+    Chart.defaults.borderColor = 'rgba(59, 130, 246, 0.1)';
+    const island = document.getElementById('reportCharts');
+    if (!island) return;
+    const charts = JSON.parse(island.textContent);
+    Object.keys(charts).forEach(id => {
+        new Chart(document.getElementById(id), charts[id]);
+    });
+}
+
+// Sources banner toggle
+let bannerCollapsed = false;
+function toggleSourcesBanner() {
+    const banner = document.getElementById('sourcesBanner');
+    const chevron = document.getElementById('sourcesChevron');
+    bannerCollapsed = !bannerCollapsed;
+    banner.classList.toggle('collapsed', bannerCollapsed);
+    chevron.style.transform = bannerCollapsed ? 'rotate(-90deg)' : '';
+}
+
+// Feedback form
+async function submitFeedback(e, slug) {
+    e.preventDefault();
+    const email = document.getElementById('feedbackEmail').value;
+    const text = document.getElementById('feedbackText').value;
+
+    try {
+        await fetch('/api/feedback', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ slug, email, text })
+        });
+        alert('Thank you for your feedback!');
+        document.getElementById('feedbackForm').reset();
+    } catch (err) {
+        alert('Error submitting feedback. Please try again.');
+    }
+}
+
+// ============================================
+// Copy/Share as Image Functionality
+// ============================================
+const COPYABLE_SELECTORS = [
+    '.exec-summary',
+    '.bottom-line',
+    '.float-figure',
+    '.quote-box',
+    '.timeline',
+    '.source-card',
+    '.claim-box',
+    '.reality-box',
+    '.verdict-badge'
+];
+
+let currentShareBlob = null;
+let currentShareUrl = null;
+
+function initCopyShare() {
+    COPYABLE_SELECTORS.forEach(selector => {
+        document.querySelectorAll(selector).forEach(el => {
+            // Skip if already initialized
+            if (el.classList.contains('copyable-component')) return;
+
+            el.classList.add('copyable-component');
+
+            // Create action buttons container
+            const actions = document.createElement('div');
+            actions.className = 'component-actions';
+            actions.innerHTML = `
+                <button class="component-action-btn copy-btn" title="Copy as image">
+                    <i data-lucide="copy" style="width:16px;height:16px;"></i>
+                </button>
+                <button class="component-action-btn share-btn" title="Share">
+                    <i data-lucide="share-2" style="width:16px;height:16px;"></i>
+                </button>
+            `;
+
+            el.appendChild(actions);
+
+            // Add click handlers
+            actions.querySelector('.copy-btn').addEventListener('click', (e) => {
+                e.stopPropagation();
+                copyComponentAsImage(el, actions.querySelector('.copy-btn'));
+            });
+
+            actions.querySelector('.share-btn').addEventListener('click', (e) => {
+                e.stopPropagation();
+                shareComponent(el);
+            });
+        });
+    });
+
+    // Re-initialize lucide icons for new buttons
+    lucide.createIcons();
+}
+
+async function captureComponent(element) {
+    // Add capturing state
+    element.classList.add('capturing');
+
+    // Hide action buttons during capture
+    const actions = element.querySelector('.component-actions');
+    if (actions) actions.style.display = 'none';
+
+    try {
+        // Wait for any animations
+        await new Promise(r => setTimeout(r, 100));
+
+        // Capture with html-to-image
+        const dataUrl = await htmlToImage.toPng(element, {
+            pixelRatio: 2,
+            backgroundColor: '#0a0f1a',
+            style: {
+                transform: 'none',
+                borderRadius: '12px'
+            }
+        });
+
+        // Add GenuVerity watermark
+        const watermarkedUrl = await addWatermark(dataUrl);
+        return watermarkedUrl;
+
+    } finally {
+        element.classList.remove('capturing');
+        if (actions) actions.style.display = '';
+    }
+}
+
+function addWatermark(dataUrl) {
+    return new Promise((resolve) => {
+        const img = new Image();
+        img.onload = () => {
+            const canvas = document.createElement('canvas');
+            canvas.width = img.width;
+            canvas.height = img.height;
+            const ctx = canvas.getContext('2d');
+
+            // Draw original image
+            ctx.drawImage(img, 0, 0);
+
+            // Add watermark background pill
+            const padding = 12;
+            const text = 'GenuVerity';
+            ctx.font = 'bold 24px Inter, sans-serif';
+            const textWidth = ctx.measureText(text).width;
+            const pillWidth = textWidth + padding * 2;
+            const pillHeight = 36;
+            const pillX = canvas.width - pillWidth - 16;
+            const pillY = canvas.height - pillHeight - 16;
+
+            // Draw pill background
+            ctx.fillStyle = 'rgba(5, 10, 20, 0.85)';
+            ctx.beginPath();
+            ctx.roundRect(pillX, pillY, pillWidth, pillHeight, 8);
+            ctx.fill();
+
+            // Draw text
+            ctx.textBaseline = 'middle';
+            ctx.textAlign = 'left';
+            const textY = pillY + pillHeight / 2;
+
+            // "Genu" in white
+            ctx.fillStyle = '#ffffff';
+            ctx.fillText('Genu', pillX + padding, textY);
+
+            // "Verity" in blue
+            const genuWidth = ctx.measureText('Genu').width;
+            ctx.fillStyle = '#3b82f6';
+            ctx.fillText('Verity', pillX + padding + genuWidth, textY);
+
+            resolve(canvas.toDataURL('image/png'));
+        };
+        img.src = dataUrl;
+    });
+}
+
+async function copyComponentAsImage(element, button) {
+    try {
+        const dataUrl = await captureComponent(element);
+
+        // Convert to blob
+        const response = await fetch(dataUrl);
+        const blob = await response.blob();
+
+        // Try clipboard API
+        if (navigator.clipboard && navigator.clipboard.write) {
+            await navigator.clipboard.write([
+                new ClipboardItem({ 'image/png': blob })
+            ]);
+
+            // Success feedback
+            button.classList.add('success');
+            button.innerHTML = '<i data-lucide="check" style="width:16px;height:16px;"></i>';
+            lucide.createIcons();
+
+            setTimeout(() => {
+                button.classList.remove('success');
+                button.innerHTML = '<i data-lucide="copy" style="width:16px;height:16px;"></i>';
+                lucide.createIcons();
+            }, 2000);
+        } else {
+            // Fallback - open share modal with download option
+            showShareModal(dataUrl, blob);
+        }
+    } catch (err) {
+        console.error('Copy failed:', err);
+        alert('Could not copy to clipboard. Try the share button instead.');
+    }
+}
+
+async function shareComponent(element) {
+    try {
+        const dataUrl = await captureComponent(element);
+        const response = await fetch(dataUrl);
+        const blob = await response.blob();
+
+        // Try Web Share API with file
+        if (navigator.share && navigator.canShare) {
+            const file = new File([blob], 'genuverity-share.png', { type: 'image/png' });
+            const shareData = {
+                files: [file],
+                title: document.title,
+                url: window.location.href
+            };
+
+            if (navigator.canShare(shareData)) {
+                await navigator.share(shareData);
+                return;
+            }
+        }
+
+        // Fallback to modal
+        showShareModal(dataUrl, blob);
+    } catch (err) {
+        if (err.name !== 'AbortError') {
+            console.error('Share failed:', err);
+        }
+    }
+}
+
+function showShareModal(dataUrl, blob) {
+    currentShareBlob = blob;
+    currentShareUrl = dataUrl;
+
+    // Set preview image
+    document.getElementById('sharePreviewImg').src = dataUrl;
+
+    // Set share links
+    const pageUrl = encodeURIComponent(window.location.href);
+    const title = encodeURIComponent(document.title);
+
+    document.getElementById('shareTwitter').href =
+        `https://twitter.com/intent/tweet?text=${title}&url=${pageUrl}`;
+    document.getElementById('shareLinkedIn').href =
+        `https://www.linkedin.com/sharing/share-offsite/?url=${pageUrl}`;
+
+    // Show modal
+    document.getElementById('shareModalOverlay').classList.add('active');
+    lucide.createIcons();
+}
+
+function closeShareModal(event) {
+    if (event && event.target !== event.currentTarget) return;
+    document.getElementById('shareModalOverlay').classList.remove('active');
+    currentShareBlob = null;
+    currentShareUrl = null;
+}
+
+function downloadShareImage() {
+    if (!currentShareUrl) return;
+
+    const link = document.createElement('a');
+    link.href = currentShareUrl;
+    link.download = 'genuverity-' + Date.now() + '.png';
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+}
+
+async function copyReportLink() {
+    try {
+        await navigator.clipboard.writeText(window.location.href);
+        alert('Report link copied!');
+    } catch (err) {
+        // Fallback
+        const input = document.createElement('input');
+        input.value = window.location.href;
+        document.body.appendChild(input);
+        input.select();
+        document.execCommand('copy');
+        document.body.removeChild(input);
+        alert('Report link copied!');
+    }
+}
@@ -1,5 +1,6 @@
 // Shared reports data - Single source of truth for all pages
-// When adding a new report, add it here and it will update everywhere
+// Generated by scripts/catalog.py from data/reports.json - edit that file (or use
+// `python scripts/catalog.py add/update/remove`), not this one
 
 const REPORTS_DATA = [
     {
@@ -65,7 +66,7 @@ const REPORTS_DATA = [
     {
         id: -35,
         title: "Netanyahu Is Not Dead: Anatomy of a State-Backed Death Hoax",
-        slug: "netanyahu-death-hoax-2026",
+        slug: "netanyahu-death-hoax-2026"
     },
     {
         title: "Who Bombed the Iranian School? 8 Weapons Experts Say America — Trump Says Iran",
@@ -94,7 +95,7 @@ const REPORTS_DATA = [
         readTime: "18 min",
         verdict: "false",
         excerpt: "The Netanyahu death hoax was launched by Iran's IRGC-linked Tasnim News Agency, amplified by 62 fake social media accounts documented by Clemson University, and supported by AI-generated imagery scoring 76.9–99.9% artificial. The 'six fingers' in the March 12 press conference video are a shadow on the hypothenar eminence at the 34-second mark — the official GPO video scores 0.1% AI likelihood. Seven Israeli officials were falsely claimed dead in eight days. All seven are alive.",
-        chart: {"type":"hbar","data":[0.1,76.9,93.5,98.5,99.0],"labels":["Official GPO Video","AI 'Rescue Workers' Image","AI 'Netanyahu in Rubble'","Circulated Images (Hive)","Deepfake Presenter Video"],"colors":["#22c55e","#f97316","#ef4444","#dc2626","#991b1b"]}
+        chart: {"type":"hbar","data":[0.1,76.9,93.5,98.5,99],"labels":["Official GPO Video","AI 'Rescue Workers' Image","AI 'Netanyahu in Rubble'","Circulated Images (Hive)","Deepfake Presenter Video"],"colors":["#22c55e","#f97316","#ef4444","#dc2626","#991b1b"]}
     },
     {
         id: -34,
@@ -340,7 +341,7 @@ const REPORTS_DATA = [
         readTime: "16 min",
         verdict: "true",
         excerpt: "The fossil fuel industry has funded climate disinformation since 1980. DoD has sustained $15B in extreme weather damage (GAO-26-107786), 128 coastal bases face sea-level rise, and 10,000+ troops have been sidelined by heat illness. In March 2025, SecDef Hegseth ordered 'climate change' removed from all military planning — while simultaneously directing installations to assess 'weather-related impacts.' Russia and China actively amplify climate denial as geopolitical strategy. SCOTUS hears Boulder v. Suncor in October 2026.",
-        chart: {"type":"hbar","data":[10.0,5.0,3.6,0.8],"labels":["Andersen AFB (2023)","Tyndall AFB (2018)","Camp Lejeune (2018)","Offutt AFB (2019)"],"colors":["#ef4444","#f97316","#f59e0b","#06b6d4"]}
+        chart: {"type":"hbar","data":[10,5,3.6,0.8],"labels":["Andersen AFB (2023)","Tyndall AFB (2018)","Camp Lejeune (2018)","Offutt AFB (2019)"],"colors":["#ef4444","#f97316","#f59e0b","#06b6d4"]}
     },
     {
         id: -77,
@@ -399,7 +400,7 @@ const REPORTS_DATA = [
         sources: "28 Sources",
         readTime: "25 min",
         verdict: "misleading",
-        excerpt: "A TikTok account spliced together official White House 'slopaganda' \u2014 a 42-second supercut of 15+ Hollywood films mixed with real Iran bombing footage \u2014 and Iran's IRGC-linked 'Narrative of Victory' Lego animation. We traced both to their sources. The White House video was posted on X with the caption 'JUSTICE THE AMERICAN WAY.' The Iran animation was distributed by Tasnim News Agency and fabricates an Epstein-to-Iran-strikes narrative. Both are state-produced war propaganda. Ben Stiller: 'War is not a movie.' Sen. Duckworth: 'Six Americans are dead and you're calling this a flawless victory.'",
+        excerpt: "A TikTok account spliced together official White House 'slopaganda' — a 42-second supercut of 15+ Hollywood films mixed with real Iran bombing footage — and Iran's IRGC-linked 'Narrative of Victory' Lego animation. We traced both to their sources. The White House video was posted on X with the caption 'JUSTICE THE AMERICAN WAY.' The Iran animation was distributed by Tasnim News Agency and fabricates an Epstein-to-Iran-strikes narrative. Both are state-produced war propaganda. Ben Stiller: 'War is not a movie.' Sen. Duckworth: 'Six Americans are dead and you're calling this a flawless victory.'",
         chart: {"type":"hbar","data":[0,75,30,85,90,20],"labels":["Epstein Link","School Attack","Carrier Kill","Regional Strikes","US Casualties","Israeli Collapse"],"colors":["#ef4444","#f59e0b","#f59e0b","#10b981","#10b981","#ef4444"]}
     },
     {
@@ -610,7 +611,7 @@ const REPORTS_DATA = [
         readTime: "25 min",
         verdict: "false",
         excerpt: "Trump and Musk amplify debunked Pennsylvania mail-in ballot claims while their RNC simultaneously runs 'Bank Your Vote' campaign promoting mail-in voting. Data shows 0.00001% fraud rate.",
-        chart: {"type":"hbar","color":"#3b82f6","data":[0.00001,0.000043,0.0001,0.00001],"labels":["Oregon\\n2000-present\\n(100M+ ballots)","National\\n2016-2022\\n(all mail ballots)","Heritage Foundation\\nDatabase\\n(decades)","Lightning strike\\nrisk comparison"]}
+        chart: {"type":"hbar","color":"#3b82f6","data":[1e-05,4.3e-05,0.0001,1e-05],"labels":["Oregon\\n2000-present\\n(100M+ ballots)","National\\n2016-2022\\n(all mail ballots)","Heritage Foundation\\nDatabase\\n(decades)","Lightning strike\\nrisk comparison"]}
     },
     {
         id: -15,
@@ -765,7 +766,7 @@ const REPORTS_DATA = [
     {
         id: -95,
         title: "Trump's EPA Endangerment Finding Revocation: False Scientific Claims Exposed",
-        slug: "epa-endangerment-finding-revoked-2026",
+        slug: "epa-endangerment-finding-revoked-2026"
     },
     {
         id: -48,
@@ -798,7 +799,6 @@ const REPORTS_DATA = [
         chart: {"type":"hbar","color":"#3b82f6","data":[0,2,5,6],"labels":["TikTokers Arrive","First Videos Posted","Pastor Receives Threats","Bomb Threats Close Schools"],"colors":["#3b82f6","#f59e0b","#ef4444","#dc2626"]}
     },
     {
-        id: undefined,
         title: "",
         slug: "",
         category: "",
@@ -915,7 +915,7 @@ const REPORTS_DATA = [
         readTime: "22 min",
         verdict: "false",
         excerpt: "TikTok user 'Hank Dingle Schrader' predicted February 18, 2026 doomsday in viral comment. 14.7M views in 6 days, zero factual basis. Algorithmic amplification met Gen Z doomsday anxiety to transform absurdist joke into genuine psychological phenomenon. Name references Breaking Bad character; countdown exploited TikTok's 2026 algorithm perfectly.",
-        chart: {"type":"line","color":"#06b6d4","data":[0.02,14.9,15.5,16.1,17.0,20.0],"labels":["Feb 6","Feb 7","Feb 9","Feb 12","Feb 13","Feb 16"]}
+        chart: {"type":"line","color":"#06b6d4","data":[0.02,14.9,15.5,16.1,17,20],"labels":["Feb 6","Feb 7","Feb 9","Feb 12","Feb 13","Feb 16"]}
     },
     {
         id: -50,
@@ -960,12 +960,12 @@ const REPORTS_DATA = [
         readTime: "16 min",
         verdict: "misleading",
         excerpt: "Federal officials doubled protein recommendations and claimed widespread deficiency. But NHANES data shows most Americans already meet or exceed new targets. Men average 97-102g/day, women 69-70g/day. While specific populations need attention, the claim that 'a generation of kids' are protein-deficient contradicts research.",
-        chart: {"type":"hbar","data":[54.4, 81.6, 108.9, 69.5, 99.5],"labels":["Old RDA (0.8g/kg)","New Low (1.2g/kg)","New High (1.6g/kg)","Women Avg","Men Avg"],"colors":["#64748b","#06b6d4","#06b6d4","#10b981","#10b981"]}
+        chart: {"type":"hbar","data":[54.4,81.6,108.9,69.5,99.5],"labels":["Old RDA (0.8g/kg)","New Low (1.2g/kg)","New High (1.6g/kg)","Women Avg","Men Avg"],"colors":["#64748b","#06b6d4","#06b6d4","#10b981","#10b981"]}
     },
     {
         id: -54,
         title: "1.6 Million Self-Deportations? DHS's Unverifiable Claim, Exposed",
-        slug: "dhs-self-deportation-claims",
+        slug: "dhs-self-deportation-claims"
     },
     {
         id: -60,
@@ -1131,7 +1131,7 @@ const REPORTS_DATA = [
         readTime: "18 min",
         verdict: "context",
         excerpt: "Comprehensive analysis of the DOJ's January 30, 2026 Epstein files release. Verified: Musk 'wildest party' email, Bannon's hundreds of texts and jet offers, Lutnick Christmas island plans, Ruemmler 'Uncle Jeffrey' emails, Melania-Maxwell 'Love' exchange, Gates allegations in draft emails, new Clinton photos. But millions of pages are unverified FBI tips.",
-        chart: {"type":"donut","data":[2.5,2.0,1.5],"colors":["#64748b","#3b82f6","#f59e0b"]}
+        chart: {"type":"donut","data":[2.5,2,1.5],"colors":["#64748b","#3b82f6","#f59e0b"]}
     },
     {
         id: -10,
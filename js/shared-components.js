@@ -86,9 +86,28 @@ const SHARED_FOOTER_HTML = `
     </footer>
 `;
 
+/**
+ * Load the catalog client (js/catalog.js) once, then call back
+ * Report pages use it instead of the full reports-data.js
+ */
+function loadCatalogClient(callback) {
+    if (typeof GVCatalog !== 'undefined') {
+        callback();
+        return;
+    }
+    let script = document.querySelector('script[src*="js/catalog.js"]');
+    if (!script) {
+        script = document.createElement('script');
+        script.src = '/js/catalog.js';
+        document.head.appendChild(script);
+    }
+    script.addEventListener('load', () => callback());
+    script.addEventListener('error', () => console.warn('[GV Catalog] Failed to load catalog.js'));
+}
+
 /**
  * Initialize search autocomplete functionality
- * Separated to handle async REPORTS_DATA loading
+ * Queries the catalog's prebuilt search index (js/catalog.js)
  */
 function initializeSearchAutocomplete() {
     const navSearchInput = document.getElementById('navSearchInput');
@@ -98,19 +117,19 @@ function initializeSearchAutocomplete() {
         console.warn('[GV Search] Search elements not found');
         return;
     }
+    if (navSearchInput.dataset.gvSearchReady) return;
+    navSearchInput.dataset.gvSearchReady = 'true';
 
-    // Get reports data
-    const reports = typeof REPORTS_DATA !== 'undefined' ? REPORTS_DATA : [];
-
-    if (reports.length === 0) {
-        console.warn('[GV Search] No reports data available');
-        return;
-    }
+    // Preload the search index on first focus; each query is ranked there and
+    // only the top results' catalog shards are fetched for display
+    navSearchInput.addEventListener('focus', () => {
+        GVCatalog.searchIndex().catch(err => console.warn('[GV Search] Search index unavailable', err));
+    }, { once: true });
 
-    console.log(`[GV Search] ✅ Initialized autocomplete with ${reports.length} reports`);
-
-    navSearchInput.addEventListener('input', (e) => {
+    let latestQuery = 0;
+    navSearchInput.addEventListener('input', async (e) => {
         const query = e.target.value.toLowerCase().trim();
+        const queryId = ++latestQuery;
 
         if (!query) {
             navSearchDropdown.classList.remove('open');
@@ -118,12 +137,15 @@ function initializeSearchAutocomplete() {
             return;
         }
 
-        // Filter reports
-        const filtered = reports.filter(r =>
-            r.title.toLowerCase().includes(query) ||
-            r.category.toLowerCase().includes(query) ||
-            r.excerpt.toLowerCase().includes(query)
-        ).slice(0, 5); // Limit to 5 results
+        let filtered;
+        try {
+            const hits = await GVCatalog.search(query, 5); // Limit to 5 results
+            filtered = (await Promise.all(hits.map(hit => GVCatalog.entry(hit.slug)))).filter(Boolean);
+        } catch (err) {
+            console.warn('[GV Search] Search failed', err);
+            filtered = [];
+        }
+        if (queryId !== latestQuery) return; // superseded while loading
 
         if (filtered.length === 0) {
             navSearchDropdown.innerHTML = '<div style="color:var(--text-secondary); text-align:center; padding:20px;">No reports found.</div>';
@@ -200,14 +222,6 @@ function injectSharedComponents() {
         document.body.appendChild(footerPlaceholder);
     }
 
-    // Inject reports data script if not already loaded
-    if (typeof REPORTS_DATA === 'undefined' && !document.querySelector('script[src*="reports-data.js"]')) {
-        const script = document.createElement('script');
-        script.src = '../js/reports-data.js?v=' + Date.now();
-        script.onload = () => initializeSearchAutocomplete();
-        document.head.appendChild(script);
-    }
-
     if (navPlaceholder) {
         navPlaceholder.innerHTML = SHARED_NAV_HTML;
 
@@ -227,10 +241,8 @@ function injectSharedComponents() {
             // Landing page: CSS keeps it hidden, scroll listener will add/remove 'scrolled' class
         }
 
-        // Initialize search if REPORTS_DATA already loaded
-        if (typeof REPORTS_DATA !== 'undefined') {
-            initializeSearchAutocomplete();
-        }
+        // Initialize search (catalog shards load on first use)
+        loadCatalogClient(initializeSearchAutocomplete);
 
         // Dynamic Nav Links (Right Side)
         const navRight = navPlaceholder.querySelector('#shared-nav-right');
@@ -400,7 +412,8 @@ function ensureReportLayout() {
  * Initialize Verdict Corner Glow System
  * Injects corner glow elements and applies verdict class based on report data
  * 
- * To tag a report with a verdict, add to reports-data.js:
+ * To tag a report with a verdict, set it in the catalog:
+ *   python scripts/catalog.py update <slug> verdict=false
  *   verdict: "true" | "mostly-true" | "mixed" | "mostly-false" | "false"
  */
 function initVerdictGlow() {
@@ -408,27 +421,14 @@ function initVerdictGlow() {
     const isReportPage = document.querySelector('[data-page-type="report"]');
     if (!isReportPage) return;
 
-    // Helper function to apply the glow once data is available
-    function applyVerdictGlow() {
-        if (typeof REPORTS_DATA === 'undefined') {
-            console.warn('[GV Verdict] REPORTS_DATA still not available');
-            return;
-        }
-
+    // Helper function to apply the glow once the verdict is known
+    function applyVerdictGlow(verdict) {
         // Get current report filename from URL
         const path = window.location.pathname;
         const filename = path.split('/').pop(); // Get just the filename (e.g., "project-2025-military-orders.html")
 
-        // Find report in REPORTS_DATA - match by slug ending
-        const report = REPORTS_DATA.find(r => r.slug && r.slug.endsWith(filename));
-
-        if (!report) {
-            console.log(`[GV Verdict] Report "${filename}" not found in data, no glow applied`);
-            return;
-        }
-
-        if (!report.verdict) {
-            console.log(`[GV Verdict] Report "${report.title}" has no verdict field, no glow applied`);
+        if (!verdict) {
+            console.log(`[GV Verdict] Report "${filename}" has no verdict in the catalog, no glow applied`);
             return;
         }
 
@@ -444,33 +444,17 @@ function initVerdictGlow() {
         }
 
         // Apply verdict class to body
-        document.body.classList.add('verdict-' + report.verdict);
+        document.body.classList.add('verdict-' + verdict);
 
-        console.log(`[GV Verdict] ✅ Applied verdict glow: ${report.verdict} for "${report.title}"`);
+        console.log(`[GV Verdict] ✅ Applied verdict glow: ${verdict} for "${filename}"`);
     }
 
-    // Check if REPORTS_DATA already loaded
-    if (typeof REPORTS_DATA !== 'undefined') {
-        applyVerdictGlow();
-        return;
-    }
-
-    // Dynamically load reports-data.js
-    console.log('[GV Verdict] Loading reports-data.js...');
-    const script = document.createElement('script');
-
-    // Determine correct path (from /localreports/ or root)
-    const isInLocalReports = window.location.pathname.includes('/localreports/');
-    script.src = isInLocalReports ? '../js/reports-data.js?v=' + Date.now() : '/js/reports-data.js?v=' + Date.now();
-
-    script.onload = () => {
-        console.log('[GV Verdict] reports-data.js loaded');
-        applyVerdictGlow();
-    };
-    script.onerror = () => {
-        console.warn('[GV Verdict] Failed to load reports-data.js');
-    };
-    document.head.appendChild(script);
+    // The verdict comes from the catalog manifest - no need for the full reports list
+    loadCatalogClient(() => {
+        GVCatalog.verdict(window.location.pathname)
+            .then(applyVerdictGlow)
+            .catch(err => console.warn('[GV Verdict] Catalog not available', err));
+    });
 }
 
 /**
@@ -144,16 +144,39 @@ class UnifiedSearch {
 
     handleSearch(query) {
         const q = query.toLowerCase().trim();
+        const searchId = this.searchId = (this.searchId || 0) + 1;
         if (!q) {
-            this.filteredReports = [...this.reports];
-        } else {
-            this.filteredReports = this.reports.filter(r =>
-                r.title.toLowerCase().includes(q) ||
-                r.category.toLowerCase().includes(q) ||
-                r.excerpt.toLowerCase().includes(q)
-            );
+            this.showFiltered([...this.reports]);
+            return;
+        }
+
+        // Ranked lookup in the prebuilt index (js/catalog.js); substring scan if unavailable
+        if (typeof GVCatalog !== 'undefined') {
+            GVCatalog.search(q, this.reports.length).then(hits => {
+                if (searchId !== this.searchId) return; // superseded by a newer query
+                if (!this.reportsByKey) {
+                    this.reportsByKey = new Map(this.reports.map(r => [GVCatalog.key(r.slug), r]));
+                }
+                this.showFiltered(hits.map(hit => this.reportsByKey.get(hit.slug)).filter(Boolean));
+            }).catch(err => {
+                console.warn('[GV Search] Search index unavailable, scanning reports', err);
+                if (searchId === this.searchId) this.showFiltered(this.scanReports(q));
+            });
+            return;
         }
+        this.showFiltered(this.scanReports(q));
+    }
+
+    scanReports(q) {
+        return this.reports.filter(r =>
+            r.title.toLowerCase().includes(q) ||
+            (r.category || '').toLowerCase().includes(q) ||
+            (r.excerpt || '').toLowerCase().includes(q)
+        );
+    }
 
+    showFiltered(reports) {
+        this.filteredReports = reports;
         this.currentCardIndex = 0;
         this.renderCarousel();
         this.renderListView();
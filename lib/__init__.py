@@ -4,33 +4,56 @@ GenuVerity Report Generation Library
 This module provides the pipeline for generating reports:
 1. AI generates JSON using report_schema
 2. report_renderer converts JSON to branded HTML
+   (report_build renders whole directories, rebuilding only stale pages)
 3. report_validator checks requirements before deployment
+4. catalog publishes the report list (data/reports.json) as
+   reports-data.js plus small on-demand shards
 """
 
-from .report_schema import (
-    ReportData,
-    Verdict,
-    ReportCategory,
-    TagColor,
-    Source,
-    Claim,
-    ChartData,
-    Section,
-    ExecutiveSummary,
-    QuoteBox,
-    TimelineEvent,
-    REPORT_GENERATION_PROMPT,
-)
-
-from .report_renderer import (
-    render_report,
-    render_to_file,
-)
-
-from .report_validator import (
-    validate_report,
-    ValidationError,
-)
+import importlib
+
+# Public names -> submodule. Submodules load on first access, so importing
+# one light module (e.g. lib.prompt_assets) doesn't pull in the validator's
+# aiohttp or the renderer.
+_EXPORTS = {
+    "ReportData": "report_schema",
+    "Verdict": "report_schema",
+    "ReportCategory": "report_schema",
+    "TagColor": "report_schema",
+    "Source": "report_schema",
+    "Claim": "report_schema",
+    "ChartData": "report_schema",
+    "Section": "report_schema",
+    "ExecutiveSummary": "report_schema",
+    "QuoteBox": "report_schema",
+    "TimelineEvent": "report_schema",
+    "REPORT_GENERATION_PROMPT": "report_schema",
+    "PromptAssets": "prompt_assets",
+    "PromptTemplate": "prompt_assets",
+    "render_report": "report_renderer",
+    "iter_report": "report_renderer",
+    "render_to_file": "report_renderer",
+    "build_reports": "report_build",
+    "ReportBuildError": "report_build",
+    "load_catalog": "catalog",
+    "build_catalog": "catalog",
+    "validate_report": "report_validator",
+    "ValidationError": "report_validator",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     # Schema
@@ -46,9 +69,18 @@ __all__ = [
     "QuoteBox",
     "TimelineEvent",
     "REPORT_GENERATION_PROMPT",
+    # Prompt assets
+    "PromptAssets",
+    "PromptTemplate",
     # Renderer
     "render_report",
+    "iter_report",
     "render_to_file",
+    "build_reports",
+    "ReportBuildError",
+    # Catalog
+    "load_catalog",
+    "build_catalog",
     # Validator
     "validate_report",
     "ValidationError",
@@ -0,0 +1,268 @@
+"""
+Report Catalog - the list of published reports and its generated views.
+
+data/reports.json is the canonical catalog: a JSON array of report
+metadata (title, slug, category, verdict, excerpt, chart preview, ...),
+newest first. Everything else is generated from it by build_catalog():
+
+  - js/reports-data.js      the full REPORTS_DATA array, for pages that list
+                            every report (index, reports hub)
+  - js/catalog/manifest.json
+                            small summary: counts, shard file names, and a
+                            slug -> (page, verdict) lookup
+  - js/catalog/page-NNN.<hash>.json, category-<name>.<hash>.json
+                            content-hashed shards that report pages fetch
+                            on demand (js/catalog.js)
+  - js/catalog/search.<hash>.bin
+                            binary full-text search index (lib/search_index.py)
+
+Edits are structured operations on the parsed list (add/remove/update/
+move), never text rewrites of the generated JavaScript.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from .search_index import build_search_index, encode_index
+
+
+ROOT_DIR = Path(__file__).parent.parent
+CATALOG_PATH = ROOT_DIR / "data" / "reports.json"
+REPORTS_DATA_JS = ROOT_DIR / "js" / "reports-data.js"
+SHARD_DIR = ROOT_DIR / "js" / "catalog"
+
+PAGE_SIZE = 24
+MANIFEST_VERSION = 1
+
+# Field order in the canonical file and reports-data.js; unknown fields follow, sorted
+FIELD_ORDER = ["id", "title", "slug", "category", "tagClass", "catClass", "icon",
+               "date", "sources", "readTime", "verdict", "excerpt", "chart"]
+REQUIRED_FIELDS = ["id", "title", "slug", "category", "date", "excerpt"]
+
+REPORTS_DATA_HEADER = """\
+// Shared reports data - Single source of truth for all pages
+// Generated by scripts/catalog.py from data/reports.json - edit that file (or use
+// `python scripts/catalog.py add/update/remove`), not this one
+
+const REPORTS_DATA = ["""
+
+REPORTS_DATA_FOOTER = """];
+
+// Export for use in other scripts
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = REPORTS_DATA;
+}
+"""
+
+
+class CatalogError(Exception):
+    """A catalog edit that can't be applied (unknown slug, duplicate, ...)."""
+
+
+def _ordered(report: dict) -> dict:
+    known = {k: report[k] for k in FIELD_ORDER if k in report}
+    return {**known, **{k: report[k] for k in sorted(report) if k not in known}}
+
+
+def _write_atomic(path: Path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data)
+    os.replace(tmp, path)
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> list:
+    return json.loads(Path(path).read_text())
+
+
+def import_reports_data_js(path: Path = REPORTS_DATA_JS) -> list:
+    """Parse a reports-data.js (e.g. one edited by a tools/*.js script) with Node."""
+    script = "process.stdout.write(JSON.stringify(require(process.argv[1])))"
+    result = subprocess.run(["node", "-e", script, str(Path(path).resolve())],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def dump_catalog(reports: list) -> str:
+    """Canonical text of the catalog (stable field order, one line per field)."""
+    return json.dumps([_ordered(r) for r in reports], indent=2, ensure_ascii=False) + "\n"
+
+
+def save_catalog(reports: list, path: Path = CATALOG_PATH):
+    _write_atomic(Path(path), dump_catalog(reports))
+
+
+def report_key(slug: str) -> str:
+    """Lookup key for a slug or page path: "localreports/x.html" and "x" are both "x"."""
+    return slug.rsplit("/", 1)[-1].removesuffix(".html")
+
+
+def find_report(reports: list, slug: str) -> Optional[int]:
+    key = report_key(slug)
+    for i, report in enumerate(reports):
+        if report.get("slug") and report_key(report["slug"]) == key:
+            return i
+    return None
+
+
+# === EDIT OPERATIONS ===
+
+def add_report(reports: list, report: dict, position: int = 0) -> dict:
+    """Insert a report (newest first by default). Assigns the next id if it has none."""
+    if not report.get("slug") or not report.get("title"):
+        raise CatalogError("A report needs at least a slug and a title")
+    if find_report(reports, report["slug"]) is not None:
+        raise CatalogError(f"Slug already in catalog: {report['slug']}")
+
+    if report.get("id") is None:
+        ids = [r["id"] for r in reports if isinstance(r.get("id"), int)]
+        report = {**report, "id": min(ids, default=1) - 1}
+    reports.insert(position, _ordered(report))
+    return report
+
+
+def remove_report(reports: list, slug: str) -> dict:
+    index = find_report(reports, slug)
+    if index is None:
+        raise CatalogError(f"No report with slug {slug}")
+    return reports.pop(index)
+
+
+def update_report(reports: list, slug: str, changes: dict) -> dict:
+    """Set fields on a report; a value of None removes the field."""
+    index = find_report(reports, slug)
+    if index is None:
+        raise CatalogError(f"No report with slug {slug}")
+    if "slug" in changes and find_report(reports, changes["slug"]) not in (None, index):
+        raise CatalogError(f"Slug already in catalog: {changes['slug']}")
+
+    report = {**reports[index], **changes}
+    reports[index] = _ordered({k: v for k, v in report.items() if v is not None})
+    return reports[index]
+
+
+def move_report(reports: list, slug: str, position: int) -> dict:
+    report = remove_report(reports, slug)
+    reports.insert(position, report)
+    return report
+
+
+def check_catalog(reports: list) -> list:
+    """Human-readable problems: missing required fields, duplicate slugs or ids."""
+    problems = []
+    seen_slugs, seen_ids = {}, {}
+    for i, report in enumerate(reports):
+        label = report.get("slug") or report.get("title") or f"entry {i}"
+        missing = [f for f in REQUIRED_FIELDS if report.get(f) in (None, "")]
+        if missing:
+            problems.append(f"#{i} {label}: missing {', '.join(missing)}")
+        if report.get("slug"):
+            key = report_key(report["slug"])
+            if key in seen_slugs:
+                problems.append(f"#{i} {label}: duplicate slug (also #{seen_slugs[key]})")
+            seen_slugs.setdefault(key, i)
+        if report.get("id") is not None:
+            if report["id"] in seen_ids:
+                problems.append(f"#{i} {label}: duplicate id {report['id']} (also #{seen_ids[report['id']]})")
+            seen_ids.setdefault(report["id"], i)
+    return problems
+
+
+def reports_data_js_current(reports: list, path: Path = REPORTS_DATA_JS) -> bool:
+    """Whether reports-data.js is exactly what build_catalog() would write."""
+    try:
+        return Path(path).read_text() == render_reports_data_js(reports)
+    except OSError:
+        return False
+
+
+# === GENERATED VIEWS ===
+
+def render_reports_data_js(reports: list) -> str:
+    """REPORTS_DATA as JavaScript, in the layout the hand-edited file used."""
+    blocks = []
+    for report in reports:
+        lines = []
+        for key, value in _ordered(report).items():
+            name = key if re.match(r"^[A-Za-z_$][\w$]*$", key) else json.dumps(key)
+            lines.append(f"        {name}: {json.dumps(value, ensure_ascii=False, separators=(',', ':'))}")
+        blocks.append("    {\n" + ",\n".join(lines) + "\n    }")
+    return REPORTS_DATA_HEADER + "\n" + ",\n".join(blocks) + "\n" + REPORTS_DATA_FOOTER
+
+
+def _category_slug(category: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", category.lower().replace("&amp;", "and").replace("&", "and")).strip("-")
+
+
+def _shard(name: str, reports: list) -> tuple:
+    """(content-hashed file name, JSON bytes)."""
+    data = json.dumps(reports, ensure_ascii=False, separators=(",", ":")).encode()
+    return _hashed(name, data, ".json"), data
+
+
+def _hashed(name: str, data: bytes, suffix: str) -> str:
+    return f"{name}.{hashlib.sha256(data).hexdigest()[:10]}{suffix}"
+
+
+def build_catalog(reports: list, shard_dir: Path = SHARD_DIR, reports_data_js: Path = REPORTS_DATA_JS,
+                  page_size: int = PAGE_SIZE) -> dict:
+    """Write reports-data.js, the manifest and the shards. Returns the manifest.
+
+    Only complete entries (with a slug and title) go into shards. Shards
+    left over from earlier builds are deleted.
+    """
+    shard_dir = Path(shard_dir)
+    listed = [_ordered(r) for r in reports if r.get("slug") and r.get("title")]
+
+    files = {}
+    pages = []
+    lookup = {}
+    for number, start in enumerate(range(0, len(listed), page_size)):
+        page = listed[start:start + page_size]
+        name, data = _shard(f"page-{number:03d}", page)
+        files[name] = data
+        pages.append(name)
+        for report in page:
+            lookup[report_key(report["slug"])] = [number, report.get("verdict")]
+
+    by_category = {}
+    for report in listed:
+        by_category.setdefault(report.get("category") or "Uncategorized", []).append(report)
+    categories = {}
+    for category, members in sorted(by_category.items()):
+        name, data = _shard(f"category-{_category_slug(category) or 'uncategorized'}", members)
+        files[name] = data
+        categories[category] = {"count": len(members), "file": name}
+
+    # Index docs by lookup key (the same keys as manifest["reports"])
+    index = encode_index(build_search_index([{**r, "slug": report_key(r["slug"])} for r in listed]))
+    search_name = _hashed("search", index, ".bin")
+    files[search_name] = index
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "count": len(listed),
+        "pageSize": page_size,
+        "pages": pages,
+        "categories": categories,
+        "search": search_name,
+        "reports": lookup,
+    }
+
+    for name, data in files.items():
+        if not (shard_dir / name).exists():
+            _write_atomic(shard_dir / name, data)
+    for stale in shard_dir.iterdir():
+        if stale.suffix in (".json", ".bin") and stale.name != "manifest.json" and stale.name not in files:
+            stale.unlink()
+    _write_atomic(shard_dir / "manifest.json", json.dumps(manifest, ensure_ascii=False, separators=(",", ":")))
+    _write_atomic(Path(reports_data_js), render_reports_data_js(reports))
+    return manifest
@@ -0,0 +1,250 @@
+"""
+Data Commons client for building report datasets.
+
+Batches many variables x entities into V2 observation requests, runs
+independent requests concurrently and keeps an on-disk response cache
+keyed by request body, so re-running a dataset build costs no API calls.
+
+Results can be flattened to rows, written as CSV, or shaped as columnar
+JSON that drops straight into ChartData (labels + datasets).
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from urllib.request import Request, urlopen
+
+
+DC_OBSERVATION_URL = "https://api.datacommons.org/v2/observation"
+DC_NL_URL = "https://api.datacommons.org/v2/nl"
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "datacommons"
+
+# Keep individual requests modest; larger sets are split and run concurrently
+MAX_VARIABLES_PER_REQUEST = 10
+MAX_ENTITIES_PER_REQUEST = 50
+
+
+def load_api_key(env_path: Optional[Path] = None) -> Optional[str]:
+    """Read DC_API_KEY from the environment, falling back to the repo .env file."""
+    if os.getenv("DC_API_KEY"):
+        return os.getenv("DC_API_KEY")
+
+    env_path = env_path or Path(__file__).parent.parent / ".env"
+    if env_path.exists():
+        for line in env_path.read_text().splitlines():
+            if "=" in line and not line.startswith("#"):
+                key, val = line.split("=", 1)
+                if key.strip() == "DC_API_KEY":
+                    return val.strip()
+    return None
+
+
+def _chunks(items: list, size: int) -> list:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class DataCommonsClient:
+    """Cached, batching client for the Data Commons V2 REST API."""
+
+    def __init__(self, api_key: str, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+                 max_workers: int = 8, timeout: int = 30):
+        self.api_key = api_key
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    # === HTTP + CACHE ===
+
+    def _cache_path(self, url: str, body: dict) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(f"{url}\n{canonical}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _post(self, url: str, body: dict, headers: dict) -> dict:
+        """POST JSON, serving from / writing to the on-disk cache. Errors are never cached."""
+        cache_path = self._cache_path(url, body)
+        if cache_path and cache_path.exists():
+            try:
+                return json.loads(cache_path.read_text())
+            except (OSError, json.JSONDecodeError):
+                pass
+
+        request_url = url
+        if url == DC_NL_URL:
+            # NL API uses key as query parameter, not header
+            request_url = f"{url}?key={self.api_key}"
+
+        try:
+            req = Request(request_url, data=json.dumps(body).encode("utf-8"), method="POST")
+            req.add_header("Content-Type", "application/json")
+            for key, val in headers.items():
+                req.add_header(key, val)
+
+            with urlopen(req, timeout=self.timeout) as resp:
+                result = json.loads(resp.read().decode())
+        except Exception as e:
+            error_info = {"error": str(e), "url": url}
+            if hasattr(e, "read"):
+                try:
+                    error_body = e.read().decode()
+                    error_info["body"] = error_body
+                    try:
+                        error_info["json_body"] = json.loads(error_body)
+                    except json.JSONDecodeError:
+                        pass
+                except Exception:
+                    pass
+            return error_info
+
+        if cache_path:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(result))
+            os.replace(tmp_path, cache_path)
+
+        return result
+
+    # === QUERIES ===
+
+    def observation_request(self, variables: list[str], entities: list[str], date: str = "") -> dict:
+        """Single V2 observation request for every variable x entity pair given."""
+        body = {
+            "select": ["variable", "entity", "value", "date"],
+            "variable": {"dcids": list(variables)},
+            "entity": {"dcids": list(entities)}
+        }
+        if date:
+            body["date"] = date
+        return self._post(DC_OBSERVATION_URL, body, {"X-API-Key": self.api_key})
+
+    def observations(self, variables: list[str], entities: list[str], date: str = "") -> dict:
+        """Observations for all variables x entities, merged into one V2-shaped response.
+
+        The cross product is split into at most MAX_VARIABLES_PER_REQUEST x
+        MAX_ENTITIES_PER_REQUEST blocks which run concurrently. Failed blocks
+        are listed under "errors".
+        """
+        variables = list(dict.fromkeys(variables))
+        entities = list(dict.fromkeys(entities))
+        blocks = [
+            (var_chunk, ent_chunk)
+            for var_chunk in _chunks(variables, MAX_VARIABLES_PER_REQUEST)
+            for ent_chunk in _chunks(entities, MAX_ENTITIES_PER_REQUEST)
+        ]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(blocks)))) as pool:
+            responses = list(pool.map(lambda b: self.observation_request(b[0], b[1], date), blocks))
+
+        merged = {"byVariable": {}}
+        errors = []
+        for (var_chunk, ent_chunk), response in zip(blocks, responses):
+            if "error" in response:
+                errors.append({"variables": var_chunk, "entities": ent_chunk, **response})
+                continue
+            for variable, by_var in response.get("byVariable", {}).items():
+                target = merged["byVariable"].setdefault(variable, {"byEntity": {}})
+                target["byEntity"].update(by_var.get("byEntity", {}))
+            if "facets" in response:
+                merged.setdefault("facets", {}).update(response["facets"])
+
+        if errors:
+            merged["errors"] = errors
+        return merged
+
+    def nl_query(self, question: str) -> dict:
+        """Query the Data Commons Natural Language API."""
+        return self._post(DC_NL_URL, {"query": question}, {})
+
+
+# === EXPORT ===
+
+def observation_rows(response: dict) -> list[dict]:
+    """Flatten a V2 observation response to rows (preferred facet only)."""
+    rows = []
+    for variable, by_var in response.get("byVariable", {}).items():
+        for entity, by_entity in by_var.get("byEntity", {}).items():
+            facets = by_entity.get("orderedFacets") or []
+            if not facets:
+                continue
+            facet = facets[0]
+            for obs in facet.get("observations", []):
+                rows.append({
+                    "variable": variable,
+                    "entity": entity,
+                    "date": obs.get("date"),
+                    "value": obs.get("value"),
+                    "facet": facet.get("facetId")
+                })
+    rows.sort(key=lambda r: (r["variable"], r["entity"], r["date"] or ""))
+    return rows
+
+
+def rows_to_csv(rows: list[dict]) -> str:
+    """Render observation rows as CSV text."""
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=["variable", "entity", "date", "value", "facet"])
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def rows_to_columnar(rows: list[dict], index: str = "date", labels: Optional[dict] = None) -> dict:
+    """Shape rows as {labels, datasets} for ChartData.
+
+    index="date":   x-axis is dates, one dataset per variable/entity pair.
+    index="entity": x-axis is entities, one dataset per variable, using each
+                    entity's latest observation (e.g. a state comparison).
+    `labels` optionally maps dcids to display names.
+    """
+    labels = labels or {}
+
+    if index == "entity":
+        latest = {}
+        for row in rows:
+            key = (row["variable"], row["entity"])
+            if key not in latest or (row["date"] or "") >= (latest[key]["date"] or ""):
+                latest[key] = row
+        entities = sorted({entity for _, entity in latest})
+        variables = sorted({variable for variable, _ in latest})
+        return {
+            "labels": [labels.get(e, e) for e in entities],
+            "datasets": [
+                {
+                    "label": labels.get(v, v),
+                    "data": [latest[(v, e)]["value"] if (v, e) in latest else None for e in entities]
+                }
+                for v in variables
+            ]
+        }
+
+    dates = sorted({row["date"] for row in rows if row["date"]})
+    series = {}
+    for row in rows:
+        series.setdefault((row["variable"], row["entity"]), {})[row["date"]] = row["value"]
+
+    multiple_variables = len({v for v, _ in series}) > 1
+    datasets = []
+    for (variable, entity), points in sorted(series.items()):
+        name = labels.get(entity, entity)
+        if multiple_variables:
+            name = f"{name} - {labels.get(variable, variable)}"
+        datasets.append({"label": name, "data": [points.get(d) for d in dates]})
+
+    return {"labels": dates, "datasets": datasets}
+
+
+def to_chart_data(rows: list[dict], title: str, chart_type: str = "line", index: str = "date",
+                  labels: Optional[dict] = None):
+    """Build a ChartData model from observation rows."""
+    from .report_schema import ChartData
+
+    columnar = rows_to_columnar(rows, index=index, labels=labels)
+    return ChartData(chart_type=chart_type, title=title, **columnar)
@@ -0,0 +1,321 @@
+"""
+Full-Text Search - SQLite FTS5 index over report pages and cached fact-checks.
+
+One on-disk database holds every searchable document (a static report in
+localreports/, a rendered ReportData report, or a cached fact-check) with
+its title, summary and body text. Documents are keyed by id and carry a
+content hash, so re-indexing an unchanged document is a no-op and the
+index is kept current incrementally: the API indexes a fact-check when it
+is cached and a report when it is rendered, and sync_report_files() picks
+up added, changed or deleted pages. The report pages are indexed at build
+time (scripts/build_search_db.py) and the result shipped with the API.
+
+Queries are ranked with FTS5's bm25() (title weighted over summary over
+body) and return highlighted snippets.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Optional
+
+
+SCHEMA_VERSION = 1
+
+# bm25() column weights: doc_id (unindexed), title, summary, body
+RANK_WEIGHTS = (0.0, 10.0, 4.0, 1.0)
+SNIPPET_TOKENS = 24
+MAX_QUERY_TERMS = 12
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    doc_id TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    url TEXT,
+    title TEXT,
+    verdict TEXT,
+    content_hash TEXT NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_kind ON documents (kind);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    doc_id UNINDEXED, title, summary, body,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+# Snippet markers that can't occur in extracted text; swapped for <mark> after escaping
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+
+# === TEXT EXTRACTION ===
+
+class _TextExtractor(HTMLParser):
+    SKIP = {"script", "style", "noscript", "svg", "template", "head", "nav", "footer", "button"}
+    BLOCK = {"p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6",
+             "tr", "br", "blockquote", "figcaption", "td", "th", "dd", "dt"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts, self.skipping = [], 0
+        self.title, self.description, self.h1 = "", "", ""
+        self._in_title = self._in_h1 = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            attrs = dict(attrs)
+            if attrs.get("name") == "description" and not self.description:
+                self.description = attrs.get("content") or ""
+        if tag in self.SKIP:
+            self.skipping += 1
+        elif tag == "h1":
+            self._in_h1 = True
+        if tag in self.BLOCK:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "h1":
+            self._in_h1 = False
+        if tag in self.SKIP and self.skipping:
+            self.skipping -= 1
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        if self.skipping:
+            return
+        if self._in_h1:
+            self.h1 += data
+        self.parts.append(data)
+
+
+def _squash(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def html_to_text(markup: str) -> str:
+    """Visible text of an HTML fragment or page (scripts, styles and chrome dropped)."""
+    parser = _TextExtractor()
+    parser.feed(markup or "")
+    return _squash(" ".join(parser.parts))
+
+
+def page_document(markup: str) -> dict:
+    """{title, summary, body} for a full report page."""
+    parser = _TextExtractor()
+    parser.feed(markup)
+    title = _squash(parser.h1) or _squash(parser.title).split(" | ")[0]
+    return {"title": title, "summary": _squash(parser.description), "body": _squash(" ".join(parser.parts))}
+
+
+def _strings(value) -> list:
+    """Every string in a JSON value, skipping private (_*) keys and bare URLs."""
+    if isinstance(value, str):
+        return [] if value.startswith(("http://", "https://")) else [value]
+    if isinstance(value, dict):
+        return [s for key, item in value.items() if not str(key).startswith("_") for s in _strings(item)]
+    if isinstance(value, list):
+        return [s for item in value for s in _strings(item)]
+    return []
+
+
+def article_document(article: dict) -> dict:
+    """{title, summary, body} for a cached fact-check (FACT_CHECK_TEMPLATE shape)."""
+    rest = {k: v for k, v in article.items() if k not in ("title", "verdict", "verdictSummary", "content", "key", "articleType")}
+    body = " ".join([html_to_text(article.get("content", "")), *_strings(rest)])
+    return {
+        "title": article.get("title") or article.get("_topic", ""),
+        "summary": article.get("verdictSummary", ""),
+        "body": _squash(body),
+    }
+
+
+# === QUERIES ===
+
+def match_query(text: str, all_terms: bool = True) -> Optional[str]:
+    """FTS5 MATCH expression for free text: every term required (or any, for
+    similarity lookups), the last one also matching as a prefix.
+
+    Terms are quoted, so FTS5 operators in user input are treated as words.
+    """
+    terms = re.findall(r"\w+", (text or "").lower())[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if len(terms[-1]) >= 2:
+        quoted[-1] += "*"
+    return (" " if all_terms else " OR ").join(quoted)
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet or "").replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+
+def content_hash(document: dict) -> str:
+    return hashlib.sha256(json.dumps(document, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+# === INDEX ===
+
+class FullTextIndex:
+    """An FTS5 database at `path`. Safe to share between threads."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._db.executescript("DROP TABLE IF EXISTS documents; DROP TABLE IF EXISTS documents_fts;")
+                self._db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def compact(self):
+        """Checkpoint and leave WAL mode so the database is one self-contained file (for shipping)."""
+        with self._lock:
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._db.execute("PRAGMA journal_mode=DELETE")
+            self._db.execute("VACUUM")
+
+    def hashes(self, kind: Optional[str] = None) -> dict:
+        """doc_id -> content hash of indexed documents (of one kind)."""
+        sql, args = "SELECT doc_id, content_hash FROM documents", ()
+        if kind:
+            sql, args = sql + " WHERE kind = ?", (kind,)
+        with self._lock:
+            return dict(self._db.execute(sql, args).fetchall())
+
+    def upsert(self, doc_id: str, kind: str, document: dict, url: str = "", verdict: Optional[str] = None,
+               digest: Optional[str] = None) -> bool:
+        """Index or re-index a document ({title, summary, body}). False if it was unchanged."""
+        digest = digest or content_hash({**document, "url": url, "verdict": verdict})
+        with self._lock, self._db:
+            row = self._db.execute("SELECT id, content_hash FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+            if row and row[1] == digest:
+                return False
+            if row:
+                self._db.execute("DELETE FROM documents_fts WHERE rowid = ?", (row[0],))
+                self._db.execute(
+                    "UPDATE documents SET kind = ?, url = ?, title = ?, verdict = ?, content_hash = ?, indexed_at = ? "
+                    "WHERE id = ?",
+                    (kind, url, document.get("title"), verdict, digest, datetime.now().isoformat(), row[0]))
+                rowid = row[0]
+            else:
+                rowid = self._db.execute(
+                    "INSERT INTO documents (doc_id, kind, url, title, verdict, content_hash, indexed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (doc_id, kind, url, document.get("title"), verdict, digest, datetime.now().isoformat())).lastrowid
+            self._db.execute(
+                "INSERT INTO documents_fts (rowid, doc_id, title, summary, body) VALUES (?, ?, ?, ?, ?)",
+                (rowid, doc_id, document.get("title", ""), document.get("summary", ""), document.get("body", "")))
+        return True
+
+    def remove(self, doc_id: str) -> bool:
+        with self._lock, self._db:
+            row = self._db.execute("SELECT id FROM documents WHERE doc_id = ?", (doc_id,)).fetchone()
+            if not row:
+                return False
+            self._db.execute("DELETE FROM documents_fts WHERE rowid = ?", (row[0],))
+            self._db.execute("DELETE FROM documents WHERE id = ?", (row[0],))
+        return True
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM documents").fetchone()[0]
+
+    def search(self, query: str, limit: int = 10, offset: int = 0, kind: Optional[str] = None,
+               all_terms: bool = True) -> dict:
+        """Ranked page of results: {"total", "results": [{doc_id, kind, url, title, verdict, snippet, score}]}.
+
+        Snippets are HTML-escaped with matches wrapped in <mark>.
+        """
+        expression = match_query(query, all_terms)
+        if not expression:
+            return {"total": 0, "results": []}
+
+        where, args = "documents_fts MATCH ?", [expression]
+        if kind:
+            where, args = where + " AND d.kind = ?", args + [kind]
+        weights = ", ".join(map(str, RANK_WEIGHTS))
+
+        with self._lock:
+            # Rank every match but build snippets only for the requested page
+            ranked = self._db.execute(
+                f"SELECT id, rank, count(*) OVER () FROM ("
+                f"SELECT documents_fts.rowid AS id, bm25(documents_fts, {weights}) AS rank "
+                f"FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid WHERE {where}"
+                f") ORDER BY rank LIMIT ? OFFSET ?",
+                [*args, limit, offset]).fetchall()
+            if not ranked:
+                total = 0 if offset == 0 else self._db.execute(
+                    f"SELECT count(*) FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid WHERE {where}",
+                    args).fetchone()[0]
+                return {"total": total, "results": []}
+
+            rowids = [row[0] for row in ranked]
+            marks = ", ".join("?" * len(rowids))
+            details = {row[0]: row[1:] for row in self._db.execute(
+                f"SELECT documents_fts.rowid, d.doc_id, d.kind, d.url, d.title, d.verdict, "
+                f"snippet(documents_fts, -1, ?, ?, '…', {SNIPPET_TOKENS}) "
+                f"FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+                f"WHERE documents_fts MATCH ? AND documents_fts.rowid IN ({marks})",
+                [_MARK_OPEN, _MARK_CLOSE, expression, *rowids])}
+
+        results = []
+        for rowid, rank, _ in ranked:
+            doc_id, kind_, url, title, verdict, snippet = details[rowid]
+            results.append({"doc_id": doc_id, "kind": kind_, "url": url, "title": title, "verdict": verdict,
+                            "snippet": _highlight(snippet), "score": round(-rank, 3)})
+        return {"total": ranked[0][2], "results": results}
+
+    def sync_report_files(self, report_dir, metadata: Optional[dict] = None, kind: str = "report") -> dict:
+        """Bring `kind` documents in line with the *.html pages in report_dir.
+
+        Pages are keyed "report:<name>" and hashed by file content, so only
+        new or changed pages are parsed. `metadata` (name -> catalog entry)
+        supplies title, excerpt and verdict where the catalog has them.
+        Returns counts: indexed, unchanged, removed.
+        """
+        metadata = metadata or {}
+        indexed = self.hashes(kind)
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+
+        for path in sorted(Path(report_dir).glob("*.html")):
+            doc_id = f"{kind}:{path.stem}"
+            seen.add(doc_id)
+            data = path.read_bytes()
+            meta = metadata.get(path.stem, {})
+            digest = hashlib.sha256(data + json.dumps(meta, sort_keys=True).encode()).hexdigest()
+            if indexed.get(doc_id) == digest:
+                counts["unchanged"] += 1
+                continue
+
+            document = page_document(data.decode("utf-8", errors="replace"))
+            document["title"] = html.unescape(meta.get("title") or document["title"])
+            document["summary"] = html.unescape(meta.get("excerpt") or document["summary"])
+            self.upsert(doc_id, kind, document, url=f"/{path.stem}", verdict=meta.get("verdict"), digest=digest)
+            counts["indexed"] += 1
+
+        for doc_id in set(indexed) - seen:
+            self.remove(doc_id)
+            counts["removed"] += 1
+        return counts
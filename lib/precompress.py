@@ -0,0 +1,112 @@
+"""
+Precompressed assets - .gz/.br siblings written at build time.
+
+Static pages, scripts and stylesheets are compressed once at maximum level
+(gzip 9, brotli 11) so servers pick a sibling by Accept-Encoding instead of
+compressing per request. Brotli is optional: without the `brotli` package
+only .gz siblings are written and offered.
+
+A manifest of source hashes lets a rebuild skip files that haven't changed.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MANIFEST_FILENAME = ".precompress-manifest.json"
+MIN_SIZE = 1024  # Smaller files aren't worth a sibling
+
+# (Content-Encoding, file suffix), most preferred first
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")] if brotli else [("gzip", ".gz")]
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def accepted_encodings(accept_encoding: str) -> list:
+    """Our ENCODINGS the client accepts, in preference order (honours q=0)."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    wildcard = accepted.get("*", 0.0)
+    return [(enc, suffix) for enc, suffix in ENCODINGS if accepted.get(enc, wildcard) > 0]
+
+
+def fresh_sibling(path: str, suffix: str) -> Optional[os.stat_result]:
+    """Stat of path+suffix if it exists and isn't older than path."""
+    try:
+        sibling = os.stat(path + suffix)
+        return sibling if sibling.st_mtime >= os.stat(path).st_mtime else None
+    except OSError:
+        return None
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def precompress_files(paths: list, manifest_path: Path, force: bool = False) -> dict:
+    """Write compressed siblings for `paths`, skipping sources whose hash is unchanged.
+
+    Returns counts: compressed, unchanged, skipped (too small), and bytes
+    before/after for the files compressed this run.
+    """
+    manifest_path = Path(manifest_path)
+    root = manifest_path.parent
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+
+    counts = {"compressed": 0, "unchanged": 0, "skipped": 0, "bytes_in": 0, "bytes_out": {}}
+    for path in map(Path, paths):
+        data = path.read_bytes()
+        if len(data) < MIN_SIZE:
+            counts["skipped"] += 1
+            continue
+
+        digest = hashlib.sha256(data).hexdigest()
+        key = os.path.relpath(path, root)
+        entry = manifest.get(key, {})
+        if (not force and entry.get("sha256") == digest
+                and all(fresh_sibling(str(path), suffix) for _, suffix in ENCODINGS)):
+            counts["unchanged"] += 1
+            continue
+
+        counts["compressed"] += 1
+        counts["bytes_in"] += len(data)
+        for encoding, suffix in ENCODINGS:
+            compressed = compress(data, encoding)
+            _write_atomic(path.parent / f"{path.name}{suffix}", compressed)
+            counts["bytes_out"][encoding] = counts["bytes_out"].get(encoding, 0) + len(compressed)
+        manifest[key] = {"sha256": digest}
+
+    # Drop siblings and entries whose source is gone
+    for key in [k for k in manifest if not (root / k).exists()]:
+        for suffix in (".gz", ".br"):
+            (root / f"{key}{suffix}").unlink(missing_ok=True)
+        del manifest[key]
+
+    _write_atomic(manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode())
+    return counts
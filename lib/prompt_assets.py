@@ -0,0 +1,126 @@
+"""
+Prompt assets - schema files and prompt templates, loaded once.
+
+Prompt templates are str.format strings. A PromptTemplate can have some of
+its fields bound ahead of time (e.g. the essay schema read from docs/), so
+assembling a prompt per request is a single format call over the
+remaining fields.
+
+PromptAssets caches file contents. With hot_reload on (local dev), a file
+is re-read when its mtime changes, and templates built from it are rebuilt;
+otherwise files are read once per process.
+"""
+
+import os
+import time
+from pathlib import Path
+from string import Formatter
+from typing import Optional
+
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Minimum seconds between mtime checks of the same file in hot-reload mode
+HOT_RELOAD_CHECK_INTERVAL = 1.0
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class PromptTemplate:
+    """An immutable str.format template with optional pre-bound fields."""
+
+    __slots__ = ("source", "fields", "_compiled")
+
+    def __init__(self, source: str, **bound):
+        parts = []
+        fields = set()
+        for literal, field, spec, conversion in Formatter().parse(source):
+            parts.append(_escape_braces(literal))
+            if field is None:
+                continue
+            if field in bound:
+                value = format(bound[field] if conversion is None else
+                               {"r": repr, "s": str, "a": ascii}[conversion](bound[field]), spec or "")
+                parts.append(_escape_braces(value))
+            else:
+                fields.add(field)
+                parts.append("{" + field + (f"!{conversion}" if conversion else "") +
+                             (f":{spec}" if spec else "") + "}")
+
+        object.__setattr__(self, "source", source)
+        object.__setattr__(self, "fields", frozenset(fields))
+        object.__setattr__(self, "_compiled", "".join(parts))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PromptTemplate is immutable")
+
+    def bind(self, **bound) -> "PromptTemplate":
+        """A new template with more fields filled in."""
+        return PromptTemplate(self._compiled, **bound)
+
+    def format(self, **fields) -> str:
+        return self._compiled.format(**fields)
+
+    def __str__(self) -> str:
+        return self._compiled
+
+
+class PromptAssets:
+    """Cached prompt files plus templates derived from them."""
+
+    def __init__(self, root: Path = ROOT_DIR, hot_reload: bool = False):
+        self.root = Path(root)
+        self.hot_reload = hot_reload
+        self._files = {}       # relpath -> (mtime_ns, text, checked_at)
+        self._templates = {}   # name -> (file versions, PromptTemplate)
+
+    def _version(self, relpath: str) -> int:
+        try:
+            return os.stat(self.root / relpath).st_mtime_ns
+        except OSError:
+            return 0
+
+    def text(self, relpath: str, default: Optional[str] = None) -> str:
+        """File contents relative to the repo root, or `default` if it can't be read."""
+        cached = self._files.get(relpath)
+        now = time.monotonic()
+        if cached and (not self.hot_reload or now - cached[2] < HOT_RELOAD_CHECK_INTERVAL):
+            return cached[1]
+
+        version = self._version(relpath)
+        if cached and cached[0] == version:
+            self._files[relpath] = (version, cached[1], now)
+            return cached[1]
+
+        try:
+            text = (self.root / relpath).read_text()
+        except OSError:
+            if default is None:
+                raise
+            text = default
+        if cached and self.hot_reload:
+            print(f"Reloaded prompt asset: {relpath}")
+        self._files[relpath] = (version, text, now)
+        return text
+
+    def template(self, name: str, source: str, files: Optional[dict] = None,
+                 defaults: Optional[dict] = None) -> PromptTemplate:
+        """A template with `files` ({field: relpath}) bound to their contents.
+
+        Built once and reused; rebuilt only when a bound file changes (in
+        hot-reload mode).
+        """
+        files = files or {}
+        defaults = defaults or {}
+        contents = {field: self.text(path, defaults.get(field)) for field, path in files.items()}
+        versions = tuple(self._files[path][0] for path in files.values())
+
+        cached = self._templates.get(name)
+        if cached and cached[0] == versions:
+            return cached[1]
+
+        template = PromptTemplate(source, **contents)
+        self._templates[name] = (versions, template)
+        return template
@@ -0,0 +1,215 @@
+"""
+Report Build - incremental batch rendering of ReportData JSON.
+
+A build manifest (<out>/.build-manifest.json) records, per input file, what
+its page was last built from: the input JSON hash, the renderer version,
+the shared stylesheet/script hashes and the render options. A rebuild
+renders only reports whose record no longer matches, and can say why.
+
+Two inputs with the same slug would write the same page, so the build
+refuses to start. Pages whose input was removed (or renamed its slug) are
+deleted along with their manifest entries.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from .report_renderer import REPORT_CSS_HASH, REPORT_JS_HASH, RENDERER_VERSION, render_to_file
+from .report_schema import ReportData
+
+
+MANIFEST_FILENAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+
+class ReportBuildError(Exception):
+    """The inputs can't be built together (e.g. two of them have the same slug)."""
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def build_fingerprint(options: dict) -> dict:
+    """Everything besides the input that a rendered page depends on."""
+    return {
+        "renderer": RENDERER_VERSION,
+        "css": REPORT_CSS_HASH,
+        "js": REPORT_JS_HASH,
+        "options": dict(sorted(options.items())),
+    }
+
+
+class BuildManifest:
+    """Per-input build records for one output directory."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILENAME
+        self.reports = {}
+        try:
+            manifest = json.loads(self.path.read_text())
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.reports = manifest.get("reports", {})
+        except (OSError, ValueError):
+            pass
+
+    def stale_reasons(self, name: str, input_hash: str, fingerprint: dict) -> list:
+        """Why the page for `name` must be rebuilt; empty if it's up to date."""
+        previous = self.reports.get(name)
+        if not previous:
+            return ["not built yet"]
+
+        reasons = []
+        if previous.get("input_hash") != input_hash:
+            reasons.append("input changed")
+        if previous.get("renderer") != fingerprint["renderer"]:
+            reasons.append(f"renderer changed ({previous.get('renderer')} -> {fingerprint['renderer']})")
+        if previous.get("css") != fingerprint["css"]:
+            reasons.append(f"stylesheet changed ({previous.get('css')} -> {fingerprint['css']})")
+        if previous.get("js") != fingerprint["js"]:
+            reasons.append(f"script changed ({previous.get('js')} -> {fingerprint['js']})")
+        if previous.get("options") != fingerprint["options"]:
+            reasons.append("render options changed")
+        if not (self.output_dir / previous.get("output", "")).is_file():
+            reasons.append("output missing")
+        return reasons
+
+    def record(self, name: str, input_hash: str, fingerprint: dict, output: str):
+        self.reports[name] = {"input_hash": input_hash, **fingerprint, "output": output}
+
+    def save(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "reports": self.reports}, indent=1, sort_keys=True))
+        os.replace(tmp, self.path)
+
+
+def plan_build(input_dir: Path, manifest: BuildManifest, options: dict, force: bool = False) -> tuple:
+    """(input hashes by name, [(path, reasons)] to rebuild) for every *.json in input_dir."""
+    fingerprint = build_fingerprint(options)
+    hashes = {}
+    stale = []
+    for path in sorted(Path(input_dir).glob("*.json")):
+        hashes[path.name] = file_hash(path)
+        reasons = ["forced"] if force else manifest.stale_reasons(path.name, hashes[path.name], fingerprint)
+        if reasons:
+            stale.append((path, reasons))
+    return hashes, stale
+
+
+def planned_outputs(input_dir: Path, hashes: dict, stale: list, manifest: BuildManifest) -> dict:
+    """Input name -> page it renders to: from the manifest if up to date, else the input's slug.
+
+    Raises ReportBuildError if two inputs render to the same page. An input
+    without a readable slug keeps its previous page, if any; it fails
+    validation when rendered.
+    """
+    stale_names = {path.name for path, _ in stale}
+    outputs = {}
+    for name in hashes:
+        if name not in stale_names:
+            outputs[name] = manifest.reports[name]["output"]
+            continue
+        try:
+            slug = json.loads((Path(input_dir) / name).read_bytes()).get("slug")
+        except (OSError, ValueError, AttributeError):
+            slug = None
+        if isinstance(slug, str) and slug:
+            outputs[name] = f"{slug}.html"
+        elif name in manifest.reports:
+            outputs[name] = manifest.reports[name]["output"]  # Keep the last good page until it's fixed
+
+    sources = {}
+    for name, output in sorted(outputs.items()):
+        if output in sources:
+            raise ReportBuildError(
+                f"{Path(input_dir) / sources[output]} and {Path(input_dir) / name} both render to {output}")
+        sources[output] = name
+    return outputs
+
+
+def render_one(job: tuple) -> tuple:
+    """Validate and render one input. Returns (input name, output name or None, error or None)."""
+    input_path, output_dir, options = job
+    try:
+        data = ReportData.model_validate_json(Path(input_path).read_bytes())
+    except ValidationError as e:
+        problems = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()[:5])
+        return input_path.name, None, f"invalid ReportData ({e.error_count()} errors): {problems}"
+    except OSError as e:
+        return input_path.name, None, str(e)
+
+    # Any renderer error (bad chart data, ...) fails this report only, not the whole build
+    output_name = f"{data.slug}.html"
+    try:
+        render_to_file(data, str(Path(output_dir) / output_name), **options)
+    except Exception as e:
+        return input_path.name, None, f"render failed: {type(e).__name__}: {e}"
+    return input_path.name, output_name, None
+
+
+def build_reports(input_dir: Path, output_dir: Path, options: Optional[dict] = None, jobs: int = 1,
+                  force: bool = False, explain: bool = False) -> dict:
+    """Render the stale reports in input_dir into output_dir and update the manifest.
+
+    `options` are render_to_file keyword arguments (css_mode, js_mode, ...).
+    Returns counts: total, unchanged, rendered, failed, removed. Raises
+    ReportBuildError, before rendering anything, if two inputs share a slug.
+    """
+    options = options or {}
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = BuildManifest(output_dir)
+    hashes, stale = plan_build(input_dir, manifest, options, force)
+    outputs = planned_outputs(input_dir, hashes, stale, manifest)
+    if explain:
+        for path, reasons in stale:
+            print(f"  {path.name}: {', '.join(reasons)}")
+
+    work = [(path, output_dir, options) for path, _ in stale]
+    if len(work) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            results = list(pool.map(render_one, work, chunksize=max(1, len(work) // (jobs * 4))))
+    else:
+        results = [render_one(job) for job in work]
+
+    # Inputs that disappeared drop out of the manifest and their pages are deleted,
+    # as are pages left behind by a changed slug; failures stay stale
+    previous_outputs = {entry.get("output") for entry in manifest.reports.values()}
+    removed = 0
+    for output in sorted(previous_outputs - set(outputs.values()) - {None}):
+        try:
+            (output_dir / output).unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    kept = {name: entry for name, entry in manifest.reports.items() if name in hashes}
+    changed = bool(results) or len(kept) != len(manifest.reports)
+    manifest.reports = kept
+    fingerprint = build_fingerprint(options)
+    failed = 0
+    for name, output_name, error in results:
+        if error:
+            failed += 1
+            manifest.reports.pop(name, None)
+            print(f"  ✗ {name}: {error}")
+        else:
+            manifest.record(name, hashes[name], fingerprint, output_name)
+    if changed:
+        manifest.save()
+
+    return {
+        "total": len(hashes),
+        "unchanged": len(hashes) - len(stale),
+        "rendered": len(results) - failed,
+        "failed": failed,
+        "removed": removed,
+    }
@@ -6,9 +6,13 @@ This renderer adds ALL branding, layout, and structure.
 Branding is NEVER the AI's responsibility.
 """
 
+import hashlib
 import json
+import os
+import textwrap
 from datetime import date
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional
 from .report_schema import ReportData, Verdict, TagColor, ChartData, Section
 
 
@@ -47,80 +51,10 @@ VERDICT_COLORS = {
 }
 
 
-def render_report(data: ReportData) -> str:
-    """
-    Render a complete HTML report from ReportData.
-
-    ALL branding is handled here - the AI never touches it.
-    """
-
-    tag_bg, tag_color = TAG_COLORS.get(data.tag_color, TAG_COLORS[TagColor.BLUE])
-    verdict_color = VERDICT_COLORS.get(data.verdict, COLORS["accent_cyan"]) if data.verdict else None
-
-    # Sort sources by trust score
-    sources_sorted = sorted(data.sources, key=lambda s: s.trust_score, reverse=True)
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{data.title} | GenuVerity</title>
-    <meta name="description" content="{data.executive_summary.reality[:160]}">
-    <meta property="og:title" content="{data.title}">
-    <meta property="og:description" content="{data.executive_summary.reality[:160]}">
-    <meta property="og:type" content="article">
-    <meta name="theme-color" content="#0a0a12">
-    <link rel="icon" type="image/x-icon" href="favicon.ico">
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://unpkg.com/lucide@latest"></script>
-    <script src="https://cdn.jsdelivr.net/npm/html-to-image@1.11.11/dist/html-to-image.min.js"></script>
-    {_render_styles()}
-</head>
-<body>
-    <div class="bg-grid"></div>
-    <div class="bg-glow"></div>
-
-    {_render_navbar()}
-
-    {_render_mobile_notice()}
-
-    {_render_sources_banner(sources_sorted)}
-
-    <main class="main-content">
-        <article class="report-article">
-            {_render_header(data, tag_bg, tag_color, verdict_color)}
-
-            {_render_executive_summary(data)}
-
-            {_render_sections(data.sections)}
-
-            {_render_bottom_line(data.bottom_line)}
-
-            {_render_sources_grid(sources_sorted)}
-
-            {_render_feedback_form(data.slug)}
-        </article>
-    </main>
-
-    {_render_footer()}
-
-    {_render_share_modal()}
-
-    {_render_scripts(data)}
-</body>
-</html>"""
-
-    return html
-
-
-def _render_styles() -> str:
-    """Render the CSS styles - ALL branding lives here."""
-    return """
-    <style>
+# Report stylesheet. Inlined into every report by default; in "external"
+# mode it's written once as css/report.<hash>.css and linked instead, so
+# browsers cache it across all reports (vercel.json serves *.css immutable).
+REPORT_CSS = """\
         :root {
             --bg-primary: #050A14;
             --bg-secondary: #0a0f1a;
@@ -878,441 +812,203 @@ def _render_styles() -> str:
             background: linear-gradient(135deg, var(--accent-blue), var(--accent-cyan));
             border: none;
         }
-    </style>
-    """
+"""
 
+REPORT_CSS_HASH = hashlib.sha256(textwrap.dedent(REPORT_CSS).encode()).hexdigest()[:10]
+REPORT_CSS_FILENAME = f"report.{REPORT_CSS_HASH}.css"
+DEFAULT_CSS_DIR = Path(__file__).parent.parent / "css"
+DEFAULT_CSS_URL = "/css"
+
+# Selectors styled before the first scroll: page chrome and the report header
+CRITICAL_SELECTORS = (
+    ":root", "*", "body", ".bg-grid", ".bg-glow", ".navbar", ".logo-", ".mobile-notice",
+    ".sources-banner", ".sources-toggle", ".main-content", ".report-article", ".report-header",
+    ".report-tag", ".report-title", ".report-subtitle", ".report-meta", ".verdict-badge",
+)
+
+
+def _css_rules(css: str) -> list:
+    """Split a stylesheet into top-level (prelude, body) pairs."""
+    rules = []
+    depth = 0
+    prelude_start = body_start = 0
+    for i, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                body_start = i + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                prelude = css[prelude_start:body_start - 1].strip()
+                rules.append((prelude, css[body_start:i]))
+                prelude_start = i + 1
+    return rules
+
+
+def _extract_critical_css(css: str) -> str:
+    """Rules (including inside @media blocks) whose selectors are all CRITICAL_SELECTORS."""
+    out = []
+    for prelude, body in _css_rules(css):
+        if prelude.startswith("@"):
+            inner = _extract_critical_css(body)
+            if inner:
+                out.append(f"{prelude}{{{inner}}}")
+            continue
+        selectors = [sel.strip() for sel in prelude.split(",")]
+        if all(sel.startswith(CRITICAL_SELECTORS) for sel in selectors):
+            declarations = ";".join(d.strip() for d in body.split(";") if d.strip())
+            out.append(f"{','.join(selectors)}{{{declarations}}}")
+    return "".join(out)
+
+
+CRITICAL_CSS = _extract_critical_css(REPORT_CSS)
+
+
+def _write_asset(path: Path, content: str) -> Path:
+    """Atomically write a content-hashed asset unless it already exists."""
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(content)
+        os.replace(tmp, path)
+    return path
+
+
+def write_stylesheet(css_dir: Path = DEFAULT_CSS_DIR) -> Path:
+    """Write the hashed report stylesheet into css_dir (once) and return its path."""
+    return _write_asset(Path(css_dir) / REPORT_CSS_FILENAME, textwrap.dedent(REPORT_CSS))
+
+
+# Report behaviour: icons, charts, sources banner, feedback, copy/share.
+# Identical for every report; chart configs come from the page's data island.
+REPORT_JS = """\
+        // Initialize Lucide icons and copy/share functionality
+        document.addEventListener('DOMContentLoaded', () => {
+            lucide.createIcons();
+            initCharts();
+            initCopyShare();
+        });
 
-def _render_navbar() -> str:
-    """Render the navigation bar with GenuVerity branding."""
-    return """
-    <nav class="navbar">
-        <a href="/" class="navbar-brand">
-            <span class="navbar-logo">
-                <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
-            </span>
-            <span class="navbar-badge">COMING SOON</span>
-        </a>
-        <div style="display:flex;gap:12px;">
-            <a href="reports.html" style="color:var(--text-secondary);text-decoration:none;font-size:0.9rem;display:flex;align-items:center;gap:6px;">
-                <i data-lucide="file-text" style="width:16px;height:16px;"></i> Reports
-            </a>
-        </div>
-    </nav>
-    """
+        // Chart.js GenuVerity watermark plugin
+        const watermarkPlugin = {
+            id: 'genuverityWatermark',
+            afterDraw: (chart) => {
+                const ctx = chart.ctx;
+                ctx.save();
+                ctx.font = '12px Inter';
+                ctx.textAlign = 'right';
+                ctx.textBaseline = 'bottom';
+                const x = chart.width - 10;
+                const y = chart.height - 10;
+                ctx.fillStyle = '#ffffff';
+                ctx.fillText('Genu', x - 35, y);
+                ctx.fillStyle = '#3b82f6';
+                ctx.fillText('Verity', x, y);
+                ctx.restore();
+            }
+        };
 
+        Chart.register(watermarkPlugin);
 
-def _render_mobile_notice() -> str:
-    """Render the mobile notice banner."""
-    return """
-    <div class="mobile-notice" id="mobileNotice">
-        <div style="display:flex;justify-content:space-between;align-items:start;margin-bottom:12px;">
-            <span style="font-weight:600;">Best on Desktop</span>
-            <button onclick="document.getElementById('mobileNotice').classList.add('dismissed')"
-                    style="background:none;border:none;color:var(--text-muted);cursor:pointer;">
-                <i data-lucide="x" style="width:18px;height:18px;"></i>
-            </button>
-        </div>
-        <p style="color:var(--text-secondary);font-size:0.85rem;">
-            This report includes interactive charts and detailed analysis best viewed on a larger screen.
-        </p>
-    </div>
-    """
+        function initCharts() {
+            Chart.defaults.color = '#a0aec0';
+            Chart.defaults.borderColor = 'rgba(59, 130, 246, 0.1)';
+            const island = document.getElementById('reportCharts');
+            if (!island) return;
+            const charts = JSON.parse(island.textContent);
+            Object.keys(charts).forEach(id => {
+                new Chart(document.getElementById(id), charts[id]);
+            });
+        }
 
+        // Sources banner toggle
+        let bannerCollapsed = false;
+        function toggleSourcesBanner() {
+            const banner = document.getElementById('sourcesBanner');
+            const chevron = document.getElementById('sourcesChevron');
+            bannerCollapsed = !bannerCollapsed;
+            banner.classList.toggle('collapsed', bannerCollapsed);
+            chevron.style.transform = bannerCollapsed ? 'rotate(-90deg)' : '';
+        }
 
-def _render_sources_banner(sources: list) -> str:
-    """Render the collapsible sources banner."""
-    source_chips = ""
-    for src in sources[:8]:  # Show top 8 in banner
-        tier = "tier1" if src.trust_score >= 90 else "tier2" if src.trust_score >= 80 else "tier3"
-        source_chips += f"""
-        <a href="{src.url}" target="_blank" rel="noopener" class="source-chip">
-            <span class="source-score {tier}">{src.trust_score}</span>
-            <div>
-                <div class="source-name">{src.name}</div>
-                <div class="source-domain">{src.domain}</div>
-            </div>
-        </a>
-        """
+        // Feedback form
+        async function submitFeedback(e, slug) {
+            e.preventDefault();
+            const email = document.getElementById('feedbackEmail').value;
+            const text = document.getElementById('feedbackText').value;
 
-    return f"""
-    <div class="sources-banner" id="sourcesBanner">
-        <div class="sources-toggle" onclick="toggleSourcesBanner()">
-            <h3>
-                <i data-lucide="shield-check" style="width:18px;height:18px;"></i>
-                Sources First: {len(sources)} Verified Sources
-            </h3>
-            <i data-lucide="chevron-down" id="sourcesChevron" style="width:18px;height:18px;color:var(--text-muted);"></i>
-        </div>
-        <div class="sources-list">
-            {source_chips}
-        </div>
-    </div>
-    """
+            try {
+                await fetch('/api/feedback', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ slug, email, text })
+                });
+                alert('Thank you for your feedback!');
+                document.getElementById('feedbackForm').reset();
+            } catch (err) {
+                alert('Error submitting feedback. Please try again.');
+            }
+        }
 
+        // ============================================
+        // Copy/Share as Image Functionality
+        // ============================================
+        const COPYABLE_SELECTORS = [
+            '.exec-summary',
+            '.bottom-line',
+            '.float-figure',
+            '.quote-box',
+            '.timeline',
+            '.source-card',
+            '.claim-box',
+            '.reality-box',
+            '.verdict-badge'
+        ];
 
-def _render_header(data: ReportData, tag_bg: str, tag_color: str, verdict_color: Optional[str]) -> str:
-    """Render the report header."""
-    verdict_html = ""
-    if data.verdict:
-        verdict_html = f"""
-        <div class="verdict-badge" style="background: {verdict_color}20; color: {verdict_color};">
-            <i data-lucide="check-circle" style="width:20px;height:20px;"></i>
-            {data.verdict.value}
-        </div>
-        """
+        let currentShareBlob = null;
+        let currentShareUrl = null;
 
-    return f"""
-    <header class="report-header">
-        <span class="report-tag" style="background: {tag_bg}; color: {tag_color};">
-            <i data-lucide="tag" style="width:14px;height:14px;"></i>
-            {data.tag_label}
-        </span>
-        <h1 class="report-title">{data.title}</h1>
-        {f'<p class="report-subtitle">{data.subtitle}</p>' if data.subtitle else ''}
-        <div class="report-meta">
-            <span><i data-lucide="calendar" style="width:16px;height:16px;"></i> {data.publish_date.strftime('%B %d, %Y')}</span>
-            <span><i data-lucide="link" style="width:16px;height:16px;"></i> {len(data.sources)} Sources</span>
-            {verdict_html}
-        </div>
-    </header>
-    """
+        function initCopyShare() {
+            COPYABLE_SELECTORS.forEach(selector => {
+                document.querySelectorAll(selector).forEach(el => {
+                    // Skip if already initialized
+                    if (el.classList.contains('copyable-component')) return;
 
+                    el.classList.add('copyable-component');
 
-def _render_executive_summary(data: ReportData) -> str:
-    """Render the executive summary section."""
-    key_points_html = "\n".join([f"<li>{point}</li>" for point in data.executive_summary.key_points])
+                    // Create action buttons container
+                    const actions = document.createElement('div');
+                    actions.className = 'component-actions';
+                    actions.innerHTML = `
+                        <button class="component-action-btn copy-btn" title="Copy as image">
+                            <i data-lucide="copy" style="width:16px;height:16px;"></i>
+                        </button>
+                        <button class="component-action-btn share-btn" title="Share">
+                            <i data-lucide="share-2" style="width:16px;height:16px;"></i>
+                        </button>
+                    `;
 
-    return f"""
-    <section class="exec-summary">
-        <h2>
-            <i data-lucide="clipboard-list" style="width:20px;height:20px;"></i>
-            Executive Summary
-        </h2>
-        <div class="claim-reality-grid">
-            <div class="claim-box">
-                <div class="box-label">The Claim</div>
-                <p style="color:var(--text-primary);">{data.executive_summary.claim}</p>
-            </div>
-            <div class="reality-box">
-                <div class="box-label">The Reality</div>
-                <p style="color:var(--text-primary);">{data.executive_summary.reality}</p>
-            </div>
-        </div>
-        <ul class="key-points">
-            {key_points_html}
-        </ul>
-    </section>
-    """
+                    el.appendChild(actions);
 
+                    // Add click handlers
+                    actions.querySelector('.copy-btn').addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        copyComponentAsImage(el, actions.querySelector('.copy-btn'));
+                    });
 
-def _render_sections(sections: list[Section]) -> str:
-    """Render content sections."""
-    html = '<div class="clearfix">'
+                    actions.querySelector('.share-btn').addEventListener('click', (e) => {
+                        e.stopPropagation();
+                        shareComponent(el);
+                    });
+                });
+            });
 
-    for i, section in enumerate(sections):
-        # Chart if present
-        chart_html = ""
-        if section.chart:
-            float_class = f"float-figure {section.float_position or 'right'}"
-            chart_html = f"""
-            <figure class="{float_class}">
-                <div class="chart-title">{section.chart.title}</div>
-                <canvas id="chart_{i}"></canvas>
-            </figure>
-            """
+            // Re-initialize lucide icons for new buttons
+            lucide.createIcons();
+        }
 
-        # Quote if present
-        quote_html = ""
-        if section.quote:
-            quote_html = f"""
-            <div class="quote-box">
-                <p class="quote-text">"{section.quote.text}"</p>
-                <p class="quote-attribution">— {section.quote.attribution}</p>
-            </div>
-            """
-
-        # Timeline if present
-        timeline_html = ""
-        if section.timeline:
-            events = ""
-            for event in section.timeline:
-                key_class = "key" if event.is_key else ""
-                events += f"""
-                <div class="timeline-event {key_class}">
-                    <div class="timeline-date">{event.date}</div>
-                    <div class="timeline-title">{event.title}</div>
-                    <div class="timeline-desc">{event.description}</div>
-                </div>
-                """
-            timeline_html = f'<div class="timeline">{events}</div>'
-
-        html += f"""
-        <h2 class="prose-h2">{section.heading}</h2>
-        {chart_html}
-        <p class="prose-text">{section.content}</p>
-        {quote_html}
-        {timeline_html}
-        """
-
-    html += '</div>'
-    return html
-
-
-def _render_bottom_line(text: str) -> str:
-    """Render the bottom line section."""
-    return f"""
-    <section class="bottom-line">
-        <h2>
-            <i data-lucide="check-circle" style="width:20px;height:20px;"></i>
-            The Bottom Line
-        </h2>
-        <p>{text}</p>
-    </section>
-    """
-
-
-def _render_sources_grid(sources: list) -> str:
-    """Render the sources grid section."""
-    cards = ""
-    for src in sources:
-        tier = "tier1" if src.trust_score >= 90 else "tier2" if src.trust_score >= 80 else "tier3"
-        cards += f"""
-        <a href="{src.url}" target="_blank" rel="noopener" class="source-card">
-            <div class="source-card-header">
-                <span class="source-card-name">{src.name}</span>
-                <span class="source-score {tier}">{src.trust_score}</span>
-            </div>
-            <div class="source-card-domain">{src.domain}</div>
-        </a>
-        """
-
-    return f"""
-    <section class="sources-section">
-        <h2>
-            <i data-lucide="book-open" style="width:20px;height:20px;color:var(--accent-cyan);"></i>
-            Sources First
-        </h2>
-        <div class="sources-grid">
-            {cards}
-        </div>
-    </section>
-    """
-
-
-def _render_feedback_form(slug: str) -> str:
-    """Render the feedback form."""
-    return f"""
-    <section class="feedback-section">
-        <h2>
-            <i data-lucide="message-square" style="width:20px;height:20px;color:var(--accent-cyan);"></i>
-            Report Feedback
-        </h2>
-        <form class="feedback-form" id="feedbackForm" onsubmit="submitFeedback(event, '{slug}')">
-            <input type="email" class="feedback-input" placeholder="Your email (optional)" id="feedbackEmail">
-            <textarea class="feedback-textarea" placeholder="Found an error? Have additional sources? Let us know..." id="feedbackText" required></textarea>
-            <button type="submit" class="feedback-btn">
-                <i data-lucide="send" style="width:16px;height:16px;"></i>
-                Submit Feedback
-            </button>
-        </form>
-    </section>
-    """
-
-
-def _render_footer() -> str:
-    """Render the footer with GenuVerity branding."""
-    return """
-    <footer class="footer">
-        <div class="footer-brand">
-            <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
-        </div>
-        <p>AI-Powered Investigative Journalism</p>
-    </footer>
-    """
-
-
-def _render_share_modal() -> str:
-    """Render the share modal HTML."""
-    return """
-    <div class="share-modal-overlay" id="shareModalOverlay" onclick="closeShareModal(event)">
-        <div class="share-modal" onclick="event.stopPropagation()">
-            <div class="share-modal-header">
-                <h3>Share this content</h3>
-                <button class="share-modal-close" onclick="closeShareModal()">
-                    <i data-lucide="x" style="width:20px;height:20px;"></i>
-                </button>
-            </div>
-            <div class="share-preview">
-                <img id="sharePreviewImg" src="" alt="Preview">
-            </div>
-            <div class="share-actions">
-                <button class="share-btn primary" onclick="downloadShareImage()">
-                    <i data-lucide="download" style="width:18px;height:18px;"></i>
-                    Download Image
-                </button>
-                <button class="share-btn" onclick="copyReportLink()">
-                    <i data-lucide="link" style="width:18px;height:18px;"></i>
-                    Copy Report Link
-                </button>
-                <a class="share-btn" id="shareTwitter" href="#" target="_blank" rel="noopener">
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor"><path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"/></svg>
-                    Share on X
-                </a>
-                <a class="share-btn" id="shareLinkedIn" href="#" target="_blank" rel="noopener">
-                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor"><path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/></svg>
-                    Share on LinkedIn
-                </a>
-            </div>
-        </div>
-    </div>
-    """
-
-
-def _render_scripts(data: ReportData) -> str:
-    """Render JavaScript including Chart.js with watermark."""
-    chart_configs = []
-
-    for i, section in enumerate(data.sections):
-        if section.chart:
-            config = {
-                "type": section.chart.chart_type,
-                "data": {
-                    "labels": section.chart.labels,
-                    "datasets": section.chart.datasets
-                },
-                "options": section.chart.options or {}
-            }
-            chart_configs.append((i, config))
-
-    chart_init = ""
-    for i, config in chart_configs:
-        chart_init += f"""
-        new Chart(document.getElementById('chart_{i}'), {json.dumps(config)});
-        """
-
-    return f"""
-    <script>
-        // Initialize Lucide icons and copy/share functionality
-        document.addEventListener('DOMContentLoaded', () => {{
-            lucide.createIcons();
-            initCharts();
-            initCopyShare();
-        }});
-
-        // Chart.js GenuVerity watermark plugin
-        const watermarkPlugin = {{
-            id: 'genuverityWatermark',
-            afterDraw: (chart) => {{
-                const ctx = chart.ctx;
-                ctx.save();
-                ctx.font = '12px Inter';
-                ctx.textAlign = 'right';
-                ctx.textBaseline = 'bottom';
-                const x = chart.width - 10;
-                const y = chart.height - 10;
-                ctx.fillStyle = '#ffffff';
-                ctx.fillText('Genu', x - 35, y);
-                ctx.fillStyle = '#3b82f6';
-                ctx.fillText('Verity', x, y);
-                ctx.restore();
-            }}
-        }};
-
-        Chart.register(watermarkPlugin);
-
-        function initCharts() {{
-            Chart.defaults.color = '#a0aec0';
-            Chart.defaults.borderColor = 'rgba(59, 130, 246, 0.1)';
-            {chart_init}
-        }}
-
-        // Sources banner toggle
-        let bannerCollapsed = false;
-        function toggleSourcesBanner() {{
-            const banner = document.getElementById('sourcesBanner');
-            const chevron = document.getElementById('sourcesChevron');
-            bannerCollapsed = !bannerCollapsed;
-            banner.classList.toggle('collapsed', bannerCollapsed);
-            chevron.style.transform = bannerCollapsed ? 'rotate(-90deg)' : '';
-        }}
-
-        // Feedback form
-        async function submitFeedback(e, slug) {{
-            e.preventDefault();
-            const email = document.getElementById('feedbackEmail').value;
-            const text = document.getElementById('feedbackText').value;
-
-            try {{
-                await fetch('/api/feedback', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ slug, email, text }})
-                }});
-                alert('Thank you for your feedback!');
-                document.getElementById('feedbackForm').reset();
-            }} catch (err) {{
-                alert('Error submitting feedback. Please try again.');
-            }}
-        }}
-
-        // ============================================
-        // Copy/Share as Image Functionality
-        // ============================================
-        const COPYABLE_SELECTORS = [
-            '.exec-summary',
-            '.bottom-line',
-            '.float-figure',
-            '.quote-box',
-            '.timeline',
-            '.source-card',
-            '.claim-box',
-            '.reality-box',
-            '.verdict-badge'
-        ];
-
-        let currentShareBlob = null;
-        let currentShareUrl = null;
-
-        function initCopyShare() {{
-            COPYABLE_SELECTORS.forEach(selector => {{
-                document.querySelectorAll(selector).forEach(el => {{
-                    // Skip if already initialized
-                    if (el.classList.contains('copyable-component')) return;
-
-                    el.classList.add('copyable-component');
-
-                    // Create action buttons container
-                    const actions = document.createElement('div');
-                    actions.className = 'component-actions';
-                    actions.innerHTML = `
-                        <button class="component-action-btn copy-btn" title="Copy as image">
-                            <i data-lucide="copy" style="width:16px;height:16px;"></i>
-                        </button>
-                        <button class="component-action-btn share-btn" title="Share">
-                            <i data-lucide="share-2" style="width:16px;height:16px;"></i>
-                        </button>
-                    `;
-
-                    el.appendChild(actions);
-
-                    // Add click handlers
-                    actions.querySelector('.copy-btn').addEventListener('click', (e) => {{
-                        e.stopPropagation();
-                        copyComponentAsImage(el, actions.querySelector('.copy-btn'));
-                    }});
-
-                    actions.querySelector('.share-btn').addEventListener('click', (e) => {{
-                        e.stopPropagation();
-                        shareComponent(el);
-                    }});
-                }});
-            }});
-
-            // Re-initialize lucide icons for new buttons
-            lucide.createIcons();
-        }}
-
-        async function captureComponent(element) {{
+        async function captureComponent(element) {
             // Add capturing state
             element.classList.add('capturing');
 
@@ -1320,34 +1016,34 @@ def _render_scripts(data: ReportData) -> str:
             const actions = element.querySelector('.component-actions');
             if (actions) actions.style.display = 'none';
 
-            try {{
+            try {
                 // Wait for any animations
                 await new Promise(r => setTimeout(r, 100));
 
                 // Capture with html-to-image
-                const dataUrl = await htmlToImage.toPng(element, {{
+                const dataUrl = await htmlToImage.toPng(element, {
                     pixelRatio: 2,
                     backgroundColor: '#0a0f1a',
-                    style: {{
+                    style: {
                         transform: 'none',
                         borderRadius: '12px'
-                    }}
-                }});
+                    }
+                });
 
                 // Add GenuVerity watermark
                 const watermarkedUrl = await addWatermark(dataUrl);
                 return watermarkedUrl;
 
-            }} finally {{
+            } finally {
                 element.classList.remove('capturing');
                 if (actions) actions.style.display = '';
-            }}
-        }}
+            }
+        }
 
-        function addWatermark(dataUrl) {{
-            return new Promise((resolve) => {{
+        function addWatermark(dataUrl) {
+            return new Promise((resolve) => {
                 const img = new Image();
-                img.onload = () => {{
+                img.onload = () => {
                     const canvas = document.createElement('canvas');
                     canvas.width = img.width;
                     canvas.height = img.height;
@@ -1387,13 +1083,13 @@ def _render_scripts(data: ReportData) -> str:
                     ctx.fillText('Verity', pillX + padding + genuWidth, textY);
 
                     resolve(canvas.toDataURL('image/png'));
-                }};
+                };
                 img.src = dataUrl;
-            }});
-        }}
+            });
+        }
 
-        async function copyComponentAsImage(element, button) {{
-            try {{
+        async function copyComponentAsImage(element, button) {
+            try {
                 const dataUrl = await captureComponent(element);
 
                 // Convert to blob
@@ -1401,9 +1097,9 @@ def _render_scripts(data: ReportData) -> str:
                 const blob = await response.blob();
 
                 // Try clipboard API
-                if (navigator.clipboard && navigator.clipboard.write) {{
+                if (navigator.clipboard && navigator.clipboard.write) {
                     await navigator.clipboard.write([
-                        new ClipboardItem({{ 'image/png': blob }})
+                        new ClipboardItem({ 'image/png': blob })
                     ]);
 
                     // Success feedback
@@ -1411,52 +1107,52 @@ def _render_scripts(data: ReportData) -> str:
                     button.innerHTML = '<i data-lucide="check" style="width:16px;height:16px;"></i>';
                     lucide.createIcons();
 
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         button.classList.remove('success');
                         button.innerHTML = '<i data-lucide="copy" style="width:16px;height:16px;"></i>';
                         lucide.createIcons();
-                    }}, 2000);
-                }} else {{
+                    }, 2000);
+                } else {
                     // Fallback - open share modal with download option
                     showShareModal(dataUrl, blob);
-                }}
-            }} catch (err) {{
+                }
+            } catch (err) {
                 console.error('Copy failed:', err);
                 alert('Could not copy to clipboard. Try the share button instead.');
-            }}
-        }}
+            }
+        }
 
-        async function shareComponent(element) {{
-            try {{
+        async function shareComponent(element) {
+            try {
                 const dataUrl = await captureComponent(element);
                 const response = await fetch(dataUrl);
                 const blob = await response.blob();
 
                 // Try Web Share API with file
-                if (navigator.share && navigator.canShare) {{
-                    const file = new File([blob], 'genuverity-share.png', {{ type: 'image/png' }});
-                    const shareData = {{
+                if (navigator.share && navigator.canShare) {
+                    const file = new File([blob], 'genuverity-share.png', { type: 'image/png' });
+                    const shareData = {
                         files: [file],
                         title: document.title,
                         url: window.location.href
-                    }};
+                    };
 
-                    if (navigator.canShare(shareData)) {{
+                    if (navigator.canShare(shareData)) {
                         await navigator.share(shareData);
                         return;
-                    }}
-                }}
+                    }
+                }
 
                 // Fallback to modal
                 showShareModal(dataUrl, blob);
-            }} catch (err) {{
-                if (err.name !== 'AbortError') {{
+            } catch (err) {
+                if (err.name !== 'AbortError') {
                     console.error('Share failed:', err);
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
-        function showShareModal(dataUrl, blob) {{
+        function showShareModal(dataUrl, blob) {
             currentShareBlob = blob;
             currentShareUrl = dataUrl;
 
@@ -1468,23 +1164,23 @@ def _render_scripts(data: ReportData) -> str:
             const title = encodeURIComponent(document.title);
 
             document.getElementById('shareTwitter').href =
-                `https://twitter.com/intent/tweet?text=${{title}}&url=${{pageUrl}}`;
+                `https://twitter.com/intent/tweet?text=${title}&url=${pageUrl}`;
             document.getElementById('shareLinkedIn').href =
-                `https://www.linkedin.com/sharing/share-offsite/?url=${{pageUrl}}`;
+                `https://www.linkedin.com/sharing/share-offsite/?url=${pageUrl}`;
 
             // Show modal
             document.getElementById('shareModalOverlay').classList.add('active');
             lucide.createIcons();
-        }}
+        }
 
-        function closeShareModal(event) {{
+        function closeShareModal(event) {
             if (event && event.target !== event.currentTarget) return;
             document.getElementById('shareModalOverlay').classList.remove('active');
             currentShareBlob = null;
             currentShareUrl = null;
-        }}
+        }
 
-        function downloadShareImage() {{
+        function downloadShareImage() {
             if (!currentShareUrl) return;
 
             const link = document.createElement('a');
@@ -1493,13 +1189,13 @@ def _render_scripts(data: ReportData) -> str:
             document.body.appendChild(link);
             link.click();
             document.body.removeChild(link);
-        }}
+        }
 
-        async function copyReportLink() {{
-            try {{
+        async function copyReportLink() {
+            try {
                 await navigator.clipboard.writeText(window.location.href);
                 alert('Report link copied!');
-            }} catch (err) {{
+            } catch (err) {
                 // Fallback
                 const input = document.createElement('input');
                 input.value = window.location.href;
@@ -1508,14 +1204,472 @@ def _render_scripts(data: ReportData) -> str:
                 document.execCommand('copy');
                 document.body.removeChild(input);
                 alert('Report link copied!');
-            }}
-        }}
-    </script>
+            }
+        }
+"""
+
+REPORT_JS_HASH = hashlib.sha256(textwrap.dedent(REPORT_JS).encode()).hexdigest()[:10]
+REPORT_JS_FILENAME = f"report.{REPORT_JS_HASH}.js"
+DEFAULT_JS_DIR = Path(__file__).parent.parent / "js"
+DEFAULT_JS_URL = "/js"
+
+
+def write_script(js_dir: Path = DEFAULT_JS_DIR) -> Path:
+    """Write the hashed report script bundle into js_dir (once) and return its path."""
+    return _write_asset(Path(js_dir) / REPORT_JS_FILENAME, textwrap.dedent(REPORT_JS))
+
+
+# Changes whenever the renderer or schema source changes, so batch builds
+# (scripts/render_reports.py) know previously rendered pages are stale.
+RENDERER_VERSION = hashlib.sha256(b"".join(
+    (Path(__file__).parent / name).read_bytes() for name in ("report_renderer.py", "report_schema.py")
+)).hexdigest()[:12]
+
+def render_report(data: ReportData, css_mode: str = "inline", css_url: str = DEFAULT_CSS_URL,
+                  critical_css: bool = False, js_mode: str = "inline", js_url: str = DEFAULT_JS_URL) -> str:
     """
+    Render a complete HTML report from ReportData.
 
+    ALL branding is handled here - the AI never touches it.
+    css_mode="external" links the shared stylesheet (see write_stylesheet)
+    instead of inlining it; critical_css inlines just the above-the-fold rules.
+    js_mode="external" does the same for the report script (see write_script).
+    """
+    return "".join(iter_report(data, css_mode, css_url, critical_css, js_mode, js_url))
+
+
+def iter_report(data: ReportData, css_mode: str = "inline", css_url: str = DEFAULT_CSS_URL,
+                critical_css: bool = False, js_mode: str = "inline", js_url: str = DEFAULT_JS_URL) -> Iterator[str]:
+    """
+    Yield the report HTML in document order (same options as render_report).
+
+    Nothing is concatenated, so chunks can go straight to a file or a
+    StreamingResponse and the browser starts on <head> before the sources
+    grid is built.
+    """
+    tag_bg, tag_color = TAG_COLORS.get(data.tag_color, TAG_COLORS[TagColor.BLUE])
+    verdict_color = VERDICT_COLORS.get(data.verdict, COLORS["accent_cyan"]) if data.verdict else None
+
+    # Sort sources by trust score
+    sources_sorted = sorted(data.sources, key=lambda s: s.trust_score, reverse=True)
+
+    yield f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{data.title} | GenuVerity</title>
+    <meta name="description" content="{data.executive_summary.reality[:160]}">
+    <meta property="og:title" content="{data.title}">
+    <meta property="og:description" content="{data.executive_summary.reality[:160]}">
+    <meta property="og:type" content="article">
+    <meta name="theme-color" content="#0a0a12">
+    <link rel="icon" type="image/x-icon" href="favicon.ico">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script src="https://unpkg.com/lucide@latest"></script>
+    <script src="https://cdn.jsdelivr.net/npm/html-to-image@1.11.11/dist/html-to-image.min.js"></script>
+    """
+    yield _render_styles(css_mode, css_url, critical_css)
+    yield """
+</head>
+<body>
+    <div class="bg-grid"></div>
+    <div class="bg-glow"></div>
+
+    """
+    yield _render_navbar()
+    yield "\n\n    "
+    yield _render_mobile_notice()
+    yield "\n\n    "
+    yield _render_sources_banner(sources_sorted)
+    yield """
+
+    <main class="main-content">
+        <article class="report-article">
+            """
+    yield _render_header(data, tag_bg, tag_color, verdict_color)
+    yield "\n\n            "
+    yield _render_executive_summary(data)
+    yield "\n\n            "
+    yield from _iter_sections(data.sections)
+    yield "\n\n            "
+    yield _render_bottom_line(data.bottom_line)
+    yield "\n\n            "
+    yield _render_sources_grid(sources_sorted)
+    yield "\n\n            "
+    yield _render_feedback_form(data.slug)
+    yield """
+        </article>
+    </main>
+
+    """
+    yield _render_footer()
+    yield "\n\n    "
+    yield _render_share_modal()
+    yield "\n\n    "
+    yield _render_scripts(data, js_mode, js_url)
+    yield """
+</body>
+</html>"""
+
+
+def _render_styles(css_mode: str = "inline", css_url: str = DEFAULT_CSS_URL,
+                   critical_css: bool = False) -> str:
+    """Render the CSS styles - ALL branding lives here.
+
+    "inline" embeds the whole stylesheet. "external" links the hashed
+    stylesheet file; with critical_css, the above-the-fold rules are inlined
+    and the full sheet loads without blocking first paint.
+    """
+    if css_mode == "inline":
+        return "\n    <style>\n" + REPORT_CSS + "    </style>\n    "
+    if css_mode != "external":
+        raise ValueError(f"css_mode must be 'inline' or 'external', not {css_mode!r}")
+
+    href = f"{css_url.rstrip('/')}/{REPORT_CSS_FILENAME}"
+    if not critical_css:
+        return f'<link rel="stylesheet" href="{href}">'
+    return f"""<style>{CRITICAL_CSS}</style>
+    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="{href}"></noscript>"""
+
+
+def _render_navbar() -> str:
+    """Render the navigation bar with GenuVerity branding."""
+    return """
+    <nav class="navbar">
+        <a href="/" class="navbar-brand">
+            <span class="navbar-logo">
+                <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
+            </span>
+            <span class="navbar-badge">COMING SOON</span>
+        </a>
+        <div style="display:flex;gap:12px;">
+            <a href="reports.html" style="color:var(--text-secondary);text-decoration:none;font-size:0.9rem;display:flex;align-items:center;gap:6px;">
+                <i data-lucide="file-text" style="width:16px;height:16px;"></i> Reports
+            </a>
+        </div>
+    </nav>
+    """
+
+
+def _render_mobile_notice() -> str:
+    """Render the mobile notice banner."""
+    return """
+    <div class="mobile-notice" id="mobileNotice">
+        <div style="display:flex;justify-content:space-between;align-items:start;margin-bottom:12px;">
+            <span style="font-weight:600;">Best on Desktop</span>
+            <button onclick="document.getElementById('mobileNotice').classList.add('dismissed')"
+                    style="background:none;border:none;color:var(--text-muted);cursor:pointer;">
+                <i data-lucide="x" style="width:18px;height:18px;"></i>
+            </button>
+        </div>
+        <p style="color:var(--text-secondary);font-size:0.85rem;">
+            This report includes interactive charts and detailed analysis best viewed on a larger screen.
+        </p>
+    </div>
+    """
+
+
+def _trust_tier(score: int) -> str:
+    return "tier1" if score >= 90 else "tier2" if score >= 80 else "tier3"
+
+
+def _render_sources_banner(sources: list) -> str:
+    """Render the collapsible sources banner."""
+    source_chips = "".join(  # Show top 8 in banner
+        f"""
+        <a href="{src.url}" target="_blank" rel="noopener" class="source-chip">
+            <span class="source-score {_trust_tier(src.trust_score)}">{src.trust_score}</span>
+            <div>
+                <div class="source-name">{src.name}</div>
+                <div class="source-domain">{src.domain}</div>
+            </div>
+        </a>
+        """
+        for src in sources[:8]
+    )
+
+    return f"""
+    <div class="sources-banner" id="sourcesBanner">
+        <div class="sources-toggle" onclick="toggleSourcesBanner()">
+            <h3>
+                <i data-lucide="shield-check" style="width:18px;height:18px;"></i>
+                Sources First: {len(sources)} Verified Sources
+            </h3>
+            <i data-lucide="chevron-down" id="sourcesChevron" style="width:18px;height:18px;color:var(--text-muted);"></i>
+        </div>
+        <div class="sources-list">
+            {source_chips}
+        </div>
+    </div>
+    """
+
+
+def _render_header(data: ReportData, tag_bg: str, tag_color: str, verdict_color: Optional[str]) -> str:
+    """Render the report header."""
+    verdict_html = ""
+    if data.verdict:
+        verdict_html = f"""
+        <div class="verdict-badge" style="background: {verdict_color}20; color: {verdict_color};">
+            <i data-lucide="check-circle" style="width:20px;height:20px;"></i>
+            {data.verdict.value}
+        </div>
+        """
+
+    return f"""
+    <header class="report-header">
+        <span class="report-tag" style="background: {tag_bg}; color: {tag_color};">
+            <i data-lucide="tag" style="width:14px;height:14px;"></i>
+            {data.tag_label}
+        </span>
+        <h1 class="report-title">{data.title}</h1>
+        {f'<p class="report-subtitle">{data.subtitle}</p>' if data.subtitle else ''}
+        <div class="report-meta">
+            <span><i data-lucide="calendar" style="width:16px;height:16px;"></i> {data.publish_date.strftime('%B %d, %Y')}</span>
+            <span><i data-lucide="link" style="width:16px;height:16px;"></i> {len(data.sources)} Sources</span>
+            {verdict_html}
+        </div>
+    </header>
+    """
+
+
+def _render_executive_summary(data: ReportData) -> str:
+    """Render the executive summary section."""
+    key_points_html = "\n".join([f"<li>{point}</li>" for point in data.executive_summary.key_points])
+
+    return f"""
+    <section class="exec-summary">
+        <h2>
+            <i data-lucide="clipboard-list" style="width:20px;height:20px;"></i>
+            Executive Summary
+        </h2>
+        <div class="claim-reality-grid">
+            <div class="claim-box">
+                <div class="box-label">The Claim</div>
+                <p style="color:var(--text-primary);">{data.executive_summary.claim}</p>
+            </div>
+            <div class="reality-box">
+                <div class="box-label">The Reality</div>
+                <p style="color:var(--text-primary);">{data.executive_summary.reality}</p>
+            </div>
+        </div>
+        <ul class="key-points">
+            {key_points_html}
+        </ul>
+    </section>
+    """
+
+
+def _iter_sections(sections: list[Section]) -> Iterator[str]:
+    """Render content sections, one chunk per section."""
+    yield '<div class="clearfix">'
+
+    for i, section in enumerate(sections):
+        # Chart if present
+        chart_html = ""
+        if section.chart:
+            float_class = f"float-figure {section.float_position or 'right'}"
+            chart_html = f"""
+            <figure class="{float_class}">
+                <div class="chart-title">{section.chart.title}</div>
+                <canvas id="chart_{i}"></canvas>
+            </figure>
+            """
+
+        # Quote if present
+        quote_html = ""
+        if section.quote:
+            quote_html = f"""
+            <div class="quote-box">
+                <p class="quote-text">"{section.quote.text}"</p>
+                <p class="quote-attribution">— {section.quote.attribution}</p>
+            </div>
+            """
+
+        # Timeline if present
+        timeline_html = ""
+        if section.timeline:
+            events = "".join(
+                f"""
+                <div class="timeline-event {'key' if event.is_key else ''}">
+                    <div class="timeline-date">{event.date}</div>
+                    <div class="timeline-title">{event.title}</div>
+                    <div class="timeline-desc">{event.description}</div>
+                </div>
+                """
+                for event in section.timeline
+            )
+            timeline_html = f'<div class="timeline">{events}</div>'
+
+        yield f"""
+        <h2 class="prose-h2">{section.heading}</h2>
+        {chart_html}
+        <p class="prose-text">{section.content}</p>
+        {quote_html}
+        {timeline_html}
+        """
+
+    yield '</div>'
+
+
+def _render_bottom_line(text: str) -> str:
+    """Render the bottom line section."""
+    return f"""
+    <section class="bottom-line">
+        <h2>
+            <i data-lucide="check-circle" style="width:20px;height:20px;"></i>
+            The Bottom Line
+        </h2>
+        <p>{text}</p>
+    </section>
+    """
+
+
+def _render_sources_grid(sources: list) -> str:
+    """Render the sources grid section."""
+    cards = "".join(
+        f"""
+        <a href="{src.url}" target="_blank" rel="noopener" class="source-card">
+            <div class="source-card-header">
+                <span class="source-card-name">{src.name}</span>
+                <span class="source-score {_trust_tier(src.trust_score)}">{src.trust_score}</span>
+            </div>
+            <div class="source-card-domain">{src.domain}</div>
+        </a>
+        """
+        for src in sources
+    )
+
+    return f"""
+    <section class="sources-section">
+        <h2>
+            <i data-lucide="book-open" style="width:20px;height:20px;color:var(--accent-cyan);"></i>
+            Sources First
+        </h2>
+        <div class="sources-grid">
+            {cards}
+        </div>
+    </section>
+    """
+
+
+def _render_feedback_form(slug: str) -> str:
+    """Render the feedback form."""
+    return f"""
+    <section class="feedback-section">
+        <h2>
+            <i data-lucide="message-square" style="width:20px;height:20px;color:var(--accent-cyan);"></i>
+            Report Feedback
+        </h2>
+        <form class="feedback-form" id="feedbackForm" onsubmit="submitFeedback(event, '{slug}')">
+            <input type="email" class="feedback-input" placeholder="Your email (optional)" id="feedbackEmail">
+            <textarea class="feedback-textarea" placeholder="Found an error? Have additional sources? Let us know..." id="feedbackText" required></textarea>
+            <button type="submit" class="feedback-btn">
+                <i data-lucide="send" style="width:16px;height:16px;"></i>
+                Submit Feedback
+            </button>
+        </form>
+    </section>
+    """
+
+
+def _render_footer() -> str:
+    """Render the footer with GenuVerity branding."""
+    return """
+    <footer class="footer">
+        <div class="footer-brand">
+            <span class="logo-genu">Genu</span><span class="logo-verity">Verity</span>
+        </div>
+        <p>AI-Powered Investigative Journalism</p>
+    </footer>
+    """
+
+
+def _render_share_modal() -> str:
+    """Render the share modal HTML."""
+    return """
+    <div class="share-modal-overlay" id="shareModalOverlay" onclick="closeShareModal(event)">
+        <div class="share-modal" onclick="event.stopPropagation()">
+            <div class="share-modal-header">
+                <h3>Share this content</h3>
+                <button class="share-modal-close" onclick="closeShareModal()">
+                    <i data-lucide="x" style="width:20px;height:20px;"></i>
+                </button>
+            </div>
+            <div class="share-preview">
+                <img id="sharePreviewImg" src="" alt="Preview">
+            </div>
+            <div class="share-actions">
+                <button class="share-btn primary" onclick="downloadShareImage()">
+                    <i data-lucide="download" style="width:18px;height:18px;"></i>
+                    Download Image
+                </button>
+                <button class="share-btn" onclick="copyReportLink()">
+                    <i data-lucide="link" style="width:18px;height:18px;"></i>
+                    Copy Report Link
+                </button>
+                <a class="share-btn" id="shareTwitter" href="#" target="_blank" rel="noopener">
+                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor"><path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"/></svg>
+                    Share on X
+                </a>
+                <a class="share-btn" id="shareLinkedIn" href="#" target="_blank" rel="noopener">
+                    <svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor"><path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/></svg>
+                    Share on LinkedIn
+                </a>
+            </div>
+        </div>
+    </div>
+    """
+
+
+def _render_scripts(data: ReportData, js_mode: str = "inline", js_url: str = DEFAULT_JS_URL) -> str:
+    """Render JavaScript including Chart.js with watermark.
+
+    The only per-report part is a JSON data island of chart configs, keyed
+    by canvas id; REPORT_JS reads it. "inline" embeds REPORT_JS, "external"
+    links the hashed bundle (see write_script).
+    """
+    charts = {}
+    for i, section in enumerate(data.sections):
+        if section.chart:
+            charts[f"chart_{i}"] = {
+                "type": section.chart.chart_type,
+                "data": {
+                    "labels": section.chart.labels,
+                    "datasets": section.chart.datasets
+                },
+                "options": section.chart.options or {}
+            }
 
-def render_to_file(data: ReportData, output_path: str) -> None:
-    """Render report and save to file."""
-    html = render_report(data)
-    with open(output_path, 'w') as f:
-        f.write(html)
+    island = ""
+    if charts:
+        # "</" would end the <script> element early
+        payload = json.dumps(charts, separators=(",", ":")).replace("</", "<\\/")
+        island = f'<script type="application/json" id="reportCharts">{payload}</script>\n    '
+
+    if js_mode == "inline":
+        return f"\n    {island}<script>\n{REPORT_JS}    </script>\n    "
+    if js_mode != "external":
+        raise ValueError(f"js_mode must be 'inline' or 'external', not {js_mode!r}")
+    return f'{island}<script src="{js_url.rstrip("/")}/{REPORT_JS_FILENAME}"></script>'
+
+
+def render_to_file(data: ReportData, output_path: str, css_mode: str = "inline",
+                   css_dir: Path = DEFAULT_CSS_DIR, css_url: str = DEFAULT_CSS_URL,
+                   critical_css: bool = False, js_mode: str = "inline",
+                   js_dir: Path = DEFAULT_JS_DIR, js_url: str = DEFAULT_JS_URL) -> None:
+    """Render report and save to file (writing the shared assets in external modes)."""
+    if css_mode == "external":
+        write_stylesheet(css_dir)
+    if js_mode == "external":
+        write_script(js_dir)
+
+    # Write-then-rename so a page being served is never half written
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.writelines(iter_report(data, css_mode, css_url, critical_css, js_mode, js_url))
+    os.replace(tmp_path, output_path)
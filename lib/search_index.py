@@ -0,0 +1,239 @@
+"""
+Search Index - build-time full-text index over the report catalog.
+
+Built by lib/catalog.py alongside the catalog shards and queried in the
+browser by GVCatalog.search() (js/catalog.js), so search is a few posting
+lookups instead of a substring scan over every report object.
+
+Titles, categories and excerpts are tokenized into an inverted index.
+Weights are BM25 over a weighted bag of fields (BM25F-style: a title hit
+counts FIELD_BOOSTS["title"] times), precomputed per (term, doc) and
+quantized to a byte, so the client only adds them up. Terms are sorted:
+any prefix matches one contiguous run, so the term list doubles as a
+flattened prefix trie (binary search instead of node hopping).
+
+Binary layout (integers are unsigned LEB128 varints):
+
+  "GVSI" version scale            scale = max BM25 weight * 100
+  stopwords: n, then n length-prefixed UTF-8 strings
+  docs:      n, then n length-prefixed slugs (doc id = position)
+  terms:     n, then per term: prefix length shared with the previous
+             term, length-prefixed suffix (front coding)
+  postings:  per term: count, then count x (doc-id delta, weight byte)
+"""
+
+import html
+import math
+import re
+import unicodedata
+
+
+MAGIC = b"GVSI"
+INDEX_VERSION = 1
+
+# BM25 parameters and field boosts
+K1 = 1.2
+B = 0.75
+FIELD_BOOSTS = {"title": 3, "category": 2, "excerpt": 1}
+
+# The last query token also matches as a prefix (while typing) once it is
+# this long; prefix expansions score at a discount
+MIN_PREFIX = 3
+PREFIX_FACTOR = 0.5
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have he her his how in into is it its
+of on or our she so than that the their them there these they this to was were
+what when which who why will with you your
+""".split())
+
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    """Lowercase ASCII-folded alphanumeric tokens, stopwords removed.
+
+    js/catalog.js tokenizes queries the same way; keep the two in step.
+    """
+    folded = _COMBINING.sub("", unicodedata.normalize("NFKD", html.unescape(text or ""))).lower()
+    return [t for t in _TOKEN.findall(folded) if t not in STOPWORDS]
+
+
+def _field_frequencies(report: dict) -> dict:
+    freqs = {}
+    for field, boost in FIELD_BOOSTS.items():
+        for token in tokenize(report.get(field)):
+            freqs[token] = freqs.get(token, 0) + boost
+    return freqs
+
+
+def build_search_index(reports: list) -> dict:
+    """Index reports (dicts with slug/title/category/excerpt) in the given order.
+
+    Returns {"docs", "terms", "postings", "scale"}: postings[i] lists
+    (doc_id, weight 1-255) for terms[i]; weight * scale / 25500 is the BM25 score.
+    """
+    docs = [_field_frequencies(r) for r in reports]
+    lengths = [sum(freqs.values()) for freqs in docs]
+    avg_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+
+    postings = {}
+    for doc_id, freqs in enumerate(docs):
+        for term, tf in freqs.items():
+            postings.setdefault(term, []).append((doc_id, tf))
+
+    total = len(docs)
+    scores = {}
+    for term, entries in postings.items():
+        idf = math.log(1 + (total - len(entries) + 0.5) / (len(entries) + 0.5))
+        scores[term] = [
+            (doc_id, idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * lengths[doc_id] / avg_length)))
+            for doc_id, tf in entries
+        ]
+
+    top = max((s for entries in scores.values() for _, s in entries), default=1.0)
+    terms = sorted(scores)
+    return {
+        "docs": [r["slug"] for r in reports],
+        "terms": terms,
+        "postings": [[(d, max(1, round(s / top * 255))) for d, s in scores[t]] for t in terms],
+        "scale": round(top * 100),
+    }
+
+
+# === BINARY FORMAT ===
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _string(text: str) -> bytes:
+    data = text.encode()
+    return _varint(len(data)) + data
+
+
+def _shared_prefix(a: str, b: str) -> int:
+    n = 0
+    while n < min(len(a), len(b)) and a[n] == b[n]:
+        n += 1
+    return n
+
+
+def encode_index(index: dict) -> bytes:
+    out = bytearray(MAGIC)
+    out += _varint(INDEX_VERSION) + _varint(index["scale"])
+
+    stopwords = sorted(STOPWORDS)
+    out += _varint(len(stopwords)) + b"".join(map(_string, stopwords))
+    out += _varint(len(index["docs"])) + b"".join(map(_string, index["docs"]))
+
+    out += _varint(len(index["terms"]))
+    previous = ""
+    for term in index["terms"]:
+        shared = _shared_prefix(previous, term)
+        out += _varint(shared) + _string(term[shared:])
+        previous = term
+
+    for entries in index["postings"]:
+        out += _varint(len(entries))
+        last = 0
+        for doc_id, weight in entries:
+            out += _varint(doc_id - last) + bytes([weight])
+            last = doc_id
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data, self.pos = data, pos
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def string(self) -> str:
+        length = self.varint()
+        self.pos += length
+        return self.data[self.pos - length:self.pos].decode()
+
+
+def decode_index(data: bytes) -> dict:
+    if data[:4] != MAGIC:
+        raise ValueError("Not a search index")
+    reader = _Reader(data, 4)
+    if reader.varint() != INDEX_VERSION:
+        raise ValueError("Unsupported search index version")
+    scale = reader.varint()
+    stopwords = [reader.string() for _ in range(reader.varint())]
+    docs = [reader.string() for _ in range(reader.varint())]
+
+    terms, previous = [], ""
+    for _ in range(reader.varint()):
+        shared = reader.varint()
+        previous = previous[:shared] + reader.string()
+        terms.append(previous)
+
+    postings = []
+    for _ in terms:
+        entries, doc_id = [], 0
+        for _ in range(reader.varint()):
+            doc_id += reader.varint()
+            entries.append((doc_id, data[reader.pos]))
+            reader.pos += 1
+        postings.append(entries)
+    return {"docs": docs, "terms": terms, "postings": postings, "scale": scale, "stopwords": stopwords}
+
+
+# === QUERY ===
+
+def search(index: dict, query: str, limit: int = 20) -> list:
+    """Reference query (same algorithm as GVCatalog.search): [(slug, score), ...].
+
+    Every query token must match; a doc's score is the sum of its best
+    weight per token.
+    """
+    tokens = tokenize(query)
+    terms = index["terms"]
+
+    scores = None
+    for position, token in enumerate(tokens):
+        low = _lower_bound(terms, token)
+        if position == len(tokens) - 1 and len(token) >= MIN_PREFIX:
+            high = _lower_bound(terms, token + "\uffff")
+        else:
+            high = low + 1 if low < len(terms) and terms[low] == token else low
+
+        matched = {}
+        for term_id in range(low, high):
+            factor = 1.0 if terms[term_id] == token else PREFIX_FACTOR
+            for doc_id, weight in index["postings"][term_id]:
+                matched[doc_id] = max(matched.get(doc_id, 0), weight * factor)
+        scores = matched if scores is None else {d: s + matched[d] for d, s in scores.items() if d in matched}
+        if not scores:
+            return []
+
+    ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(index["docs"][doc_id], round(score * index["scale"] / 25500, 3)) for doc_id, score in ranked]
+
+
+def _lower_bound(terms: list, token: str) -> int:
+    low, high = 0, len(terms)
+    while low < high:
+        mid = (low + high) // 2
+        if terms[mid] < token:
+            low = mid + 1
+        else:
+            high = mid
+    return low
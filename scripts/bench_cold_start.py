@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Cold Start Benchmark for the Vercel function (api/index.py)
+
+Imports api/index.py in fresh interpreters, like a serverless cold start,
+and reports:
+  - wall-clock import time (median of N runs)
+  - the slowest top-level imports from `python -X importtime`
+  - which heavy client libraries are loaded after import and after a
+    first request to a cheap route (they should load only when a route
+    actually needs them)
+
+Usage:
+    python scripts/bench_cold_start.py               # print report
+    python scripts/bench_cold_start.py --runs 10
+    python scripts/bench_cold_start.py --write       # also update docs/perf/cold-start.txt
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+API_DIR = ROOT_DIR / "api"
+ARTIFACT = ROOT_DIR / "docs" / "perf" / "cold-start.txt"
+
+HEAVY_MODULES = ["anthropic", "requests", "aiohttp", "lib.report_renderer", "lib.report_validator"]
+CHEAP_ROUTES = ["/api/health", "/robots.txt", "/api/waitlist/count"]
+
+WALL_SNIPPET = "import time; t = time.perf_counter(); import index; print(time.perf_counter() - t)"
+
+MODULES_SNIPPET = """
+import json, sys
+import index
+loaded = {"import": [m for m in HEAVY if m in sys.modules]}
+from fastapi.testclient import TestClient
+client = TestClient(index.app)
+for route in ROUTES:
+    client.get(route)
+    loaded[route] = [m for m in HEAVY if m in sys.modules]
+print(json.dumps(loaded))
+"""
+
+
+def run(snippet: str, *flags) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", snippet],
+        cwd=API_DIR, capture_output=True, text=True, check=True
+    )
+
+
+def wall_times(runs: int) -> list:
+    run("import index")  # Warm the bytecode cache so runs measure imports, not compilation
+    return [float(run(WALL_SNIPPET).stdout.strip().splitlines()[-1]) for _ in range(runs)]
+
+
+def top_imports(limit: int) -> list:
+    """(cumulative ms, module) for top-level imports made by api/index.py."""
+    stderr = run("import index", "-X", "importtime").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth <= 1:
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def loaded_modules() -> dict:
+    snippet = f"HEAVY = {HEAVY_MODULES!r}\nROUTES = {CHEAP_ROUTES!r}\n" + MODULES_SNIPPET
+    return json.loads(run(snippet).stdout.strip().splitlines()[-1])
+
+
+def build_report(runs: int) -> str:
+    times = wall_times(runs)
+    lines = [
+        f"Cold start profile for api/index.py ({date.today().isoformat()}, Python {sys.version.split()[0]})",
+        "Generated by scripts/bench_cold_start.py --write",
+        "",
+        f"import api/index.py: median {statistics.median(times) * 1000:.0f} ms, "
+        f"min {min(times) * 1000:.0f} ms over {runs} runs",
+        "",
+        "Slowest imports (cumulative ms, from -X importtime):",
+    ]
+    lines += [f"  {ms:8.1f}  {name}" for ms, name in top_imports(12)]
+    lines += ["", "Heavy modules loaded:"]
+    for stage, modules in loaded_modules().items():
+        lines.append(f"  after {stage:<22} {', '.join(modules) or '(none)'}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile api/index.py cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--write", action="store_true", help=f"Write the report to {ARTIFACT.relative_to(ROOT_DIR)}")
+    args = parser.parse_args()
+
+    report = build_report(args.runs)
+    print(report, end="")
+
+    if args.write:
+        ARTIFACT.parent.mkdir(parents=True, exist_ok=True)
+        ARTIFACT.write_text(report)
+        print(f"\nWrote {ARTIFACT.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Email Template Render Benchmark
+
+Measures how long the registered email templates in api/index.py take to
+compile (once, at import) and to render (per request), so regressions in
+the template registry show up as numbers rather than guesses.
+
+Usage:
+    python scripts/bench_email_templates.py              # 20,000 renders per template
+    python scripts/bench_email_templates.py -n 100000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "api"))
+
+import index  # noqa: E402
+
+
+SAMPLE_TAGLINES = [
+    "Truth, sourced.",
+    "Follow the evidence <anywhere>",
+    "Fact-checking you can audit",
+]
+
+SAMPLES = {
+    "waitlist_welcome": {},
+    "waitlist_admin": {
+        "email": "reader@example.com",
+        "usecase": "Checking viral claims <before> sharing",
+        "source": "(not provided)",
+        "timestamp": "2025-12-19T12:00:00",
+        "position": 1234,
+    },
+    "report_request_requester": {
+        "topic": "Are ballot drop boxes tampered with?",
+        "description_html": '<div class="description">Seen on X &amp; Facebook</div>',
+        "email": "reader@example.com",
+        "request_id": "a1b2c3d4e5f6",
+    },
+    "report_request_admin": {
+        "topic": "Are ballot drop boxes tampered with?",
+        "description": "Seen on X & Facebook",
+        "email": "reader@example.com",
+        "request_id": "a1b2c3d4e5f6",
+        "submitted_at": "2025-12-19T12:00:00",
+    },
+    "feedback_admin": {
+        "slug": "cdc-vaccine-autism",
+        "stars": "",
+        "rating": 2,
+        "comment": "Missing the <2024> update",
+        "email": "(anonymous)",
+        "submitted_at": "2025-12-19T12:00:00",
+    },
+    "contact_admin": {
+        "name": "Pat",
+        "email": "pat@example.com",
+        "inquiry_type": "press",
+        "message": "Hello & thanks\nfor the report",
+    },
+    "contact_reply": {"name": "Pat", "inquiry_type": "press"},
+}
+
+
+def bench(fn, iterations: int) -> float:
+    """Seconds per call, best of three runs."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark email template rendering")
+    parser.add_argument("-n", "--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'template':<28} {'compile (us)':>13} {'render (us)':>12} {'renders/s':>12}")
+    print("-" * 68)
+
+    for name, values in SAMPLES.items():
+        source = index._email_templates[name].source
+        compile_time = bench(lambda: index.EmailTemplate(source), max(1, args.iterations // 20))
+        render_time = bench(lambda: index.render_email(name, **values), args.iterations)
+        print(f"{name:<28} {compile_time * 1e6:>13.1f} {render_time * 1e6:>12.2f} {1 / render_time:>12,.0f}")
+
+    tagline_time = bench(lambda: index.render_email(
+        "tagline_thanks",
+        count=len(SAMPLE_TAGLINES),
+        taglines_html=index.render_email_items("tagline_pick", SAMPLE_TAGLINES),
+    ), args.iterations)
+    print(f"{'tagline_thanks (+items)':<28} {'':>13} {tagline_time * 1e6:>12.2f} {1 / tagline_time:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
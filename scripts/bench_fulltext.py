@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Full-Text Search Benchmark
+
+Builds the SQLite FTS5 index (lib/fulltext.py) over localreports/ in a temp
+dir and times:
+  - cold build (every page parsed and indexed)
+  - no-op sync (nothing changed: pages re-hashed, none parsed)
+  - seeded start: what a cold API instance does with the bundled
+    data/search.db (copy to /tmp, open, first query)
+  - queries, first and later result pages, median and p95
+
+--scale N indexes every page N times (as distinct documents) to see how
+query latency grows with the corpus.
+
+Usage:
+    python scripts/bench_fulltext.py
+    python scripts/bench_fulltext.py --scale 10 --runs 50
+    python scripts/bench_fulltext.py --write        # also update docs/perf/fulltext-search.txt
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.catalog import load_catalog, report_key  # noqa: E402
+from lib.fulltext import FullTextIndex, page_document  # noqa: E402
+
+REPORTS_DIR = ROOT_DIR / "localreports"
+ARTIFACT = ROOT_DIR / "docs" / "perf" / "fulltext-search.txt"
+
+QUERIES = ["deepfake", "vaccine autism", "epstein files", "election fraud mail ballots", "tariff",
+           "climate change", "russia disinformation", "trump third ter", "ai generated video", "measles"]
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def percentile(samples: list, p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def build_report(scale: int, runs: int) -> str:
+    catalog = {report_key(r["slug"]): r for r in load_catalog() if r.get("slug")}
+    pages = sorted(REPORTS_DIR.glob("*.html"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = FullTextIndex(Path(tmp) / "search.db")
+        cold, counts = timed(lambda: index.sync_report_files(REPORTS_DIR, catalog))
+        noop, _ = timed(lambda: index.sync_report_files(REPORTS_DIR, catalog))
+
+        index.compact()
+
+        def seeded_start():
+            shutil.copyfile(Path(tmp) / "search.db", Path(tmp) / "seeded.db")
+            seeded = FullTextIndex(Path(tmp) / "seeded.db")
+            seeded.search(QUERIES[0], limit=10)
+            seeded.close()
+        seeded, _ = timed(seeded_start)
+        for name in ("seeded.db", "seeded.db-wal", "seeded.db-shm"):
+            (Path(tmp) / name).unlink(missing_ok=True)
+
+        for copy in range(1, scale):
+            for path in pages:
+                index.upsert(f"copy{copy}:{path.stem}", "copy", page_document(path.read_text(errors="replace")))
+
+        first, later, totals = [], [], []
+        for query in QUERIES:
+            for _ in range(runs):
+                first.append(timed(lambda: index.search(query, limit=10))[0])
+                later.append(timed(lambda: index.search(query, limit=10, offset=20))[0])
+            totals.append(index.search(query, limit=1)["total"])
+        documents = index.count()
+        size = sum(f.stat().st_size for f in Path(tmp).iterdir())
+        index.close()
+
+    ms = 1000
+    lines = [
+        f"Full-text search ({date.today().isoformat()}, Python {sys.version.split()[0]}, {os.cpu_count()} cpu(s))",
+        "Generated by scripts/bench_fulltext.py --write",
+        "",
+        f"corpus: {len(pages)} pages in localreports/ x {scale} = {documents} documents, index {size / 1e6:.1f} MB",
+        f"cold build:        {cold * ms:8.1f} ms  ({counts['indexed']} indexed)",
+        f"no-op sync:        {noop * ms:8.1f} ms  (0 parsed)",
+        f"seeded start:      {seeded * ms:8.1f} ms  (copy bundled db, open, first query)",
+        f"query, page 1:     {statistics.median(first) * ms:8.2f} ms  median, {percentile(first, 0.95) * ms:.2f} ms p95",
+        f"query, page 3:     {statistics.median(later) * ms:8.2f} ms  median, {percentile(later, 0.95) * ms:.2f} ms p95",
+        f"({len(QUERIES)} queries x {runs} runs, 10 per page, with total count and snippets)",
+        "",
+        "query                          matches",
+    ]
+    lines += [f"{query:<30} {total:>7}" for query, total in zip(QUERIES, totals)]
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the FTS5 full-text search index")
+    parser.add_argument("--scale", type=int, default=1, help="Index each page this many times")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query")
+    parser.add_argument("--write", action="store_true", help=f"Write the report to {ARTIFACT.relative_to(ROOT_DIR)}")
+    args = parser.parse_args()
+
+    report = build_report(args.scale, args.runs)
+    print(report, end="")
+
+    if args.write:
+        ARTIFACT.parent.mkdir(parents=True, exist_ok=True)
+        ARTIFACT.write_text(report)
+        print(f"\nWrote {ARTIFACT.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Report Build Benchmark
+
+Times incremental catalog builds with lib/report_build.py over a synthetic
+catalog (the schema example, one JSON file per report, in a temp dir):
+  - full build (empty manifest)
+  - no-op rebuild (nothing changed; median of N runs)
+  - rebuild after one input changes
+
+Usage:
+    python scripts/bench_report_build.py                # 275 reports
+    python scripts/bench_report_build.py --reports 1000 --runs 10
+    python scripts/bench_report_build.py --write        # also update docs/perf/report-build.txt
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.report_build import build_reports  # noqa: E402
+from lib.report_schema import ReportData  # noqa: E402
+
+ARTIFACT = ROOT_DIR / "docs" / "perf" / "report-build.txt"
+
+
+def write_catalog(input_dir: Path, reports: int):
+    example = json.loads(ReportData(**ReportData.model_config["json_schema_extra"]["example"]).model_dump_json())
+    for i in range(reports):
+        (input_dir / f"report-{i:04d}.json").write_text(json.dumps({**example, "slug": f"report-{i:04d}"}))
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def build_report(reports: int, runs: int, jobs: int) -> str:
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir, output_dir = Path(tmp) / "json", Path(tmp) / "html"
+        input_dir.mkdir()
+        write_catalog(input_dir, reports)
+
+        def build():
+            return build_reports(input_dir, output_dir, jobs=jobs)
+
+        full, counts = timed(build)
+        noop = [timed(build)[0] for _ in range(runs)]
+
+        changed = input_dir / "report-0000.json"
+        data = json.loads(changed.read_text())
+        changed.write_text(json.dumps({**data, "title": data["title"] + " (updated)"}))
+        one, one_counts = timed(build)
+
+    return "\n".join([
+        f"Report build timings ({date.today().isoformat()}, Python {sys.version.split()[0]}, "
+        f"{jobs} job(s), {os.cpu_count()} cpu(s))",
+        "Generated by scripts/bench_report_build.py --write",
+        "",
+        f"catalog: {reports} reports (schema example)",
+        f"full build:        {full * 1000:8.1f} ms  ({counts['rendered']} rendered)",
+        f"no-op rebuild:     {statistics.median(noop) * 1000:8.1f} ms  (median of {runs}, 0 rendered)",
+        f"one input changed: {one * 1000:8.1f} ms  ({one_counts['rendered']} rendered)",
+    ]) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental report builds")
+    parser.add_argument("--reports", type=int, default=275)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count())
+    parser.add_argument("--write", action="store_true", help=f"Write the report to {ARTIFACT.relative_to(ROOT_DIR)}")
+    args = parser.parse_args()
+
+    report = build_report(args.reports, args.runs, args.jobs)
+    print(report, end="")
+
+    if args.write:
+        ARTIFACT.parent.mkdir(parents=True, exist_ok=True)
+        ARTIFACT.write_text(report)
+        print(f"\nWrote {ARTIFACT.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
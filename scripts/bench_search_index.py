@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Search Index Benchmark
+
+Measures the catalog search index built by lib/search_index.py:
+  - size of search.<hash>.bin (raw and gzip) next to reports-data.js
+  - client load time: decoding the index in js/catalog.js (Node)
+  - client query latency: GVCatalog.query() vs the old substring scan
+    over REPORTS_DATA, median and p95 over a set of typed queries
+
+Run `python scripts/catalog.py build` first.
+
+Usage:
+    python scripts/bench_search_index.py
+    python scripts/bench_search_index.py --runs 500
+    python scripts/bench_search_index.py --write        # also update docs/perf/search-index.txt
+"""
+
+import argparse
+import gzip
+import json
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.catalog import REPORTS_DATA_JS, SHARD_DIR  # noqa: E402
+from lib.search_index import decode_index  # noqa: E402
+
+ARTIFACT = ROOT_DIR / "docs" / "perf" / "search-index.txt"
+
+# Typed as a user would, including partial last words
+QUERIES = ["deepfake", "trump third term", "immigr", "epstein files", "ai", "vaccine autism",
+           "elon musk doge", "israel iran strikes", "climate", "election fraud mail", "covid orig", "tariff"]
+
+# Times the client code in Node: index decode, then each query `runs` times
+NODE_HARNESS = r"""
+const fs = require('fs');
+const [catalogJs, indexPath, reportsDataJs, queries, runs] = JSON.parse(process.argv[1]);
+eval(fs.readFileSync(catalogJs, 'utf8') + ';global.GVCatalog = GVCatalog;');
+const REPORTS = require(reportsDataJs).filter(r => r.slug && r.title);
+const buf = fs.readFileSync(indexPath);
+const bytes = buf.buffer.slice(buf.byteOffset, buf.byteOffset + buf.length);
+
+function time(fn, n) {
+    const samples = [];
+    for (let i = 0; i < n; i++) {
+        const start = process.hrtime.bigint();
+        fn();
+        samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    return samples.sort((a, b) => a - b);
+}
+const pct = (s, p) => s[Math.min(s.length - 1, Math.floor(s.length * p))];
+
+const decode = time(() => GVCatalog.decodeIndex(bytes), Math.max(10, runs / 10));
+const index = GVCatalog.decodeIndex(bytes);
+const scan = q => REPORTS.filter(r => r.title.toLowerCase().includes(q) ||
+    (r.category || '').toLowerCase().includes(q) || (r.excerpt || '').toLowerCase().includes(q));
+
+const indexed = [], scanned = [], hits = [];
+for (const q of queries) {
+    indexed.push(...time(() => GVCatalog.query(index, q, REPORTS.length), runs));
+    scanned.push(...time(() => scan(q), runs));
+    hits.push([GVCatalog.query(index, q, REPORTS.length).length, scan(q).length]);
+}
+indexed.sort((a, b) => a - b);
+scanned.sort((a, b) => a - b);
+console.log(JSON.stringify({
+    decode: pct(decode, 0.5),
+    indexed: [pct(indexed, 0.5), pct(indexed, 0.95)],
+    scanned: [pct(scanned, 0.5), pct(scanned, 0.95)],
+    hits, node: process.version,
+}));
+"""
+
+
+def size_line(label: str, data: bytes) -> str:
+    return f"{label:<24} {len(data):>9,} B   gzip {len(gzip.compress(data, 9)):>8,} B"
+
+
+def build_report(runs: int) -> str:
+    manifest = json.loads((SHARD_DIR / "manifest.json").read_text())
+    index_path = SHARD_DIR / manifest["search"]
+    index_bytes = index_path.read_bytes()
+    index = decode_index(index_bytes)
+
+    args = [str(ROOT_DIR / "js" / "catalog.js"), str(index_path), str(REPORTS_DATA_JS), QUERIES, runs]
+    result = subprocess.run(["node", "-e", NODE_HARNESS, json.dumps(args)], capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout)
+
+    postings = sum(len(entries) for entries in index["postings"])
+    lines = [
+        f"Search index ({date.today().isoformat()}, Node {timings['node']})",
+        "Generated by scripts/bench_search_index.py --write",
+        "",
+        f"index: {len(index['docs'])} reports, {len(index['terms']):,} terms, {postings:,} postings",
+        size_line(index_path.name, index_bytes),
+        size_line("reports-data.js", REPORTS_DATA_JS.read_bytes()),
+        "",
+        f"client decode:           {timings['decode']:8.3f} ms  (median)",
+        f"indexed query:           {timings['indexed'][0]:8.3f} ms  median, {timings['indexed'][1]:.3f} ms p95",
+        f"substring scan (before): {timings['scanned'][0]:8.3f} ms  median, {timings['scanned'][1]:.3f} ms p95",
+        f"({len(QUERIES)} queries x {runs} runs)",
+        "",
+        "query                      indexed hits  scan hits",
+    ]
+    lines += [f"{q:<26} {indexed:>12}  {scanned:>9}" for q, (indexed, scanned) in zip(QUERIES, timings["hits"])]
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the catalog search index")
+    parser.add_argument("--runs", type=int, default=200, help="Timed runs per query")
+    parser.add_argument("--write", action="store_true", help=f"Write the report to {ARTIFACT.relative_to(ROOT_DIR)}")
+    args = parser.parse_args()
+
+    report = build_report(args.runs)
+    print(report, end="")
+
+    if args.write:
+        ARTIFACT.parent.mkdir(parents=True, exist_ok=True)
+        ARTIFACT.write_text(report)
+        print(f"\nWrote {ARTIFACT.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Build the bundled full-text search database
+
+Indexes the static report pages in localreports/ (with titles, excerpts and
+verdicts from data/reports.json) into data/search.db, the SQLite FTS5
+database that api/index.py ships via vercel.json includeFiles and copies
+to /tmp on a cold start. Only cached fact-checks are left for the API to
+index at runtime.
+
+Incremental: an existing data/search.db is updated in place (only new or
+changed pages are parsed) and replaced atomically. Run by build/build-all.sh.
+
+Usage:
+    python scripts/build_search_db.py
+    python scripts/build_search_db.py --force        # reindex every page
+    python scripts/build_search_db.py --out /tmp/search.db
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.catalog import load_catalog, report_key  # noqa: E402
+from lib.fulltext import FullTextIndex  # noqa: E402
+
+REPORTS_DIR = ROOT_DIR / "localreports"
+SEARCH_DB = ROOT_DIR / "data" / "search.db"
+
+
+def build_search_db(out: Path, force: bool = False) -> dict:
+    catalog = {report_key(r["slug"]): r for r in load_catalog() if r.get("slug")}
+
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    if out.exists() and not force:
+        shutil.copyfile(out, tmp)
+    index = FullTextIndex(tmp)
+    try:
+        counts = index.sync_report_files(REPORTS_DIR, catalog)
+        counts["documents"] = index.count()
+        index.compact()
+    finally:
+        index.close()
+    os.replace(tmp, out)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index localreports/ into the bundled search database")
+    parser.add_argument("--out", type=Path, default=SEARCH_DB, help=f"Database path (default {SEARCH_DB.relative_to(ROOT_DIR)})")
+    parser.add_argument("--force", action="store_true", help="Rebuild from scratch instead of updating")
+    args = parser.parse_args()
+
+    counts = build_search_db(args.out, args.force)
+    print(f"🔎 Search index: {counts['indexed']} indexed, {counts['unchanged']} unchanged, "
+          f"{counts['removed']} removed ({counts['documents']} documents, {args.out.stat().st_size / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Report Catalog
+
+Edits data/reports.json (the list of published reports) with structured
+operations and regenerates what the site loads from it (lib/catalog.py):
+js/reports-data.js, js/catalog/manifest.json and the hashed page/category
+shards. Replaces the old regex rewrites of reports-data.js
+(update_reports_id.py, delete_report.py).
+
+Every edit rebuilds unless --no-build is given.
+
+Usage:
+    python scripts/catalog.py build
+    python scripts/catalog.py check
+    python scripts/catalog.py add report.json                     # JSON object, inserted at the top
+    python scripts/catalog.py update my-report verdict=false readTime="9 min"
+    python scripts/catalog.py update my-report --json '{"chart": {"type": "bar", "data": [1, 2]}}'
+    python scripts/catalog.py remove my-report
+    python scripts/catalog.py move my-report 0
+    python scripts/catalog.py import            # after a tools/*.js script edited reports-data.js
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.catalog import (  # noqa: E402
+    CATALOG_PATH, REPORTS_DATA_JS, SHARD_DIR, CatalogError, add_report, build_catalog, check_catalog,
+    import_reports_data_js, load_catalog, move_report, remove_report, reports_data_js_current,
+    save_catalog, update_report,
+)
+
+
+def parse_changes(args) -> dict:
+    changes = {}
+    for assignment in args.fields:
+        key, sep, value = assignment.partition("=")
+        if not sep:
+            raise CatalogError(f"Expected field=value, got {assignment!r}")
+        changes[key] = value
+    if args.json:
+        changes.update(json.loads(args.json))
+    return changes
+
+
+def build(reports: list):
+    started = time.perf_counter()
+    manifest = build_catalog(reports)
+    manifest_size = (SHARD_DIR / "manifest.json").stat().st_size
+    print(f"{manifest['count']} reports → {len(manifest['pages'])} pages, {len(manifest['categories'])} categories "
+          f"(manifest {manifest_size:,} B, reports-data.js {REPORTS_DATA_JS.stat().st_size:,} B) "
+          f"in {time.perf_counter() - started:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Edit and build the report catalog")
+    parser.add_argument("--no-build", action="store_true", help="Only save data/reports.json")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("build", help="Regenerate reports-data.js and the catalog shards")
+    commands.add_parser("check", help="List incomplete or duplicate entries")
+    commands.add_parser("import", help=f"Replace {CATALOG_PATH.relative_to(ROOT_DIR)} with the contents of reports-data.js")
+
+    add = commands.add_parser("add", help="Add a report from a JSON file ('-' for stdin)")
+    add.add_argument("file")
+    add.add_argument("--position", type=int, default=0)
+
+    update = commands.add_parser("update", help="Set fields on a report")
+    update.add_argument("slug")
+    update.add_argument("fields", nargs="*", help="field=value (string values)")
+    update.add_argument("--json", help="JSON object of fields to set (null removes a field)")
+
+    remove = commands.add_parser("remove", help="Remove a report")
+    remove.add_argument("slug")
+
+    move = commands.add_parser("move", help="Move a report to a position (0 = top)")
+    move.add_argument("slug")
+    move.add_argument("position", type=int)
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "import":
+            reports = import_reports_data_js()
+            save_catalog(reports)
+            print(f"Imported {len(reports)} reports from {REPORTS_DATA_JS.relative_to(ROOT_DIR)}")
+            return
+
+        reports = load_catalog()
+        if args.command == "check":
+            problems = check_catalog(reports)
+            if not reports_data_js_current(reports):
+                problems.append(f"{REPORTS_DATA_JS.relative_to(ROOT_DIR)} differs from the catalog "
+                                "(run `build`, or `import` if a tool edited it)")
+            for problem in problems:
+                print(problem)
+            print(f"{len(reports)} reports, {len(problems)} problem(s)")
+            sys.exit(1 if problems else 0)
+
+        if args.command == "add":
+            source = sys.stdin if args.file == "-" else open(args.file)
+            with source:
+                report = add_report(reports, json.load(source), args.position)
+            print(f"Added {report['slug']} (id {report['id']})")
+        elif args.command == "update":
+            report = update_report(reports, args.slug, parse_changes(args))
+            print(f"Updated {report['slug']}")
+        elif args.command == "remove":
+            report = remove_report(reports, args.slug)
+            print(f"Removed {report['slug']}")
+        elif args.command == "move":
+            move_report(reports, args.slug, args.position)
+            print(f"Moved {args.slug} to position {args.position}")
+
+        if args.command != "build":
+            save_catalog(reports)
+        if args.command == "build" or not args.no_build:
+            build(reports)
+    except (CatalogError, ValueError, OSError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Mail Sink Check
+
+Runs the waitlist signup flow through the API with MAIL_SINK_DIR set, so
+the email queue writes messages to disk instead of calling Resend, and
+checks what lands in the sink:
+  - the welcome email to the new address, rendered from its template
+  - the admin notification, with user input HTML-escaped
+  - a repeat signup for the same address sends nothing new
+
+Uses a throwaway local record store and sink directory. Exits non-zero if
+any check fails.
+
+Usage:
+    python scripts/check_mail_sink.py
+"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+API_DIR = ROOT_DIR / "api"
+
+EMAIL = "sink-check@example.com"
+USECASE = "<b>newsroom</b> research"
+
+
+def load_api(store_dir: str, sink_dir: str):
+    """Import api/index.py with the record store and mail sink in temp dirs."""
+    os.environ["GENUVERITY_LOCAL_STORE"] = store_dir
+    os.environ["MAIL_SINK_DIR"] = sink_dir
+    for name in ("BLOB_READ_WRITE_TOKEN", "RESEND_API_KEY"):
+        os.environ.pop(name, None)
+    sys.path.insert(0, str(API_DIR))
+    return importlib.import_module("index")
+
+
+def sink_messages(sink_dir: str) -> list:
+    return [json.loads(path.read_text()) for path in sorted(Path(sink_dir).glob("*.json"))]
+
+
+def main():
+    from fastapi.testclient import TestClient
+
+    with tempfile.TemporaryDirectory(prefix="genuverity_store_") as store_dir, \
+            tempfile.TemporaryDirectory(prefix="genuverity_mail_") as sink_dir:
+        api = load_api(store_dir, sink_dir)
+        client = TestClient(api.app)
+        problems = []
+
+        response = client.post("/api/waitlist", json={"email": EMAIL, "usecase": USECASE, "source": "check"})
+        if response.status_code != 200 or response.json().get("duplicate"):
+            problems.append(f"signup failed: {response.status_code} {response.text[:200]}")
+        if not api.email_queue.flush(timeout=10):
+            problems.append("email queue did not drain")
+
+        messages = sink_messages(sink_dir)
+        welcome = [m for m in messages if m["to"] == [EMAIL]]
+        admin = [m for m in messages if m["to"] == [api.ADMIN_EMAIL]]
+
+        if len(welcome) != 1:
+            problems.append(f"expected 1 welcome email in the sink, found {len(welcome)}")
+        elif welcome[0]["html"] != api.render_email("waitlist_welcome"):
+            problems.append("welcome email body differs from the rendered template")
+
+        if len(admin) != 1:
+            problems.append(f"expected 1 admin notification in the sink, found {len(admin)}")
+        else:
+            html = admin[0]["html"]
+            if EMAIL not in admin[0]["subject"] or EMAIL not in html:
+                problems.append("admin notification does not name the new address")
+            if "&lt;b&gt;newsroom&lt;/b&gt;" not in html or USECASE in html:
+                problems.append("admin notification does not escape the use case")
+
+        response = client.post("/api/waitlist", json={"email": EMAIL})
+        api.email_queue.flush(timeout=10)
+        if not response.json().get("duplicate"):
+            problems.append("repeat signup was not reported as a duplicate")
+        if len(sink_messages(sink_dir)) != len(messages):
+            problems.append("repeat signup sent more email")
+
+    print(f"{'FAIL' if problems else 'ok  '} waitlist emails reach the mail sink")
+    for problem in problems:
+        print(f"     - {problem}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Waitlist Store Check
+
+Exercises the append-only waitlist store in api/index.py against a
+throwaway local record store (GENUVERITY_LOCAL_STORE, no Blob token):
+  - parallel signups: every signup gets its own slot, none are lost, and
+    the count matches
+  - parallel signups for the same address: exactly one is listed
+  - a store failure while claiming a slot releases the email again, so a
+    retry is not answered with "already on the list"
+
+Exits non-zero if any check fails.
+
+Usage:
+    python scripts/check_waitlist_store.py
+    python scripts/check_waitlist_store.py --signups 500 --workers 32
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+API_DIR = ROOT_DIR / "api"
+
+
+def load_api(store_dir: str):
+    """Import api/index.py with the record store pointed at `store_dir`."""
+    os.environ["GENUVERITY_LOCAL_STORE"] = store_dir
+    os.environ.pop("BLOB_READ_WRITE_TOKEN", None)
+    sys.path.insert(0, str(API_DIR))
+    return importlib.import_module("index")
+
+
+def signup(email: str) -> dict:
+    return {"email": email, "usecase": "", "source": "check", "timestamp": datetime.utcnow().isoformat(), "ip": None}
+
+
+def check_parallel_signups(api, signups: int, workers: int) -> list:
+    emails = [f"user{i}@example.com" for i in range(signups)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        positions = list(pool.map(lambda email: api.add_waitlist_signup(signup(email)), emails))
+
+    problems = []
+    if None in positions:
+        problems.append(f"{positions.count(None)} new addresses were reported as duplicates")
+    if len(set(positions)) != len(positions):
+        problems.append("two signups were given the same position")
+
+    stored = {}
+    for path, record in api.record_iter(api.WAITLIST_SIGNUPS_PREFIX):
+        stored[record["email"]] = record["position"]
+    missing = set(emails) - set(stored)
+    if missing:
+        problems.append(f"{len(missing)} signups have no slot record (e.g. {sorted(missing)[0]})")
+    if sorted(stored.values()) != list(range(1, signups + 1)):
+        problems.append("slot positions are not exactly 1..N")
+    if api.get_waitlist_count() != signups:
+        problems.append(f"count is {api.get_waitlist_count()}, expected {signups}")
+    return problems
+
+
+def check_duplicate_signups(api, workers: int) -> list:
+    before = api.get_waitlist_count()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        positions = list(pool.map(lambda _: api.add_waitlist_signup(signup("same@example.com")), range(workers)))
+
+    listed = [p for p in positions if p is not None]
+    problems = []
+    if len(listed) != 1:
+        problems.append(f"{len(listed)} of {workers} signups for one address were listed, expected 1")
+    if api.get_waitlist_count() != before + 1:
+        problems.append("duplicate signups changed the count by more than one")
+    return problems
+
+
+def check_failed_slot_releases_email(api) -> list:
+    record_create = api.record_create
+
+    def failing_create(path, record):
+        if path.startswith(api.WAITLIST_SIGNUPS_PREFIX):
+            raise api.RecordStoreError("simulated Blob failure")
+        return record_create(path, record)
+
+    api.record_create = failing_create
+    try:
+        api.add_waitlist_signup(signup("retry@example.com"))
+        return ["a failed slot write did not raise RecordStoreError"]
+    except api.RecordStoreError:
+        pass
+    finally:
+        api.record_create = record_create
+
+    if api.add_waitlist_signup(signup("retry@example.com")) is None:
+        return ["retry after a failed slot write was reported as already on the list"]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the waitlist store under concurrent signups")
+    parser.add_argument("--signups", type=int, default=200, help="Distinct parallel signups")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent threads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="genuverity_store_") as store_dir:
+        api = load_api(store_dir)
+        checks = [
+            (f"{args.signups} parallel signups", lambda: check_parallel_signups(api, args.signups, args.workers)),
+            ("parallel duplicate signups", lambda: check_duplicate_signups(api, args.workers)),
+            ("failed slot write releases the email", lambda: check_failed_slot_releases_email(api)),
+        ]
+
+        failed = False
+        for name, check in checks:
+            problems = check()
+            print(f"{'FAIL' if problems else 'ok  '} {name}")
+            for problem in problems:
+                print(f"     - {problem}")
+            failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Report Asset Byte Budget
+
+Compares lib/report_renderer.py output with the stylesheet and script
+inlined (the default) against the externalized, content-hashed assets, and
+extrapolates to the whole report catalog:
+
+  - bytes per report (raw and gzip) in each CSS/JS mode
+  - catalog total = reports x page bytes (+ each shared asset once)
+  - inline <style> bytes currently shipped by localreports/*.html, for reference
+
+Usage:
+    python scripts/measure_report_assets.py
+    python scripts/measure_report_assets.py --reports 300
+"""
+
+import argparse
+import gzip
+import re
+import sys
+import textwrap
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.report_renderer import (  # noqa: E402
+    REPORT_CSS, REPORT_CSS_FILENAME, REPORT_JS, REPORT_JS_FILENAME, render_report
+)
+from lib.report_schema import ReportData  # noqa: E402
+
+LOCALREPORTS_DIR = ROOT_DIR / "localreports"
+STYLE_BLOCK = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+
+
+def sizes(text: str) -> tuple:
+    data = text.encode()
+    return len(data), len(gzip.compress(data, 9))
+
+
+def catalog_inline_styles() -> tuple:
+    """(report count, total bytes, bytes inside <style> blocks) for localreports/."""
+    pages = list(LOCALREPORTS_DIR.glob("*.html"))
+    total = styles = 0
+    for page in pages:
+        html = page.read_text(errors="replace")
+        total += len(html.encode())
+        styles += sum(len(block.encode()) for block in STYLE_BLOCK.findall(html))
+    return len(pages), total, styles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure inline vs external report CSS/JS bytes")
+    parser.add_argument("--reports", type=int, help="Catalog size to extrapolate to (default: localreports count)")
+    args = parser.parse_args()
+
+    page_count, catalog_total, catalog_styles = catalog_inline_styles()
+    reports = args.reports or page_count
+    data = ReportData(**ReportData.model_config["json_schema_extra"]["example"])
+    stylesheet = sizes(textwrap.dedent(REPORT_CSS))
+    script = sizes(textwrap.dedent(REPORT_JS))
+    both = (stylesheet[0] + script[0], stylesheet[1] + script[1])
+
+    modes = {
+        "inline": (sizes(render_report(data)), (0, 0)),
+        "external css": (sizes(render_report(data, css_mode="external")), stylesheet),
+        "external css+crit": (sizes(render_report(data, css_mode="external", critical_css=True)), stylesheet),
+        "external js": (sizes(render_report(data, js_mode="external")), script),
+        "external css+js": (sizes(render_report(data, css_mode="external", js_mode="external")), both),
+    }
+
+    print(f"Stylesheet {REPORT_CSS_FILENAME}: {stylesheet[0]:,} B raw, {stylesheet[1]:,} B gzip")
+    print(f"Script     {REPORT_JS_FILENAME}: {script[0]:,} B raw, {script[1]:,} B gzip")
+    print()
+    print(f"{'mode':<20} {'page raw':>10} {'page gzip':>10} {f'{reports} reports raw':>20} {f'{reports} reports gzip':>20}")
+    print("-" * 84)
+    baseline = None
+    for mode, ((raw, gz), (css_raw, css_gz)) in modes.items():
+        total_raw, total_gz = raw * reports + css_raw, gz * reports + css_gz
+        baseline = baseline or (total_raw, total_gz)
+        saved = f"  (-{1 - total_gz / baseline[1]:.0%} gzip)" if mode != "inline" else ""
+        print(f"{mode:<20} {raw:>10,} {gz:>10,} {total_raw:>20,} {total_gz:>20,}{saved}")
+
+    print()
+    print(f"localreports/: {page_count} pages, {catalog_total:,} B total, "
+          f"{catalog_styles:,} B in inline <style> blocks ({catalog_styles / max(catalog_total, 1):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Precompress Static Artifacts
+
+Writes .gz (and .br, when the `brotli` package is installed) siblings at
+maximum compression for the rendered reports, scripts and stylesheets, so
+server.py (and any static server that supports it) can send them as-is.
+Unchanged files are skipped by content hash (see lib/precompress.py).
+
+Usage:
+    python scripts/precompress.py            # localreports/, js/, css/
+    python scripts/precompress.py --force
+    python scripts/precompress.py localreports/dist
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.precompress import ENCODINGS, MANIFEST_FILENAME, precompress_files  # noqa: E402
+
+DEFAULT_DIRS = ["localreports", "js", "css"]
+EXTENSIONS = {".html", ".js", ".css", ".json", ".bin", ".svg", ".xml", ".txt"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write .gz/.br siblings for static artifacts")
+    parser.add_argument("dirs", nargs="*", default=DEFAULT_DIRS, help="Directories relative to the repo root")
+    parser.add_argument("--force", action="store_true", help="Recompress even if unchanged")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    paths = sorted(
+        path for directory in args.dirs for path in (ROOT_DIR / directory).rglob("*")
+        if path.is_file() and path.suffix in EXTENSIONS and not path.name.startswith(".")
+    )
+    counts = precompress_files(paths, ROOT_DIR / MANIFEST_FILENAME, force=args.force)
+
+    print(f"{len(paths)} files: {counts['compressed']} compressed, {counts['unchanged']} unchanged, "
+          f"{counts['skipped']} too small ({', '.join(enc for enc, _ in ENCODINGS)}) "
+          f"in {time.perf_counter() - started:.2f}s")
+    for encoding, size in counts["bytes_out"].items():
+        print(f"  {encoding:<5} {counts['bytes_in']:>12,} B -> {size:>12,} B ({size / counts['bytes_in']:.1%})")
+    if len(ENCODINGS) == 1:
+        print("  (pip install brotli to also write .br)")
+
+
+if __name__ == "__main__":
+    main()
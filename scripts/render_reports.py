@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Batch Report Renderer
+
+Renders a directory of ReportData JSON files to HTML with
+lib/report_renderer.py, one process per core.
+
+  - every file is validated against the pydantic ReportData schema;
+    invalid files are reported and skipped, the rest still render
+  - pages are written atomically as <out>/<slug>.html; two inputs with
+    the same slug fail the build, and pages of removed inputs are deleted
+  - only stale pages are rebuilt: lib/report_build.py keeps a build
+    manifest (<out>/.build-manifest.json) of each page's input hash,
+    renderer version, asset hashes and render options
+
+Usage:
+    python scripts/render_reports.py reports-json/
+    python scripts/render_reports.py reports-json/ --explain          # say why each report is rebuilt
+    python scripts/render_reports.py reports-json/ --out localreports --css external --js external
+    python scripts/render_reports.py reports-json/ --force --jobs 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from lib.report_build import ReportBuildError, build_reports  # noqa: E402
+from lib.report_renderer import RENDERER_VERSION  # noqa: E402
+
+DEFAULT_OUTPUT_DIR = ROOT_DIR / "localreports"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a directory of report JSON files to HTML")
+    parser.add_argument("input_dir", type=Path, help="Directory of ReportData *.json files")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUTPUT_DIR, help="Output directory (default: localreports/)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if nothing changed")
+    parser.add_argument("--explain", action="store_true", help="Print why each rebuilt report is stale")
+    parser.add_argument("--css", choices=["inline", "external"], default="inline")
+    parser.add_argument("--js", choices=["inline", "external"], default="inline")
+    parser.add_argument("--critical-css", action="store_true", help="Inline above-the-fold CSS (with --css external)")
+    args = parser.parse_args()
+
+    if not args.input_dir.is_dir():
+        parser.error(f"{args.input_dir} is not a directory")
+
+    started = time.perf_counter()
+    options = {"css_mode": args.css, "js_mode": args.js, "critical_css": args.critical_css}
+    try:
+        counts = build_reports(args.input_dir, args.out, options, jobs=args.jobs, force=args.force, explain=args.explain)
+    except ReportBuildError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    elapsed = time.perf_counter() - started
+    print(f"{counts['total']} reports (renderer {RENDERER_VERSION}): {counts['unchanged']} unchanged, "
+          f"rendered {counts['rendered']}, failed {counts['failed']}, removed {counts['removed']} "
+          f"in {elapsed:.2f}s → {args.out}")
+    sys.exit(1 if counts["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,29 @@
 import os
 import json
+import asyncio
 import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from typing import Optional
 from datetime import datetime, date
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 import google.generativeai as genai
 from dotenv import load_dotenv
 import anthropic
 
+from lib.precompress import accepted_encodings, fresh_sibling
+from lib.prompt_assets import PromptAssets, PromptTemplate
+from lib.report_renderer import iter_report
+from lib.report_schema import ReportData
+
 # Load secrets
 load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -21,10 +33,15 @@ CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5-20250929")
 # Cache directory for generated articles
 CACHE_DIR = Path("./article_cache")
 CACHE_DIR.mkdir(exist_ok=True)
+CACHE_INDEX_FILE = Path("./.cache/article_index.sqlite")  # Outside CACHE_DIR: its journal must not touch the dir mtime
 
 # User usage tracking (in production, use Redis or DB)
 USER_USAGE_FILE = Path("./user_usage.json")
 FREE_DAILY_LIMIT = 5
+USAGE_SNAPSHOT_INTERVAL = 5.0  # Seconds between usage snapshots to disk
+
+# Prompt files are re-read when they change on disk (set PROMPT_HOT_RELOAD=0 to read once)
+prompt_assets = PromptAssets(hot_reload=os.getenv("PROMPT_HOT_RELOAD", "1") != "0")
 
 # Localhost IPs bypass rate limiting (for development)
 BYPASS_IPS = {"127.0.0.1", "localhost", "::1"}
@@ -39,8 +56,8 @@ if not ANTHROPIC_API_KEY:
 genai.configure(api_key=GEMINI_API_KEY)
 gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
 
-# Configure Anthropic
-claude_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
+# Configure Anthropic (async client so generation never blocks the event loop)
+claude_client = anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
 
 app = FastAPI()
 
@@ -58,6 +75,7 @@ class GenerateRequest(BaseModel):
 class DeepDiveRequest(BaseModel):
     topic: str
     context: str = ""  # Optional context from parent article
+    stream: bool = False  # Respond with SSE progress events instead of a single JSON body
 
 class CacheCheckRequest(BaseModel):
     topic: str
@@ -69,6 +87,108 @@ def get_topic_key(topic: str) -> str:
     normalized = topic.lower().strip()
     return hashlib.md5(normalized.encode()).hexdigest()[:16]
 
+CACHE_INDEX_VERSION = 3  # Bump when the articles table changes; the index is rebuilt
+
+def index_article(conn: sqlite3.Connection, filename: str, data: dict, mtime: float):
+    """Insert or refresh one article's row in the cache index."""
+    topic = data.get("_topic") or ""
+    conn.execute(
+        "INSERT OR REPLACE INTO articles (filename, article_key, topic, topic_lower, title, cached_at, mtime) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            filename,
+            data.get("key"),
+            topic,
+            topic.lower(),
+            data.get("title"),
+            data.get("_cached_at", ""),
+            mtime
+        )
+    )
+
+def reconcile_cache_index(conn: sqlite3.Connection) -> int:
+    """Bring the index in line with the cache directory. Returns the number of rows changed.
+
+    Files are matched by name and mtime, so articles that arrive outside
+    cache_article (git pull, copied or hand-edited files) are indexed and
+    deleted files are dropped. Only new or modified files are parsed.
+    """
+    on_disk = {
+        entry.name: entry.stat().st_mtime
+        for entry in os.scandir(CACHE_DIR)
+        if entry.name.endswith(".json") and entry.is_file()
+    }
+    indexed = dict(conn.execute("SELECT filename, mtime FROM articles"))
+
+    removed = [name for name in indexed if name not in on_disk]
+    conn.executemany("DELETE FROM articles WHERE filename = ?", [(name,) for name in removed])
+
+    changed = [name for name, mtime in on_disk.items() if indexed.get(name) != mtime]
+    for name in changed:
+        try:
+            with open(CACHE_DIR / name, "r") as f:
+                index_article(conn, name, json.load(f), on_disk[name])
+        except (OSError, ValueError, AttributeError):
+            conn.execute("DELETE FROM articles WHERE filename = ?", (name,))
+    return len(removed) + len(changed)
+
+def cache_dir_stamp() -> str:
+    """The cache directory's mtime. Adding, removing or renaming a file changes it."""
+    return str(CACHE_DIR.stat().st_mtime_ns)
+
+def mark_cache_index_current(conn: sqlite3.Connection, stamp: str):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('dir_stamp', ?)", (stamp,))
+
+@contextmanager
+def open_cache_index(reconcile: bool = True):
+    """Open the article cache index, reconciling it with the cache files if they changed.
+
+    The index maps internal article keys and topics to cache filenames and
+    holds the fields the list endpoint needs, so lookups and listings never
+    parse full articles. It records the cache directory's mtime; an open
+    costs one stat unless files were added, removed or renamed since (git
+    pull, copied files), in which case the directory is re-scanned and only
+    new or changed files are parsed. Edits that rewrite a file in place
+    don't touch the directory mtime: delete the index to force a rebuild.
+    reconcile=False skips the check for writers that update their own row.
+    """
+    CACHE_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_INDEX_FILE, timeout=10)
+    try:
+        current = conn.execute("PRAGMA user_version").fetchone()[0] == CACHE_INDEX_VERSION
+        stamp = cache_dir_stamp()
+        if not current or (reconcile and conn.execute(
+                "SELECT value FROM meta WHERE key = 'dir_stamp'").fetchone() != (stamp,)):
+            # One process at a time builds or reconciles; the others then see it done
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_INDEX_VERSION:
+                conn.execute("DROP TABLE IF EXISTS articles")
+                conn.execute("DROP TABLE IF EXISTS meta")
+                conn.execute("""
+                    CREATE TABLE articles (
+                        filename TEXT PRIMARY KEY,
+                        article_key TEXT,
+                        topic TEXT,
+                        topic_lower TEXT,
+                        title TEXT,
+                        cached_at TEXT,
+                        mtime REAL
+                    )""")
+                conn.execute("CREATE INDEX idx_articles_key ON articles(article_key)")
+                conn.execute("CREATE INDEX idx_articles_topic ON articles(topic_lower)")
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                conn.execute(f"PRAGMA user_version = {CACHE_INDEX_VERSION}")
+            if conn.execute("SELECT value FROM meta WHERE key = 'dir_stamp'").fetchone() != (stamp,):
+                changed = reconcile_cache_index(conn)
+                mark_cache_index_current(conn, stamp)
+                if changed:
+                    print(f"Reconciled article cache index ({changed} files changed)")
+            conn.commit()
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
 def get_cached_article(topic: str) -> Optional[dict]:
     """Check if an article exists in the cache by topic hash OR by internal article key."""
     # First try by topic hash (original behavior)
@@ -81,20 +201,23 @@ def get_cached_article(topic: str) -> Optional[dict]:
         except:
             pass
 
-    # If not found, search all cached articles by internal key
-    for filename in CACHE_DIR.glob("*.json"):
-        try:
-            with open(filename, "r") as f:
-                data = json.load(f)
-                # Check if the internal "key" field matches
-                if data.get("key") == topic:
-                    return data
-                # Also check the topic field
-                if data.get("_topic", "").lower() == topic.lower():
-                    return data
-        except:
-            continue
-    return None
+    # If not found, look the internal "key" / topic up in the index instead of opening every file
+    with open_cache_index() as conn:
+        row = conn.execute(
+            "SELECT filename FROM articles WHERE article_key = ? OR topic_lower = ? LIMIT 1",
+            (topic, topic.lower())
+        ).fetchone()
+    if not row:
+        return None
+
+    try:
+        with open(CACHE_DIR / row[0], "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        # File was removed or is corrupt; drop the stale entry
+        with open_cache_index(reconcile=False) as conn:
+            conn.execute("DELETE FROM articles WHERE filename = ?", (row[0],))
+        return None
 
 def cache_article(topic: str, article_data: dict):
     """Save an article to the cache."""
@@ -102,25 +225,31 @@ def cache_article(topic: str, article_data: dict):
     cache_file = CACHE_DIR / f"{key}.json"
     article_data["_cached_at"] = datetime.now().isoformat()
     article_data["_topic"] = topic
-    with open(cache_file, "w") as f:
-        json.dump(article_data, f)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+    # Index in sync first, so the directory change from our own write doesn't force a re-scan
+    with open_cache_index() as conn:
+        with open(tmp_file, "w") as f:
+            json.dump(article_data, f)
+        os.replace(tmp_file, cache_file)
+        index_article(conn, cache_file.name, article_data, cache_file.stat().st_mtime)
+        mark_cache_index_current(conn, cache_dir_stamp())
 
 def get_all_cached_articles() -> list:
     """Get list of all cached article topics."""
-    articles = []
-    for cache_file in CACHE_DIR.glob("*.json"):
-        try:
-            with open(cache_file, "r") as f:
-                data = json.load(f)
-                articles.append({
-                    "key": data.get("key", cache_file.stem),
-                    "title": data.get("title", "Unknown"),
-                    "topic": data.get("_topic", ""),
-                    "cached_at": data.get("_cached_at", "")
-                })
-        except:
-            continue
-    return articles
+    with open_cache_index() as conn:
+        rows = conn.execute(
+            "SELECT filename, article_key, title, topic, cached_at FROM articles ORDER BY cached_at DESC"
+        ).fetchall()
+    return [
+        {
+            "key": article_key or Path(filename).stem,
+            "title": title or "Unknown",
+            "topic": topic or "",
+            "cached_at": cached_at or ""
+        }
+        for filename, article_key, title, topic, cached_at in rows
+    ]
 
 # === USER USAGE TRACKING ===
 
@@ -131,46 +260,137 @@ def get_user_id(request: Request) -> str:
         return forwarded.split(",")[0].strip()
     return request.client.host if request.client else "unknown"
 
-def load_usage_data() -> dict:
-    """Load user usage data."""
-    if USER_USAGE_FILE.exists():
+class UsageCounter:
+    """Per-user daily counters kept in memory and snapshotted to disk.
+
+    Reads and increments only touch a dict under a lock. The snapshot is
+    written atomically (temp file + rename) in the same
+    {user_id: {"date", "count"}} format as before: by a background flusher
+    every USAGE_SNAPSHOT_INTERVAL seconds while there are unsaved changes,
+    early by an increment that finds one due, and on shutdown. A crash loses
+    at most one interval of counts, even if the process then sat idle.
+    Counts from previous days are dropped at rollover and when loading.
+    """
+
+    def __init__(self, path: Path, snapshot_interval: float):
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._day = date.today().isoformat()
+        self._counts = self._load()
+        self._dirty = False
+        self._last_snapshot = time.monotonic()
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="usage-flush", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.snapshot_interval):
+            self.snapshot()
+
+    def close(self):
+        """Stop the background flusher and write any remaining counts."""
+        self._stop.set()
+        self.snapshot()
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
         try:
-            with open(USER_USAGE_FILE, "r") as f:
-                return json.load(f)
+            with open(self.path, "r") as f:
+                data = json.load(f)
         except:
             return {}
-    return {}
+        return {
+            user_id: entry.get("count", 0)
+            for user_id, entry in data.items()
+            if isinstance(entry, dict) and entry.get("date") == self._day
+        }
 
-def save_usage_data(data: dict):
-    """Save user usage data."""
-    with open(USER_USAGE_FILE, "w") as f:
-        json.dump(data, f)
+    def _rollover(self):
+        today = date.today().isoformat()
+        if today != self._day:
+            self._day = today
+            self._counts = {}
+            self._dirty = True
+
+    def get(self, user_id: str) -> int:
+        with self._lock:
+            self._rollover()
+            return self._counts.get(user_id, 0)
+
+    def increment(self, user_id: str) -> int:
+        return self.reserve(user_id)
+
+    def reserve(self, user_id: str, limit: Optional[int] = None) -> Optional[int]:
+        """Count one use unless the user already has `limit` today. Returns the new count, or None.
+
+        Check and increment happen under one lock, so concurrent requests
+        can't all pass the check before any of them is counted.
+        """
+        with self._lock:
+            self._rollover()
+            count = self._counts.get(user_id, 0)
+            if limit is not None and count >= limit:
+                return None
+            count += 1
+            self._counts[user_id] = count
+            self._dirty = True
+            due = time.monotonic() - self._last_snapshot >= self.snapshot_interval
+        if due:
+            self.snapshot()
+        return count
+
+    def refund(self, user_id: str, day: str):
+        """Give back a use reserved on `day` (a no-op once that day has rolled over)."""
+        with self._lock:
+            self._rollover()
+            if day == self._day and self._counts.get(user_id, 0) > 0:
+                self._counts[user_id] -= 1
+                self._dirty = True
+
+    @property
+    def day(self) -> str:
+        with self._lock:
+            self._rollover()
+            return self._day
+
+    def snapshot(self):
+        """Write the current counts to disk if they changed since the last snapshot."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                day = self._day
+                data = {user_id: {"date": day, "count": count} for user_id, count in self._counts.items()}
+                self._dirty = False
+                self._last_snapshot = time.monotonic()
+
+            tmp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with open(tmp_file, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_file, self.path)
+            except OSError as e:
+                print(f"Failed to snapshot usage data: {e}")
+                with self._lock:
+                    self._dirty = True
+
+usage_counter = UsageCounter(USER_USAGE_FILE, USAGE_SNAPSHOT_INTERVAL)
 
 def get_user_usage_today(user_id: str) -> int:
     """Get how many deep dives a user has generated today."""
-    data = load_usage_data()
-    today = date.today().isoformat()
-
-    if user_id not in data:
-        return 0
-
-    user_data = data[user_id]
-    if user_data.get("date") != today:
-        return 0
-
-    return user_data.get("count", 0)
+    return usage_counter.get(user_id)
 
 def increment_user_usage(user_id: str):
     """Increment user's daily usage count."""
-    data = load_usage_data()
-    today = date.today().isoformat()
-
-    if user_id not in data or data[user_id].get("date") != today:
-        data[user_id] = {"date": today, "count": 1}
-    else:
-        data[user_id]["count"] = data[user_id].get("count", 0) + 1
+    usage_counter.increment(user_id)
 
-    save_usage_data(data)
+def reserve_free_dive(user_id: str, enforce_limit: bool = True) -> Optional[int]:
+    """Count a deep dive up front. Returns the user's remaining dives, or None if none were left."""
+    count = usage_counter.reserve(user_id, FREE_DAILY_LIMIT if enforce_limit else None)
+    return None if count is None else max(0, FREE_DAILY_LIMIT - count)
 
 def get_remaining_free_dives(user_id: str) -> int:
     """Get remaining free deep dives for today."""
@@ -260,26 +480,14 @@ CRITICAL SOURCE VERIFICATION REQUIREMENTS:
 
 Return ONLY the JSON object, no explanations or markdown formatting.
 """
+ARTICLE_PROMPT = PromptTemplate(ARTICLE_TEMPLATE)
 
-@app.post("/api/generate")
-async def generate_report(request: GenerateRequest):
-    """Original Gemini-based report generation"""
-    if not GEMINI_API_KEY:
-        raise HTTPException(status_code=500, detail="Server missing Gemini API Key. Check .env file.")
-
-    print(f"Generating report for: {request.topic}")
-
-    # Read the Golden Template Schema
-    try:
-        with open("docs/essay_schema.md", "r") as f:
-            schema = f.read()
-    except FileNotFoundError:
-        schema = "Structure: { title, content (HTML with prose-h2, float-figure), chartType, sources }"
 
-    prompt = f"""
+# Prompt for the original Gemini endpoint; {schema} is bound to docs/essay_schema.md once
+GENERATE_PROMPT = """
     You are an expert investigative journalist for GenuVerity.
 
-    TASK: Write a biting, data-driven exposé on: "{request.topic}".
+    TASK: Write a biting, data-driven exposé on: "{topic}".
 
     STRICT FORMATTING RULES:
     You must return VALID JSON with the following structure based on this schema:
@@ -296,8 +504,25 @@ async def generate_report(request: GenerateRequest):
     Generate the JSON for a SINGLE report object keyed by a simplified slug (e.g. 'quantum_computing').
     """
 
+ESSAY_SCHEMA_FALLBACK = "Structure: { title, content (HTML with prose-h2, float-figure), chartType, sources }"
+
+@app.post("/api/generate")
+async def generate_report(request: GenerateRequest):
+    """Original Gemini-based report generation"""
+    if not GEMINI_API_KEY:
+        raise HTTPException(status_code=500, detail="Server missing Gemini API Key. Check .env file.")
+
+    print(f"Generating report for: {request.topic}")
+
+    prompt = prompt_assets.template(
+        "generate",
+        GENERATE_PROMPT,
+        files={"schema": "docs/essay_schema.md"},
+        defaults={"schema": ESSAY_SCHEMA_FALLBACK}
+    ).format(topic=request.topic)
+
     try:
-        response = gemini_model.generate_content(prompt)
+        response = await gemini_model.generate_content_async(prompt)
         text = response.text
         # Clean potential markdown fences
         clean_text = text.replace("```json", "").replace("```", "").strip()
@@ -308,6 +533,12 @@ async def generate_report(request: GenerateRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/report-preview")
+async def preview_report(data: ReportData):
+    """Render a ReportData JSON body as a report page, streamed as it's built."""
+    return StreamingResponse(iter_report(data), media_type="text/html; charset=utf-8")
+
+
 @app.post("/api/cache/check")
 async def check_cache(request: CacheCheckRequest):
     """Check if an article is already cached (free to read)."""
@@ -339,55 +570,100 @@ async def get_usage(request: Request):
     }
 
 
-@app.post("/api/deep-dive")
-async def generate_deep_dive(request_body: DeepDiveRequest, request: Request):
-    """Claude-powered deep-dive article generation with caching and rate limiting."""
+# === DEEP-DIVE GENERATION ===
 
-    # First, check if article is already cached
-    cached = get_cached_article(request_body.topic)
-    if cached:
-        print(f"Returning cached article for: {request_body.topic}")
-        cached["_from_cache"] = True
-        return cached
+# Progress stages reported while the article JSON streams in
+DEEP_DIVE_STAGES = [
+    ('"title"', "title", 30, "Drafting article..."),
+    ('"content"', "content", 45, "Writing sections..."),
+    ('"chartConfigs"', "charts", 70, "Building charts..."),
+    ('"citationDatabase"', "citations", 80, "Compiling citations..."),
+    ('"sources"', "sources", 90, "Verifying sources..."),
+]
 
-    # Check user's remaining free dives
-    user_id = get_user_id(request)
-    is_localhost = user_id in BYPASS_IPS
-    remaining = get_remaining_free_dives(user_id)
 
-    # Bypass rate limiting for localhost development
-    if remaining <= 0 and not is_localhost:
-        raise HTTPException(
-            status_code=429,
-            detail={
-                "error": "daily_limit_exceeded",
-                "message": f"You've used all {FREE_DAILY_LIMIT} free deep dives for today. Come back tomorrow!",
-                "remaining": 0
-            }
-        )
+def send_sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
-    if not ANTHROPIC_API_KEY or not claude_client:
-        raise HTTPException(status_code=500, detail="Server missing Anthropic API Key. Check .env file.")
 
-    bypass_msg = " [LOCALHOST BYPASS]" if is_localhost else ""
-    print(f"Generating deep-dive for: {request_body.topic} (User: {user_id}, Remaining: {remaining}){bypass_msg}")
+def parse_article_json(text: str) -> dict:
+    """Strip markdown fences from a model response and parse it."""
+    clean_text = text.strip()
+    if clean_text.startswith("```json"):
+        clean_text = clean_text[7:]
+    if clean_text.startswith("```"):
+        clean_text = clean_text[3:]
+    if clean_text.endswith("```"):
+        clean_text = clean_text[:-3]
+    return json.loads(clean_text.strip())
 
-    # Create topic slug for unique IDs
-    topic_slug = request_body.topic.lower().replace(" ", "_").replace("-", "_")[:20]
 
-    # Build context section if provided
-    context_section = ""
-    if request_body.context:
-        context_section = f"\nCONTEXT FROM PARENT ARTICLE:\n{request_body.context}\n\nBuild upon this context to create a more focused deep-dive.\n"
+class DeepDiveGeneration:
+    """One in-flight deep-dive, shared by every request for the same topic.
 
-    prompt = ARTICLE_TEMPLATE.format(
-        topic=request_body.topic,
-        context_section=context_section,
-        topic_slug=topic_slug
-    )
+    The generation runs as its own task, so a client disconnecting doesn't
+    cancel it for the others. SSE subscribers get events through their own
+    queue; late subscribers first receive the latest progress event.
+    """
+
+    def __init__(self, topic: str, context: str, user_id: str, usage_day: str):
+        self.topic = topic
+        self.context = context
+        self.user_id = user_id
+        self.usage_day = usage_day  # Day the requesting user's quota was charged, for a refund on failure
+        self.listeners: list = []
+        self.last_progress = None
+        self.result = asyncio.get_running_loop().create_future()
+        self.task = None
+
+    def publish(self, event: str, data):
+        if event == "progress":
+            self.last_progress = data
+        for queue in self.listeners:
+            queue.put_nowait((event, data))
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue()
+        if self.last_progress:
+            queue.put_nowait(("progress", self.last_progress))
+        self.listeners.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        if queue in self.listeners:
+            self.listeners.remove(queue)
+
+
+# Topic cache key -> generation currently running for it
+_deep_dives_in_flight: dict = {}
+
+
+async def run_deep_dive(generation: DeepDiveGeneration, key: str):
+    """Stream one article from Claude and cache it. A failure refunds the requesting user's quota."""
+    topic = generation.topic
+    text = ""
 
     try:
-        response = claude_client.messages.create(
+        generation.publish("progress", {"stage": "init", "percent": 5, "message": "Preparing deep dive..."})
+
+        # Create topic slug for unique IDs
+        topic_slug = topic.lower().replace(" ", "_").replace("-", "_")[:20]
+
+        # Build context section if provided
+        context_section = ""
+        if generation.context:
+            context_section = f"\nCONTEXT FROM PARENT ARTICLE:\n{generation.context}\n\nBuild upon this context to create a more focused deep-dive.\n"
+
+        prompt = ARTICLE_PROMPT.format(
+            topic=topic,
+            context_section=context_section,
+            topic_slug=topic_slug
+        )
+
+        generation.publish("progress", {"stage": "connect", "percent": 15, "message": "Researching..."})
+        stages = list(DEEP_DIVE_STAGES)
+
+        async with claude_client.messages.stream(
             model=CLAUDE_MODEL,
             max_tokens=8000,
             messages=[
@@ -396,21 +672,21 @@ async def generate_deep_dive(request_body: DeepDiveRequest, request: Request):
                     "content": prompt
                 }
             ]
-        )
-
-        text = response.content[0].text
+        ) as stream:
+            async for chunk in stream.text_stream:
+                text += chunk
+                while stages and stages[0][0] in text:
+                    _, stage, percent, message = stages.pop(0)
+                    generation.publish("progress", {"stage": stage, "percent": percent, "message": message})
 
-        # Clean potential markdown fences
-        clean_text = text.strip()
-        if clean_text.startswith("```json"):
-            clean_text = clean_text[7:]
-        if clean_text.startswith("```"):
-            clean_text = clean_text[3:]
-        if clean_text.endswith("```"):
-            clean_text = clean_text[:-3]
-        clean_text = clean_text.strip()
+        generation.publish("progress", {"stage": "parsing", "percent": 95, "message": "Finalizing..."})
 
-        data = json.loads(clean_text)
+        try:
+            data = parse_article_json(text)
+        except json.JSONDecodeError as e:
+            print(f"JSON Parse Error: {e}")
+            print(f"Raw response: {text[:500]}...")
+            raise HTTPException(status_code=500, detail=f"Failed to parse AI response as JSON: {str(e)}")
 
         # Ensure required fields exist
         if "key" not in data:
@@ -425,28 +701,150 @@ async def generate_deep_dive(request_body: DeepDiveRequest, request: Request):
             data["sources"] = []
 
         # Cache the article for future users
-        cache_article(request_body.topic, data)
+        await asyncio.to_thread(cache_article, topic, data)
+
+        generation.result.set_result(data)
+        generation.publish("progress", {"stage": "complete", "percent": 100, "message": "Deep dive complete!"})
+        generation.publish("content", data)
+        generation.publish("done", "ok")
+
+    except Exception as e:
+        print(f"Deep-dive Generation Error: {e}")
+        usage_counter.refund(generation.user_id, generation.usage_day)
+        generation.result.set_exception(e)
+        generation.result.exception()  # Mark retrieved; SSE-only waiters never await it
+        generation.publish("error", e.detail if isinstance(e, HTTPException) else str(e))
 
-        # Increment user's usage
-        increment_user_usage(user_id)
+    finally:
+        _deep_dives_in_flight.pop(key, None)
 
-        # Add metadata
-        data["_from_cache"] = False
-        data["_remaining_today"] = remaining - 1
 
-        return data
+@app.post("/api/deep-dive")
+async def generate_deep_dive(request_body: DeepDiveRequest, request: Request):
+    """Claude-powered deep-dive article generation with caching and rate limiting.
+
+    Identical topics already being generated share that generation instead
+    of starting another. With `stream: true` the response is SSE
+    (progress / content / done / error events), like /api/fact-check.
+    """
+
+    # First, check if article is already cached
+    cached = await asyncio.to_thread(get_cached_article, request_body.topic)
+    if cached:
+        print(f"Returning cached article for: {request_body.topic}")
+        cached["_from_cache"] = True
+        if request_body.stream:
+            return StreamingResponse(
+                iter([send_sse("content", cached), send_sse("done", "ok")]),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+        return cached
+
+    user_id = get_user_id(request)
+    key = get_topic_key(request_body.topic)
+    generation = _deep_dives_in_flight.get(key)
+    shared = generation is not None
 
-    except json.JSONDecodeError as e:
-        print(f"JSON Parse Error: {e}")
-        print(f"Raw response: {text[:500]}...")
-        raise HTTPException(status_code=500, detail=f"Failed to parse AI response as JSON: {str(e)}")
+    if shared:
+        print(f"Joining in-flight deep-dive for: {request_body.topic} (User: {user_id})")
+        remaining = get_remaining_free_dives(user_id)
+    else:
+        if not ANTHROPIC_API_KEY or not claude_client:
+            raise HTTPException(status_code=500, detail="Server missing Anthropic API Key. Check .env file.")
+
+        # Reserve one of the user's free dives now, not on completion, so parallel
+        # generations can't all pass the check (requests that join in flight aren't charged).
+        # Localhost is counted but never limited, for development.
+        is_localhost = user_id in BYPASS_IPS
+        usage_day = usage_counter.day
+        remaining = reserve_free_dive(user_id, enforce_limit=not is_localhost)
+
+        if remaining is None:
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "daily_limit_exceeded",
+                    "message": f"You've used all {FREE_DAILY_LIMIT} free deep dives for today. Come back tomorrow!",
+                    "remaining": 0
+                }
+            )
+
+        bypass_msg = " [LOCALHOST BYPASS]" if is_localhost else ""
+        print(f"Generating deep-dive for: {request_body.topic} (User: {user_id}, Remaining: {remaining}){bypass_msg}")
+
+        generation = DeepDiveGeneration(request_body.topic, request_body.context, user_id, usage_day)
+        _deep_dives_in_flight[key] = generation
+        generation.task = asyncio.create_task(run_deep_dive(generation, key))
+
+    if request_body.stream:
+        queue = generation.subscribe()
+
+        async def stream_response():
+            try:
+                while True:
+                    event, data = await queue.get()
+                    if event == "content":
+                        data = {**data, "_from_cache": False, "_remaining_today": remaining, "_shared": shared}
+                    yield send_sse(event, data)
+                    if event in ("done", "error"):
+                        break
+            finally:
+                generation.unsubscribe(queue)
+
+        return StreamingResponse(
+            stream_response(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no"
+            }
+        )
+
+    try:
+        data = await asyncio.shield(generation.result)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Deep-dive Generation Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Add metadata (on a copy; the same article goes to every waiter)
+    return {**data, "_from_cache": False, "_remaining_today": remaining, "_shared": shared}
+
+
+@app.on_event("shutdown")
+def save_usage_snapshot():
+    """Persist usage counts that haven't been snapshotted yet."""
+    usage_counter.close()
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that sends a file's .br/.gz sibling (scripts/precompress.py) when the client accepts it.
+
+    Siblings are gitignored build output; without one (or with one older
+    than its source) the uncompressed file is served as usual.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if not isinstance(response, FileResponse) or response.status_code != 200:
+            return response
+
+        for encoding, suffix in accepted_encodings(Headers(scope=scope).get("accept-encoding", "")):
+            stat_result = fresh_sibling(str(response.path), suffix)
+            if stat_result:
+                return FileResponse(
+                    f"{response.path}{suffix}",
+                    stat_result=stat_result,
+                    media_type=response.media_type,
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"}
+                )
+        return response
+
 
 # Serve static files (Frontend)
-app.mount("/", StaticFiles(directory=".", html=True), name="static")
+app.mount("/", PrecompressedStaticFiles(directory=".", html=True), name="static")
 
 if __name__ == "__main__":
     import uvicorn
@@ -3,159 +3,115 @@
 Data Commons Query Script for GenuVerity Reports
 Direct REST API integration when MCP is unavailable
 
+Thin CLI over lib/datacommons.py: many variables x entities are batched
+into concurrent V2 requests and responses are cached under .cache/datacommons/.
+
 Usage:
     Structured API: python3 tools/dc-query.py "UnemploymentRate_Person" "country/USA"
+    Batch:          python3 tools/dc-query.py -v Count_Person -v Median_Income_Person \\
+                        -e geoId/06 -e geoId/48 --format csv -o states.csv
+    Chart-ready:    python3 tools/dc-query.py -v UnemploymentRate_Person -e country/USA --format columnar
     Natural Language: python3 tools/dc-query.py --nl "What is the unemployment rate in USA?"
 """
 
-import os
-import sys
+import argparse
 import json
+import sys
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.parse import urlencode
-
-# Load API key from .env
-def load_env():
-    env_path = Path(__file__).parent.parent / ".env"
-    env_vars = {}
-    if env_path.exists():
-        for line in env_path.read_text().splitlines():
-            if "=" in line and not line.startswith("#"):
-                key, val = line.split("=", 1)
-                env_vars[key.strip()] = val.strip()
-    return env_vars
-
-def query_datacommons(variable: str, entity: str, api_key: str) -> dict:
-    """Query Data Commons V2 Observation API (Structured)"""
-    if not api_key:
-        return {"error": "API Key required for V2 API"}
-        
-    url = "https://api.datacommons.org/v2/observation"
-    
-    # Data Commons v2 API requires POST with JSON body
-    data = {
-        "select": ["variable", "entity", "value", "date"],
-        "variable": {"dcids": [variable]},
-        "entity": {"dcids": [entity]}
-    }
-    
-    try:
-        req = Request(url, data=json.dumps(data).encode("utf-8"), method="POST")
-        req.add_header("X-API-Key", api_key)
-        req.add_header("Content-Type", "application/json")
-        
-        with urlopen(req) as resp:
-            return json.loads(resp.read().decode())
-    except Exception as e:
-        error_info = {"error": str(e), "url": url}
-        if hasattr(e, 'read'):
-            try:
-                error_body = e.read().decode()
-                error_info["body"] = error_body
-                try:
-                    error_info["json_body"] = json.loads(error_body)
-                except:
-                    pass
-            except:
-                pass
-        return error_info
-
-def query_nl(question: str, api_key: str) -> dict:
-    """Query Data Commons Natural Language API"""
-    if not api_key:
-        return {"error": "API Key required for NL API"}
-        
-    # NL API uses key as query parameter, not header
-    url = f"https://api.datacommons.org/v2/nl?key={api_key}"
-    
-    data = {"query": question}
-    
-    try:
-        req = Request(url, data=json.dumps(data).encode("utf-8"), method="POST")
-        req.add_header("Content-Type", "application/json")
-        
-        with urlopen(req) as resp:
-            return json.loads(resp.read().decode())
-    except Exception as e:
-        error_info = {"error": str(e), "url": url}
-        if hasattr(e, 'read'):
-            try:
-                error_body = e.read().decode()
-                error_info["body"] = error_body
-                try:
-                    error_info["json_body"] = json.loads(error_body)
-                except:
-                    pass
-            except:
-                pass
-        return error_info
-
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python3 dc-query.py <variable> <entity>")
-        print("Example: python3 dc-query.py UnemploymentRate_Person country/USA")
-        sys.exit(1)
-    
-    env = load_env()
-    api_key = env.get("DC_API_KEY")
-    
-    if not api_key:
-        print("Error: DC_API_KEY not found in .env file")
-        sys.exit(1)
-    
-    variable = sys.argv[1]
-    entity = sys.argv[2]
-    
-    print(f"Querying Data Commons (V2 API): {variable} for {entity}...")
-    result = query_datacommons(variable, entity, api_key)
-    
-    # Check for observation data
-    try:
-        obs_list = result["byVariable"][variable]["byEntity"][entity]["orderedFacets"][0]["observations"]
-        latest = obs_list[-1]
-        print(json.dumps(result, indent=2))
-        print(f"\n✅ LATEST OBSERVATION: {latest['value']} ({latest['date']})")
-    except KeyError:
-        print(json.dumps(result, indent=2))
-        print("\n⚠️ No observation data found in response structure")
-
-def main():
-    env = load_env()
-    api_key = env.get("DC_API_KEY")
-    
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.datacommons import (
+    DEFAULT_CACHE_DIR,
+    DataCommonsClient,
+    load_api_key,
+    observation_rows,
+    rows_to_csv,
+    rows_to_columnar,
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Query Data Commons observations for GenuVerity report datasets.",
+        epilog="Examples:\n"
+               "  dc-query.py UnemploymentRate_Person country/USA\n"
+               "  dc-query.py -v Count_Person -e geoId/06 -e geoId/48 --date LATEST --format columnar --index entity\n"
+               "  dc-query.py --nl \"Show me COVID deaths in California\"",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("variable", nargs="?", help="Statistical variable dcid")
+    parser.add_argument("entity", nargs="?", help="Entity dcid (e.g. country/USA)")
+    parser.add_argument("-v", "--var", action="append", default=[], help="Variable dcid (repeatable)")
+    parser.add_argument("-e", "--entity-id", action="append", default=[], help="Entity dcid (repeatable)")
+    parser.add_argument("--entities-file", help="File with one entity dcid per line")
+    parser.add_argument("--date", default="", help="Observation date filter (e.g. LATEST, 2023)")
+    parser.add_argument("--format", choices=["raw", "csv", "columnar"], default="raw")
+    parser.add_argument("--index", choices=["date", "entity"], default="date",
+                        help="Columnar x-axis: dates (time series) or entities (latest value each)")
+    parser.add_argument("-o", "--output", help="Write output to this file instead of stdout")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache")
+    parser.add_argument("--nl", nargs="+", metavar="QUESTION", help="Natural Language query")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    api_key = load_api_key()
     if not api_key:
-        print("Error: DC_API_KEY not found in .env file")
+        print("Error: DC_API_KEY not found in environment or .env file")
         sys.exit(1)
-    
-    # Check for Natural Language mode
-    if len(sys.argv) >= 3 and sys.argv[1] == "--nl":
-        question = " ".join(sys.argv[2:])
-        print(f"🔍 Natural Language Query: \"{question}\"")
-        result = query_nl(question, api_key)
-        print(json.dumps(result, indent=2))
+
+    client = DataCommonsClient(
+        api_key,
+        cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+        max_workers=args.workers,
+    )
+
+    # Natural Language mode
+    if args.nl:
+        question = " ".join(args.nl)
+        print(f"🔍 Natural Language Query: \"{question}\"", file=sys.stderr)
+        print(json.dumps(client.nl_query(question), indent=2))
         return
-    
-    # Structured API mode
-    if len(sys.argv) < 3:
-        print("Usage:")
-        print("  Structured: python3 dc-query.py <variable> <entity>")
-        print("  Natural Language: python3 dc-query.py --nl \"Your question\"")
-        print("\nStructured Examples:")
-        print("  python3 dc-query.py UnemploymentRate_Person country/USA")
-        print("  python3 dc-query.py Count_Person country/USA")
-        print("  python3 dc-query.py Median_Income_Person country/USA")
-        print("\nNatural Language Examples:")
-        print("  python3 dc-query.py --nl \"What is the unemployment rate in USA?\"")
-        print("  python3 dc-query.py --nl \"Show me COVID deaths in California\"")
-        sys.exit(1)
-    
-    variable = sys.argv[1]
-    entity = sys.argv[2]
-    
-    print(f"📊 Structured Query: {variable} for {entity}...")
-    result = query_datacommons(variable, entity, api_key)
-    print(json.dumps(result, indent=2))
+
+    variables = args.var + ([args.variable] if args.variable else [])
+    entities = args.entity_id + ([args.entity] if args.entity else [])
+    if args.entities_file:
+        entities += [line.strip() for line in Path(args.entities_file).read_text().splitlines() if line.strip()]
+
+    if not variables or not entities:
+        parse_args(["--help"])
+
+    print(f"📊 Structured Query: {len(variables)} variable(s) x {len(entities)} entit(ies)...", file=sys.stderr)
+    result = client.observations(variables, entities, date=args.date)
+
+    if args.format == "raw":
+        output = json.dumps(result, indent=2)
+    else:
+        rows = observation_rows(result)
+        if args.format == "csv":
+            output = rows_to_csv(rows)
+        else:
+            output = json.dumps(rows_to_columnar(rows, index=args.index), indent=2)
+
+        if rows:
+            print(f"✅ {len(rows)} observations", file=sys.stderr)
+        else:
+            print("⚠️ No observation data found in response structure", file=sys.stderr)
+
+    for error in result.get("errors", []):
+        print(f"⚠️ Request failed for {error['variables']} x {len(error['entities'])} entities: {error['error']}",
+              file=sys.stderr)
+
+    if args.output:
+        Path(args.output).write_text(output)
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
 
 if __name__ == "__main__":
     main()